@@ -11,7 +11,7 @@ sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 # Import your models and config
 from app.database import Base
 from app.config import settings
-from app.models import user, resume, job, interaction
+from app.models import user, resume, job, interaction, matching
 
 # this is the Alembic Config object
 config = context.config
@@ -0,0 +1,27 @@
+"""composite index for keyset-paginated match feed
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '002'
+down_revision = '001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_job_matches_user_score_id',
+        'job_matches',
+        ['user_id', 'match_score', 'id']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_job_matches_user_score_id', table_name='job_matches')
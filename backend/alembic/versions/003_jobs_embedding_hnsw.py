@@ -0,0 +1,31 @@
+"""partial HNSW index on jobs.embedding
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '003'
+down_revision = '002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Built concurrently so scrapers can keep writing to jobs during the build
+    with op.get_context().autocommit_block():
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_jobs_embedding_hnsw '
+            'ON jobs USING hnsw (embedding vector_cosine_ops) '
+            'WITH (m = 16, ef_construction = 64) '
+            'WHERE is_active = true'
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_jobs_embedding_hnsw')
@@ -0,0 +1,43 @@
+"""state tables for incremental match materialization
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '004'
+down_revision = '003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'user_match_state',
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('resume_id', postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column('resume_version', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('matched_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['resume_id'], ['resumes.id'], ondelete='SET NULL'),
+        sa.PrimaryKeyConstraint('user_id')
+    )
+
+    op.create_table(
+        'pipeline_watermarks',
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('watermark', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.PrimaryKeyConstraint('name')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('pipeline_watermarks')
+    op.drop_table('user_match_state')
@@ -0,0 +1,26 @@
+"""content hash on resumes for upload dedup
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '005'
+down_revision = '004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('resumes', sa.Column('content_hash', sa.String(length=64), nullable=True))
+    op.create_index('ix_resumes_user_id_content_hash', 'resumes', ['user_id', 'content_hash'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_resumes_user_id_content_hash', table_name='resumes')
+    op.drop_column('resumes', 'content_hash')
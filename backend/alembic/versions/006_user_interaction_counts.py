@@ -0,0 +1,41 @@
+"""per-user interaction counters for dashboard stats
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '006'
+down_revision = '005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'user_interaction_counts',
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('interaction_type', sa.String(), nullable=False),
+        sa.Column('count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id', 'interaction_type')
+    )
+
+    # Backfill from existing history
+    op.execute("""
+        INSERT INTO user_interaction_counts (user_id, interaction_type, count)
+        SELECT user_id, interaction_type, count(*)
+        FROM user_job_interactions
+        GROUP BY user_id, interaction_type
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('user_interaction_counts')
@@ -0,0 +1,26 @@
+"""composite index for saved/applied job lists (superseded, now a no-op)
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '007'
+down_revision = '006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # The saved/applied lists moved to user_job_lists (011) and no longer read
+    # user_job_interactions by (user_id, interaction_type, created_at), so this
+    # index is no longer built; 013 drops it where it already exists
+    pass
+
+
+def downgrade() -> None:
+    pass
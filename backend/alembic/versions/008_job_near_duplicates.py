@@ -0,0 +1,62 @@
+"""near-duplicate job detection: alternate sources and persisted MinHash/LSH index
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '008'
+down_revision = '007'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'job_sources',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('job_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('external_job_id', sa.String(), nullable=False),
+        sa.Column('source', sa.String(), nullable=False),
+        sa.Column('application_url', sa.Text(), nullable=True),
+        sa.Column('similarity', sa.Numeric(precision=5, scale=4), nullable=True),
+        sa.Column('first_seen_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.Column('last_seen_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['job_id'], ['jobs.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('external_job_id')
+    )
+    op.create_index(op.f('ix_job_sources_job_id'), 'job_sources', ['job_id'])
+
+    op.create_table(
+        'job_signatures',
+        sa.Column('job_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('signature', sa.LargeBinary(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['job_id'], ['jobs.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('job_id')
+    )
+
+    op.create_table(
+        'job_lsh_buckets',
+        sa.Column('band', sa.SmallInteger(), nullable=False),
+        sa.Column('bucket', sa.BigInteger(), nullable=False),
+        sa.Column('job_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.ForeignKeyConstraint(['job_id'], ['jobs.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('band', 'bucket', 'job_id')
+    )
+    op.create_index(op.f('ix_job_lsh_buckets_job_id'), 'job_lsh_buckets', ['job_id'])
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_job_lsh_buckets_job_id'), table_name='job_lsh_buckets')
+    op.drop_table('job_lsh_buckets')
+    op.drop_table('job_signatures')
+    op.drop_index(op.f('ix_job_sources_job_id'), table_name='job_sources')
+    op.drop_table('job_sources')
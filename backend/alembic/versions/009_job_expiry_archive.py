@@ -0,0 +1,70 @@
+"""job expiry sweeper indexes and jobs_archive
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '009'
+down_revision = '008'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'jobs_archive',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('external_job_id', sa.String(), nullable=False),
+        sa.Column('source', sa.String(), nullable=False),
+        sa.Column('title', sa.String(), nullable=False),
+        sa.Column('company', sa.String(), nullable=False),
+        sa.Column('location', sa.String(), nullable=True),
+        sa.Column('remote_type', sa.String(), nullable=True),
+        sa.Column('employment_type', sa.String(), nullable=True),
+        sa.Column('salary_min', sa.Integer(), nullable=True),
+        sa.Column('salary_max', sa.Integer(), nullable=True),
+        sa.Column('description', sa.Text(), nullable=False),
+        sa.Column('skills_required', postgresql.ARRAY(sa.String()), nullable=True),
+        sa.Column('posted_date', sa.Date(), nullable=True),
+        sa.Column('expires_at', sa.Date(), nullable=True),
+        sa.Column('application_url', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('archived_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_jobs_archive_external_job_id'), 'jobs_archive', ['external_job_id'])
+
+    # Built concurrently so scrapers can keep writing to jobs during the build
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_jobs_active_expires_at', 'jobs', ['expires_at'],
+            postgresql_where=sa.text('is_active = true'),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_jobs_active_undated_posted_date', 'jobs', ['posted_date'],
+            postgresql_where=sa.text('is_active = true AND expires_at IS NULL'),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_jobs_inactive_updated_at', 'jobs', ['updated_at'],
+            postgresql_where=sa.text('is_active = false'),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_jobs_inactive_updated_at', table_name='jobs', postgresql_concurrently=True)
+        op.drop_index('ix_jobs_active_undated_posted_date', table_name='jobs', postgresql_concurrently=True)
+        op.drop_index('ix_jobs_active_expires_at', table_name='jobs', postgresql_concurrently=True)
+    op.drop_index(op.f('ix_jobs_archive_external_job_id'), table_name='jobs_archive')
+    op.drop_table('jobs_archive')
@@ -0,0 +1,67 @@
+"""job search: skills GIN, full-text, location trigram, salary and ordering indexes
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '010'
+down_revision = '009'
+branch_labels = None
+depends_on = None
+
+# Must stay identical to app.models.job.SEARCH_DOCUMENT_SQL
+SEARCH_DOCUMENT_SQL = (
+    "(setweight(to_tsvector('english'::regconfig, title), 'A') || "
+    "setweight(to_tsvector('english'::regconfig, description), 'B'))"
+)
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    # Built concurrently so scrapers can keep writing to jobs during the build
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_jobs_active_skills_required', 'jobs', ['skills_required'],
+            postgresql_using='gin',
+            postgresql_where=sa.text('is_active = true'),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_jobs_search_document', 'jobs', [sa.text(SEARCH_DOCUMENT_SQL)],
+            postgresql_using='gin',
+            postgresql_where=sa.text('is_active = true'),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_jobs_active_location_trgm', 'jobs', ['location'],
+            postgresql_using='gin',
+            postgresql_ops={'location': 'gin_trgm_ops'},
+            postgresql_where=sa.text('is_active = true'),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_jobs_active_salary', 'jobs', ['salary_max', 'salary_min'],
+            postgresql_where=sa.text('is_active = true'),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_jobs_active_posted_date_id', 'jobs', [sa.text('posted_date DESC NULLS LAST'), 'id'],
+            postgresql_where=sa.text('is_active = true'),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_jobs_active_posted_date_id', table_name='jobs', postgresql_concurrently=True)
+        op.drop_index('ix_jobs_active_salary', table_name='jobs', postgresql_concurrently=True)
+        op.drop_index('ix_jobs_active_location_trgm', table_name='jobs', postgresql_concurrently=True)
+        op.drop_index('ix_jobs_search_document', table_name='jobs', postgresql_concurrently=True)
+        op.drop_index('ix_jobs_active_skills_required', table_name='jobs', postgresql_concurrently=True)
@@ -0,0 +1,57 @@
+"""current-state table for saved/applied job lists
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '011'
+down_revision = '010'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'user_job_lists',
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('list_name', sa.String(), nullable=False),
+        sa.Column('job_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('state', sa.String(), nullable=False),
+        sa.Column('changed_at', sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['job_id'], ['jobs.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id', 'list_name', 'job_id')
+    )
+    op.create_index('ix_user_job_lists_job_id', 'user_job_lists', ['job_id'])
+
+    # Backfill: each job's newest saved/unsaved or applied interaction
+    op.execute("""
+        INSERT INTO user_job_lists (user_id, list_name, job_id, state, changed_at)
+        SELECT DISTINCT ON (user_id, list_name, job_id)
+            user_id, list_name, job_id, interaction_type, coalesce(created_at, now())
+        FROM (
+            SELECT user_id, job_id, interaction_type, created_at, id,
+                   CASE WHEN interaction_type = 'applied' THEN 'applied' ELSE 'saved' END AS list_name
+            FROM user_job_interactions
+            WHERE interaction_type IN ('saved', 'unsaved', 'applied')
+        ) i
+        ORDER BY user_id, list_name, job_id, created_at DESC NULLS LAST, id DESC
+    """)
+    op.create_index(
+        'ix_user_job_lists_user_state_changed',
+        'user_job_lists',
+        ['user_id', 'state', 'changed_at', 'job_id']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_user_job_lists_user_state_changed', table_name='user_job_lists')
+    op.drop_index('ix_user_job_lists_job_id', table_name='user_job_lists')
+    op.drop_table('user_job_lists')
@@ -0,0 +1,44 @@
+"""index the salary expressions job search filters on
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '012'
+down_revision = '011'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Built concurrently so scrapers can keep writing to jobs during the build
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_jobs_active_salary_upper', 'jobs', [sa.text('coalesce(salary_max, salary_min)')],
+            postgresql_where=sa.text('is_active = true'),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_jobs_active_salary_lower', 'jobs', [sa.text('coalesce(salary_min, salary_max)')],
+            postgresql_where=sa.text('is_active = true'),
+            postgresql_concurrently=True,
+        )
+        # Plain (salary_max, salary_min) can't serve the coalesce() predicates
+        op.drop_index('ix_jobs_active_salary', table_name='jobs', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_jobs_active_salary', 'jobs', ['salary_max', 'salary_min'],
+            postgresql_where=sa.text('is_active = true'),
+            postgresql_concurrently=True,
+        )
+        op.drop_index('ix_jobs_active_salary_lower', table_name='jobs', postgresql_concurrently=True)
+        op.drop_index('ix_jobs_active_salary_upper', table_name='jobs', postgresql_concurrently=True)
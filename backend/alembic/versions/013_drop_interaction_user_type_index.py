@@ -0,0 +1,26 @@
+"""drop the unused user_job_interactions (user_id, interaction_type, created_at) index
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '013'
+down_revision = '012'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Databases migrated before 007 became a no-op still carry the index and pay for it on every insert
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_user_job_interactions_user_type_created')
+
+
+def downgrade() -> None:
+    # 007 no longer creates it, so there is nothing to restore
+    pass
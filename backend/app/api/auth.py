@@ -1,8 +1,8 @@
 from datetime import timedelta
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..database import get_db
+from ..database import get_async_db
 from ..models.user import User
 from ..schemas.user import UserCreate, UserLogin, UserResponse, Token
 from ..services.auth_service import (
@@ -12,24 +12,28 @@ from ..services.auth_service import (
     get_user_by_email,
     get_current_user
 )
+from ..services.user_cache import UserPrincipal
 from ..config import settings
 
 router = APIRouter(prefix="/api/auth", tags=["authentication"])
 
 
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-def register(user_data: UserCreate, db: Session = Depends(get_db)):
+async def register(user_data: UserCreate, db: AsyncSession = Depends(get_async_db)):
     """Register a new user"""
     # Check if user already exists
-    existing_user = get_user_by_email(db, user_data.email)
+    existing_user = await get_user_by_email(db, user_data.email)
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered"
         )
 
+    # Return the connection to the pool while bcrypt runs; the session reconnects to insert
+    await db.close()
+
     # Create new user
-    hashed_password = hash_password(user_data.password)
+    hashed_password = await hash_password(user_data.password)
     new_user = User(
         email=user_data.email,
         password_hash=hashed_password,
@@ -37,16 +41,16 @@ def register(user_data: UserCreate, db: Session = Depends(get_db)):
     )
 
     db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    await db.commit()
+    await db.refresh(new_user)
 
     return new_user
 
 
 @router.post("/login", response_model=Token)
-def login(user_data: UserLogin, db: Session = Depends(get_db)):
+async def login(user_data: UserLogin, db: AsyncSession = Depends(get_async_db)):
     """Login and get access token"""
-    user = authenticate_user(db, user_data.email, user_data.password)
+    user = await authenticate_user(db, user_data.email, user_data.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -64,6 +68,6 @@ def login(user_data: UserLogin, db: Session = Depends(get_db)):
 
 
 @router.get("/me", response_model=UserResponse)
-async def get_me(current_user: User = Depends(get_current_user)):
+async def get_me(current_user: UserPrincipal = Depends(get_current_user)):
     """Get current user info"""
     return current_user
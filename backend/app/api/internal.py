@@ -0,0 +1,88 @@
+import hmac
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
+from pydantic import ValidationError
+from sqlalchemy.orm import Session
+
+from ..config import settings
+from ..database import get_db
+from ..schemas.job import JobCreate
+from ..services.job_ingestion import JobIngester
+
+router = APIRouter(prefix="/api/internal", tags=["internal"])
+
+# Validation errors echoed back per request
+MAX_REPORTED_ERRORS = 20
+
+# Longest NDJSON line accepted; a posting is a few KB, so longer lines are malformed bodies
+MAX_LINE_BYTES = 1024 * 1024
+
+
+def require_internal_token(x_internal_token: Optional[str] = Header(None)) -> None:
+    """Allow only callers presenting INTERNAL_API_TOKEN"""
+    if not settings.INTERNAL_API_TOKEN or not x_internal_token or not hmac.compare_digest(
+        x_internal_token, settings.INTERNAL_API_TOKEN
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not allowed"
+        )
+
+
+@router.post("/jobs/ingest", dependencies=[Depends(require_internal_token)])
+async def ingest_jobs(request: Request, db: Session = Depends(get_db)):
+    """Bulk upsert job postings
+
+    The body is NDJSON, one `JobCreate` per line, and is processed as it streams
+    in. Invalid lines are skipped and reported; valid ones are committed batch
+    by batch. A line longer than MAX_LINE_BYTES ends the request with 413;
+    postings before it are still committed and counted in the error detail.
+    """
+    ingester = JobIngester(db)
+    batch = []
+    rejected = 0
+    errors = []
+    line_number = 0
+    remainder = b""
+
+    async def parse(lines):
+        nonlocal batch, rejected, line_number
+        for line in lines:
+            line_number += 1
+            if not line.strip():
+                continue
+            try:
+                batch.append(JobCreate.model_validate_json(line))
+            except ValidationError as exc:
+                rejected += 1
+                if len(errors) < MAX_REPORTED_ERRORS:
+                    errors.append({"line": line_number, "errors": exc.errors(include_url=False)})
+        if len(batch) >= ingester.batch_size:
+            await run_in_threadpool(ingester.add_many, batch)
+            batch = []
+
+    async def finish():
+        await run_in_threadpool(ingester.add_many, batch)
+        await run_in_threadpool(ingester.flush)
+        return {**ingester.stats(), "rejected": rejected, "errors": errors}
+
+    async for chunk in request.stream():
+        *lines, remainder = (remainder + chunk).split(b"\n")
+        too_long = next((i for i, line in enumerate(lines) if len(line) > MAX_LINE_BYTES), None)
+        if too_long is None and len(remainder) > MAX_LINE_BYTES:
+            too_long = len(lines)
+        if too_long is not None:
+            await parse(lines[:too_long])
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail={
+                    "message": f"Line {line_number + 1} is longer than {MAX_LINE_BYTES} bytes",
+                    **await finish(),
+                },
+            )
+        await parse(lines)
+    await parse([remainder])
+
+    return await finish()
@@ -1,133 +1,242 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from datetime import date
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from pydantic import TypeAdapter
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 from uuid import UUID
 
-from ..database import get_db
-from ..models.user import User
-from ..models.job import Job, JobMatch
-from ..models.interaction import UserJobInteraction
-from ..schemas.job import JobResponse, JobMatchResponse
+from ..database import get_async_db
+from ..models.job import Job
+from ..schemas.job import JobResponse, JobMatchResponse, JobSearchResponse
 from ..services.auth_service import get_current_user
+from ..services.user_cache import UserPrincipal
+from ..services.match_feed import get_match_feed, get_matched_at, InvalidCursorError
+from ..services.interaction_buffer import interaction_buffer
+from ..services.job_lists import get_job_list
+from ..services.job_search import JobSearchFilters, search_jobs
+from ..services.response_cache import (
+    CACHE_CONTROL, CachedResponse, job_key, make_etag, not_modified, respond, response_cache
+)
 
 router = APIRouter(prefix="/api/jobs", tags=["jobs"])
 
+_match_page_adapter = TypeAdapter(List[JobMatchResponse])
+
 
 @router.get("/", response_model=List[JobMatchResponse])
 async def get_matched_jobs(
-    page: int = Query(1, ge=1),
+    request: Request,
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(20, ge=1, le=100),
+    current_user: UserPrincipal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get matched jobs for the current user
+
+    Pass the `X-Next-Cursor` response header back as `cursor` to fetch the next page.
+    Pages carry an ETag that changes when the user's matches are recomputed; send it
+    back as `If-None-Match` to get a 304 instead of the page. `X-Matches-Updated-At`
+    is when the matches were last computed (absent if they never have been).
+    """
+    # Pages only change when the pipeline bumps the match version (or a job expires overnight)
+    version = await response_cache.match_version(current_user.id)
+    key = None
+    if version is not None:
+        etag = make_etag("feed", current_user.id, version, date.today(), limit, cursor)
+        if not_modified(request, etag):
+            return Response(status_code=304, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL})
+        key = f"response:feed:{current_user.id}:{version}:{date.today()}:{limit}:{cursor or ''}"
+        cached = await response_cache.get(key)
+        if cached is not None:
+            return respond(request, cached)
+
+    try:
+        matches, next_cursor = await get_match_feed(db, current_user.id, limit=limit, cursor=cursor)
+    except InvalidCursorError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+    page = _match_page_adapter.validate_python([
+        {
+            "job": match.job,
+            "match_score": match.match_score,
+            "match_reasons": match.match_reasons
+        }
+        for match in matches
+    ], from_attributes=True)
+    body = _match_page_adapter.dump_json(page)
+    # Every recompute bumps the match version, so a cached page's timestamp stays current
+    matched_at = await get_matched_at(db, current_user.id)
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor else {}
+    if matched_at is not None:
+        headers["X-Matches-Updated-At"] = matched_at.isoformat()
+    entry = CachedResponse(
+        etag=etag if version is not None else make_etag("feed", body, matched_at),
+        body=body,
+        headers=headers,
+    )
+    if key is not None:
+        await response_cache.set(key, entry)
+    return respond(request, entry)
+
+
+@router.get("/search", response_model=JobSearchResponse)
+async def search(
+    q: Optional[str] = Query(None, max_length=200),
+    skills: List[str] = Query([]),
+    skills_match: str = Query("all", regex="^(all|any)$"),
+    location: Optional[str] = Query(None, max_length=100),
+    remote_type: List[str] = Query([]),
+    employment_type: List[str] = Query([]),
+    salary_min: Optional[int] = Query(None, ge=0),
+    salary_max: Optional[int] = Query(None, ge=0),
     limit: int = Query(20, ge=1, le=100),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    offset: int = Query(0, ge=0, le=1000),
+    current_user: UserPrincipal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Get matched jobs for the current user"""
-    offset = (page - 1) * limit
-
-    # Get job matches
-    matches = db.query(JobMatch).filter(
-        JobMatch.user_id == current_user.id
-    ).order_by(
-        JobMatch.match_score.desc()
-    ).offset(offset).limit(limit).all()
-
-    # Load jobs
-    results = []
-    for match in matches:
-        job = db.query(Job).filter(Job.id == match.job_id).first()
-        if job:
-            results.append({
-                "job": job,
-                "match_score": match.match_score,
-                "match_reasons": match.match_reasons
-            })
-
-    return results
+    """Search active jobs, with facet counts for skills, location, remote/employment type and salary
+
+    Repeat `skills`, `remote_type` and `employment_type` to filter on several values.
+    """
+    filters = JobSearchFilters(
+        q=q,
+        skills=skills,
+        match_all_skills=skills_match == "all",
+        location=location,
+        remote_types=remote_type,
+        employment_types=employment_type,
+        salary_min=salary_min,
+        salary_max=salary_max,
+    )
+    result = await search_jobs(db, filters, limit=limit, offset=offset)
+    return {
+        "total": result.total,
+        "total_exact": result.total_exact,
+        "results": result.jobs,
+        "facets": result.facets,
+    }
 
 
 @router.get("/{job_id}", response_model=JobResponse)
 async def get_job(
     job_id: UUID,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    request: Request,
+    current_user: UserPrincipal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Get job details"""
-    job = db.query(Job).filter(Job.id == job_id, Job.is_active == True).first()
-
-    if not job:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Job not found"
+    """Get job details
+
+    Send the ETag back as `If-None-Match` to get a 304 instead of the job.
+    """
+    entry = await response_cache.get(job_key(job_id))
+    if entry is None:
+        job = (await db.execute(
+            select(Job).where(Job.id == job_id, Job.is_active == True)
+        )).scalar_one_or_none()
+
+        if not job:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Job not found"
+            )
+
+        entry = CachedResponse(
+            etag=make_etag("job", job.id, job.updated_at or job.created_at),
+            body=JobResponse.model_validate(job).model_dump_json().encode(),
         )
+        await response_cache.set(job_key(job_id), entry)
 
-    # Track view interaction
-    interaction = UserJobInteraction(
-        user_id=current_user.id,
-        job_id=job_id,
-        interaction_type="viewed"
-    )
-    db.add(interaction)
-    db.commit()
+    # Track view interaction (written in the background with other events)
+    interaction_buffer.enqueue(current_user.id, job_id, "viewed")
 
-    return job
+    return respond(request, entry)
 
 
 @router.post("/{job_id}/interact", status_code=status.HTTP_201_CREATED)
 async def interact_with_job(
     job_id: UUID,
-    interaction_type: str = Query(..., regex="^(liked|disliked|saved|applied|dismissed)$"),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    interaction_type: str = Query(..., regex="^(liked|disliked|saved|unsaved|applied|dismissed)$"),
+    current_user: UserPrincipal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Record user interaction with a job"""
-    job = db.query(Job).filter(Job.id == job_id).first()
+    job = await db.get(Job, job_id)
     if not job:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Job not found"
         )
 
-    # Create interaction
-    interaction = UserJobInteraction(
-        user_id=current_user.id,
-        job_id=job_id,
-        interaction_type=interaction_type
-    )
-
-    db.add(interaction)
-    db.commit()
+    # Release the connection before waiting on the shared batch commit
+    await db.close()
+    try:
+        await interaction_buffer.submit(current_user.id, job_id, interaction_type)
+    except IntegrityError:
+        # The job was deleted while the event was queued
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found"
+        )
 
     return {"message": f"Interaction '{interaction_type}' recorded"}
 
 
 @router.get("/saved/list", response_model=List[JobResponse])
 async def get_saved_jobs(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    response: Response,
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(20, ge=1, le=100),
+    current_user: UserPrincipal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Get user's saved jobs"""
-    saved_interactions = db.query(UserJobInteraction).filter(
-        UserJobInteraction.user_id == current_user.id,
-        UserJobInteraction.interaction_type == "saved"
-    ).all()
+    """Get user's saved jobs, most recently saved first
 
-    job_ids = [i.job_id for i in saved_interactions]
-    jobs = db.query(Job).filter(Job.id.in_(job_ids), Job.is_active == True).all()
-
-    return jobs
+    Pass the `X-Next-Cursor` response header back as `cursor` to fetch the next page.
+    """
+    return await _job_list_page(db, response, current_user.id, "saved", limit, cursor, active_only=True)
 
 
 @router.get("/applied/list", response_model=List[JobResponse])
 async def get_applied_jobs(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    response: Response,
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(20, ge=1, le=100),
+    current_user: UserPrincipal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Get jobs user has applied to"""
-    applied_interactions = db.query(UserJobInteraction).filter(
-        UserJobInteraction.user_id == current_user.id,
-        UserJobInteraction.interaction_type == "applied"
-    ).all()
-
-    job_ids = [i.job_id for i in applied_interactions]
-    jobs = db.query(Job).filter(Job.id.in_(job_ids)).all()
+    """Get jobs user has applied to, most recent first
+
+    Pass the `X-Next-Cursor` response header back as `cursor` to fetch the next page.
+    """
+    return await _job_list_page(db, response, current_user.id, "applied", limit, cursor)
+
+
+async def _job_list_page(
+    db: AsyncSession,
+    response: Response,
+    user_id: UUID,
+    list_name: str,
+    limit: int,
+    cursor: Optional[str],
+    active_only: bool = False
+) -> List[Job]:
+    """Fetch one page of a saved/applied list and set its next-page cursor header"""
+    try:
+        jobs, next_cursor = await get_job_list(
+            db, user_id, list_name, limit=limit, cursor=cursor, active_only=active_only
+        )
+    except InvalidCursorError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
 
     return jobs
@@ -1,14 +1,19 @@
 from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 from uuid import UUID
 import os
 
-from ..database import get_db
-from ..models.user import User
+from ..database import get_async_db
 from ..models.resume import Resume
 from ..schemas.resume import ResumeResponse, ResumeUpdate
 from ..services.auth_service import get_current_user
+from ..services.user_cache import UserPrincipal
+from ..services.rematch_queue import rematch_queue
+from ..services.resume_pipeline import resume_pipeline
+from ..services.upload_service import UploadTooLargeError, stream_to_temp_file
 from ..config import settings
 
 router = APIRouter(prefix="/api/resumes", tags=["resumes"])
@@ -17,8 +22,8 @@ router = APIRouter(prefix="/api/resumes", tags=["resumes"])
 @router.post("/upload", response_model=ResumeResponse, status_code=status.HTTP_201_CREATED)
 async def upload_resume(
     file: UploadFile = File(...),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: UserPrincipal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Upload a resume file"""
     # Validate file extension
@@ -29,57 +34,73 @@ async def upload_resume(
             detail=f"File type not allowed. Allowed types: {settings.ALLOWED_EXTENSIONS}"
         )
 
-    # Check file size
-    content = await file.read()
-    if len(content) > settings.MAX_UPLOAD_SIZE:
+    # Stream to a temp file in chunks, hashing as we go, so memory stays constant
+    try:
+        upload = await stream_to_temp_file(file, settings.UPLOAD_DIR, settings.MAX_UPLOAD_SIZE)
+    except UploadTooLargeError:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"File size exceeds maximum allowed size of {settings.MAX_UPLOAD_SIZE} bytes"
         )
 
-    # Save file
-    os.makedirs(settings.UPLOAD_DIR, exist_ok=True)
-    file_path = os.path.join(settings.UPLOAD_DIR, f"{current_user.id}_{file.filename}")
-
-    with open(file_path, "wb") as f:
-        f.write(content)
+    # Re-uploading an identical file returns the existing resume
+    existing = (await db.execute(
+        select(Resume).where(
+            Resume.user_id == current_user.id,
+            Resume.content_hash == upload.sha256
+        )
+    )).scalars().first()
+    if existing:
+        await upload.discard()
+        return existing
+
+    filename = os.path.basename(file.filename)
+    file_path = await upload.commit(
+        os.path.join(settings.UPLOAD_DIR, f"{current_user.id}_{upload.sha256[:16]}_{filename}")
+    )
 
     # Create resume record
     new_resume = Resume(
         user_id=current_user.id,
-        file_path=file_path
+        file_path=file_path,
+        content_hash=upload.sha256
     )
 
     db.add(new_resume)
-    db.commit()
-    db.refresh(new_resume)
+    await db.commit()
+    await db.refresh(new_resume)
 
-    # TODO: Trigger async parsing task here
+    # Parse in the background; the response returns before parsing finishes
+    resume_pipeline.schedule(new_resume.id)
 
     return new_resume
 
 
 @router.get("/", response_model=List[ResumeResponse])
 async def list_resumes(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: UserPrincipal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """List user's resumes"""
-    resumes = db.query(Resume).filter(Resume.user_id == current_user.id).all()
+    resumes = (await db.execute(
+        select(Resume).where(Resume.user_id == current_user.id)
+    )).scalars().all()
     return resumes
 
 
 @router.get("/{resume_id}", response_model=ResumeResponse)
 async def get_resume(
     resume_id: UUID,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: UserPrincipal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get a specific resume"""
-    resume = db.query(Resume).filter(
-        Resume.id == resume_id,
-        Resume.user_id == current_user.id
-    ).first()
+    resume = (await db.execute(
+        select(Resume).where(
+            Resume.id == resume_id,
+            Resume.user_id == current_user.id
+        )
+    )).scalar_one_or_none()
 
     if not resume:
         raise HTTPException(
@@ -94,14 +115,16 @@ async def get_resume(
 async def update_resume_skills(
     resume_id: UUID,
     update_data: ResumeUpdate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: UserPrincipal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Update resume skills"""
-    resume = db.query(Resume).filter(
-        Resume.id == resume_id,
-        Resume.user_id == current_user.id
-    ).first()
+    resume = (await db.execute(
+        select(Resume).where(
+            Resume.id == resume_id,
+            Resume.user_id == current_user.id
+        )
+    )).scalar_one_or_none()
 
     if not resume:
         raise HTTPException(
@@ -112,8 +135,12 @@ async def update_resume_skills(
     if update_data.skills is not None:
         resume.skills = update_data.skills
 
-    db.commit()
-    db.refresh(resume)
+    await db.commit()
+    await db.refresh(resume)
+
+    if update_data.skills is not None:
+        # Debounced: a run of edits becomes one re-match once the user stops editing
+        await run_in_threadpool(rematch_queue.mark_dirty, [current_user.id])
 
     return resume
 
@@ -121,14 +148,16 @@ async def update_resume_skills(
 @router.delete("/{resume_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_resume(
     resume_id: UUID,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: UserPrincipal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Delete a resume"""
-    resume = db.query(Resume).filter(
-        Resume.id == resume_id,
-        Resume.user_id == current_user.id
-    ).first()
+    resume = (await db.execute(
+        select(Resume).where(
+            Resume.id == resume_id,
+            Resume.user_id == current_user.id
+        )
+    )).scalar_one_or_none()
 
     if not resume:
         raise HTTPException(
@@ -140,7 +169,10 @@ async def delete_resume(
     if os.path.exists(resume.file_path):
         os.remove(resume.file_path)
 
-    db.delete(resume)
-    db.commit()
+    await db.delete(resume)
+    await db.commit()
+
+    # Matches were computed from this resume; re-match from the next latest one (or clear them)
+    await run_in_threadpool(rematch_queue.mark_dirty, [current_user.id])
 
     return None
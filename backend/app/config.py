@@ -12,6 +12,10 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str
+    DB_POOL_SIZE: int = 10  # persistent connections per engine, per worker process
+    DB_MAX_OVERFLOW: int = 20  # extra connections allowed under burst load
+    DB_POOL_TIMEOUT: int = 10  # seconds to wait for a free connection before erroring
+    DB_POOL_RECYCLE: int = 1800  # seconds before a connection is replaced
 
     # Redis
     REDIS_URL: str
@@ -20,6 +24,21 @@ class Settings(BaseSettings):
     SECRET_KEY: str
     JWT_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    PASSWORD_BCRYPT_ROUNDS: int = 12  # cost factor for new hashes; existing hashes keep theirs
+    PASSWORD_HASH_WORKERS: int = 2  # threads hashing concurrently, per API process
+    PASSWORD_HASH_MAX_PENDING: int = 32  # queued hashes beyond which /register and /login return 503
+
+    # Authenticated-user cache
+    USER_CACHE_TTL_SECONDS: int = 300  # Redis tier
+    USER_CACHE_LOCAL_TTL_SECONDS: int = 30  # in-process tier; bounds staleness across workers
+    USER_CACHE_SIZE: int = 10000
+    USER_CACHE_REDIS: bool = True
+
+    # Response cache (job detail and match feed pages)
+    RESPONSE_CACHE_TTL_SECONDS: int = 600  # Redis tier; also bounds staleness if an invalidation is lost
+    RESPONSE_CACHE_LOCAL_TTL_SECONDS: int = 30  # in-process tier; bounds staleness across workers
+    RESPONSE_CACHE_SIZE: int = 5000
+    RESPONSE_CACHE_REDIS: bool = True
 
     # CORS
     CORS_ORIGINS: str = "http://localhost:5173,http://127.0.0.1:5173"
@@ -29,18 +48,86 @@ class Settings(BaseSettings):
     ALLOWED_EXTENSIONS: str = ".pdf,.docx,.doc"
     UPLOAD_DIR: str = "/app/uploads"
 
+    # Resume Parsing
+    RESUME_PARSE_WORKERS: int = 2  # processes in the parsing pool
+    RESUME_PARSE_CONCURRENCY: int = 4  # resumes in flight at once
+
+    # Skill extraction
+    SKILL_TAXONOMY_PATH: str = ""  # CSV of id,name,aliases; empty uses the bundled taxonomy
+    SKILL_CACHE_DIR: str = "/app/cache/skills"  # compiled automata, one directory per taxonomy hash
+
+    # Interaction ingestion
+    INTERACTION_FLUSH_INTERVAL_MS: int = 250  # max time an event waits before being written
+    INTERACTION_BATCH_SIZE: int = 500  # events per insert; a full batch flushes immediately
+    INTERACTION_BUFFER_SIZE: int = 10000  # queued view events before new ones are dropped
+
     # Job Scraping
     ADZUNA_APP_ID: str = ""
     ADZUNA_APP_KEY: str = ""
+    ADZUNA_COUNTRY: str = "za"
+    ADZUNA_QUERY: str = ""  # `what` search terms; empty scrapes everything
+    ADZUNA_RESULTS_PER_PAGE: int = 50
+    ADZUNA_MAX_PAGES: int = 20
+    ADZUNA_REQUESTS_PER_MINUTE: int = 25
+    SCRAPER_HTTP2: bool = True
+    SCRAPER_MAX_CONNECTIONS: int = 20  # pooled keep-alive connections shared by every scraper in a run
+    SCRAPER_TIMEOUT_SECONDS: float = 20.0
+    SCRAPER_USER_AGENT: str = "ResumeSeeker.ai job scraper"
+    SCRAPER_VALIDATOR_TTL_SECONDS: int = 604800  # keep page ETags/Last-Modified for a week
+    JOB_INGEST_BATCH_SIZE: int = 2000  # postings per upsert statement
+    JOB_DEDUP_ENABLED: bool = True  # collapse near-duplicate postings on ingestion
+    JOB_DEDUP_THRESHOLD: float = 0.8  # estimated Jaccard similarity of title+company+description shingles
+    JOB_DEDUP_NUM_PERM: int = 128  # MinHash permutations; changing this requires re-indexing signatures
+    JOB_DEDUP_BANDS: int = 16  # LSH bands (8 rows each at 128 permutations)
+    JOB_SWEEP_INTERVAL_SECONDS: int = 3600
+    JOB_SWEEP_BATCH_SIZE: int = 5000  # jobs per sweeper transaction; bounds how long row locks are held
+    JOB_MAX_AGE_DAYS: int = 60  # jobs without expires_at retire this long after posted_date
+    JOB_ARCHIVE_AFTER_DAYS: int = 30  # inactive jobs move to jobs_archive after this long
+    JOB_SEARCH_FACET_SIZE: int = 20  # values returned for the skills and location facets
+    JOB_SEARCH_FACET_SCAN_LIMIT: int = 50000  # matching jobs facets are counted over; beyond it counts are lower bounds
+    INTERNAL_API_TOKEN: str = ""  # X-Internal-Token for /api/internal; empty disables those endpoints
 
     # ML Models
     EMBEDDING_MODEL: str = "all-MiniLM-L6-v2"
     EMBEDDING_DIMENSION: int = 384
+    EMBEDDING_BATCH_TOKENS: int = 16384  # padded tokens per encode batch
+    EMBEDDING_MAX_BATCH_SIZE: int = 256
+    EMBEDDING_CACHE_SIZE: int = 50000  # vectors held in the in-process LRU
+    EMBEDDING_CACHE_TTL_SECONDS: int = 2592000  # 30 days in Redis
+    EMBEDDING_CACHE_DIR: str = "/app/cache"  # on-disk tier when Redis is unavailable
+    API_MODEL_WARMUP: str = "skills"  # models the API loads in the background after startup
+    WORKER_MODEL_PRELOAD: str = "embedding,skills"  # models Celery loads before forking, shared copy-on-write
+
+    # Vector search (pgvector)
+    VECTOR_SEARCH_EF_SEARCH: int = 100  # HNSW candidate list size
+    VECTOR_SEARCH_PROBES: int = 10  # IVFFlat lists probed
+
+    # Matching
+    MATCH_TOP_K: int = 100  # matches materialized per user
+    MATCH_CANDIDATE_MULTIPLIER: int = 4  # ANN candidates per match, re-ranked by the hybrid scorer
+    MATCH_REFRESH_INTERVAL_SECONDS: int = 900
+    MATCH_WATERMARK_MAX_LAG_SECONDS: int = 3600  # longest in-flight transaction the refresh watermark waits for
+    MATCH_REMATCH_DEBOUNCE_SECONDS: int = 30  # quiet period after a user's last resume edit before re-matching
+    MATCH_REMATCH_MAX_WAIT_SECONDS: int = 300  # re-match anyway once the first pending edit is this old
+    MATCH_REMATCH_POLL_SECONDS: int = 10  # how often the scheduler looks for users due a re-match
+    MATCH_REMATCH_BATCH_SIZE: int = 200  # users re-matched per scheduler run
+
+    # Instrumentation
+    METRICS_ENABLED: bool = True  # request timings, per-request query counts and GET /metrics
+    METRICS_N_PLUS_ONE_THRESHOLD: int = 20  # SQL statements per request beyond which it's flagged as a likely N+1
+    SLOW_QUERY_MS: int = 200  # statements slower than this are logged (parameters redacted)
+    SQL_ECHO: bool = False  # log every statement; very noisy, for local debugging only
 
     # Celery
     CELERY_BROKER_URL: str = ""
     CELERY_RESULT_BACKEND: str = ""
 
+    @property
+    def async_database_url(self) -> str:
+        """DATABASE_URL with the asyncpg driver"""
+        scheme, _, rest = self.DATABASE_URL.partition("://")
+        return f"postgresql+asyncpg://{rest}" if scheme.startswith("postgres") else self.DATABASE_URL
+
     @property
     def celery_broker(self) -> str:
         return self.CELERY_BROKER_URL or self.REDIS_URL
@@ -57,6 +144,14 @@ class Settings(BaseSettings):
     def allowed_extensions_list(self) -> list[str]:
         return [ext.strip() for ext in self.ALLOWED_EXTENSIONS.split(",")]
 
+    @property
+    def api_model_warmup_list(self) -> list[str]:
+        return [name.strip() for name in self.API_MODEL_WARMUP.split(",") if name.strip()]
+
+    @property
+    def worker_model_preload_list(self) -> list[str]:
+        return [name.strip() for name in self.WORKER_MODEL_PRELOAD.split(",") if name.strip()]
+
     class Config:
         env_file = ".env"
         case_sensitive = True
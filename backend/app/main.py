@@ -1,10 +1,19 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from contextlib import asynccontextmanager
 
 from .config import settings
-from .database import init_db
-from .api import auth, users, resumes, jobs
+from .database import async_engine, engine, init_db
+from .api import auth, users, resumes, jobs, internal
+from .middleware import InstrumentationMiddleware, UploadSizeLimitMiddleware
+from .ml.model_registry import model_registry
+from .services.interaction_buffer import interaction_buffer
+from .services.metrics import install_query_hooks, registry
+from .services.password_hasher import password_hasher
+from .services.response_cache import response_cache
+from .services.resume_pipeline import resume_pipeline
+from .services.user_cache import user_cache
 
 
 @asynccontextmanager
@@ -13,8 +22,14 @@ async def lifespan(app: FastAPI):
     # Startup
     print("🚀 Starting ResumeSeeker.ai API...")
     # Database will be initialized via migrations
+    interaction_buffer.start()
+    # Load models off the startup path; the first request needing one loads it if warm-up hasn't
+    model_registry.warm_in_background(settings.api_model_warmup_list)
     yield
     # Shutdown
+    await interaction_buffer.stop()
+    await resume_pipeline.shutdown()
+    password_hasher.shutdown()
     print("👋 Shutting down ResumeSeeker.ai API...")
 
 
@@ -26,13 +41,34 @@ app = FastAPI(
     lifespan=lifespan
 )
 
-# Configure CORS
+# Reject oversized uploads before reading their body
+app.add_middleware(
+    UploadSizeLimitMiddleware,
+    max_size=settings.MAX_UPLOAD_SIZE,
+    paths=("/api/resumes/upload",),
+)
+
+if settings.METRICS_ENABLED:
+    # Count statements on both engines; the async engine's events fire on its sync facade
+    install_query_hooks(engine, settings.SLOW_QUERY_MS)
+    install_query_hooks(async_engine.sync_engine, settings.SLOW_QUERY_MS)
+    app.add_middleware(InstrumentationMiddleware, n_plus_one_threshold=settings.METRICS_N_PLUS_ONE_THRESHOLD)
+
+    registry.add_stats_collector("user_cache", user_cache.stats)
+    registry.add_stats_collector("response_cache", response_cache.stats)
+    registry.add_stats_collector("interaction_buffer", interaction_buffer.stats)
+    registry.add_stats_collector("password_hasher", password_hasher.stats)
+    registry.add_stats_collector("resume_pipeline", resume_pipeline.stats)
+    registry.add_stats_collector("models", model_registry.stats)
+
+# Configure CORS (added last so it wraps every other middleware's responses)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.cors_origins_list,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag", "X-Matches-Updated-At"],
 )
 
 # Include routers
@@ -40,6 +76,7 @@ app.include_router(auth.router)
 app.include_router(users.router)
 app.include_router(resumes.router)
 app.include_router(jobs.router)
+app.include_router(internal.router)
 
 
 @app.get("/")
@@ -56,3 +93,10 @@ async def root():
 async def health_check():
     """Health check endpoint"""
     return {"status": "healthy"}
+
+
+if settings.METRICS_ENABLED:
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics():
+        """Prometheus metrics for this worker process"""
+        return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
@@ -0,0 +1,87 @@
+import json
+import time
+
+from .services.metrics import RequestStats, record_request, request_stats, route_label
+from .services.upload_service import content_length_exceeds
+
+
+class UploadSizeLimitMiddleware:
+    """
+    Reject oversized uploads from their Content-Length header alone.
+
+    Runs before the multipart body is read, so a client sending a 500MB file
+    to an upload route is turned away without the server receiving it.
+    Starlette parses the whole multipart body before the route sees the file,
+    so a body without a declared length can't be capped early and is refused
+    with 411; the server enforces the declared length on the rest.
+    """
+
+    def __init__(self, app, max_size: int, paths: tuple):
+        self.app = app
+        self.max_size = max_size
+        self.paths = paths
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["method"] == "POST" and scope["path"] in self.paths:
+            headers = dict(scope["headers"])
+            content_length = headers.get(b"content-length")
+            if content_length is None:
+                await self._reject(send, 411, "Content-Length header required for uploads")
+                return
+            if content_length_exceeds(content_length.decode(), self.max_size):
+                await self._reject(send, 400, f"File size exceeds maximum allowed size of {self.max_size} bytes")
+                return
+        await self.app(scope, receive, send)
+
+    @staticmethod
+    async def _reject(send, status: int, detail: str) -> None:
+        body = json.dumps({"detail": detail}).encode()
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"connection", b"close"),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+
+class InstrumentationMiddleware:
+    """
+    Record per-route latency and the SQL each request runs.
+
+    Durations are labelled with the matched route template rather than the raw
+    path, so /api/jobs/{job_id} is one series. Statement counts come from the
+    engine hooks in services.metrics, which add to the RequestStats set here;
+    requests above the N+1 threshold are counted and logged.
+    """
+
+    def __init__(self, app, n_plus_one_threshold: int):
+        self.app = app
+        self.n_plus_one_threshold = n_plus_one_threshold
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        stats = RequestStats(path=scope["path"])
+        token = request_stats.set(stats)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            request_stats.reset(token)
+            # The router records the matched route on the (shared) scope
+            record_request(scope["method"], route_label(scope), status, elapsed, stats, self.n_plus_one_threshold)
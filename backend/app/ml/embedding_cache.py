@@ -0,0 +1,229 @@
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from ..config import settings
+
+logger = logging.getLogger(__name__)
+
+_whitespace_re = re.compile(r"\s+")
+
+REDIS_RETRY_SECONDS = 30
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text so trivially different copies share a cache key"""
+    text = unicodedata.normalize("NFKC", text)
+    return _whitespace_re.sub(" ", text).strip().lower()
+
+
+def cache_key(text: str, model_name: Optional[str] = None) -> str:
+    """Content-addressed key: hash of the embedding model name and normalized text"""
+    model_name = model_name or settings.EMBEDDING_MODEL
+    digest = hashlib.sha256(f"{model_name}\0{normalize_text(text)}".encode()).hexdigest()
+    return f"emb:{digest}"
+
+
+class LRUStore:
+    """Bounded in-process LRU of key -> vector"""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.evictions = 0
+        self._data: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        with self._lock:
+            vector = self._data.get(key)
+            if vector is not None:
+                self._data.move_to_end(key)
+            return vector
+
+    def set(self, key: str, vector: np.ndarray) -> None:
+        with self._lock:
+            self._data[key] = vector
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class RedisStore:
+    """
+    Persistent tier backed by Redis, storing raw float32 bytes.
+
+    Redis errors never fail the caller: reads degrade to misses and writes are
+    skipped, and Redis is left alone for REDIS_RETRY_SECONDS before the next
+    attempt, so an outage costs re-encoding rather than the whole task.
+    """
+
+    name = "redis"
+
+    def __init__(self, client, ttl_seconds: int):
+        self.client = client
+        self.ttl_seconds = ttl_seconds
+        self.errors = 0
+        self._down_until = 0.0
+
+    def _available(self) -> bool:
+        return time.monotonic() >= self._down_until
+
+    def _failed(self, operation: str) -> None:
+        self.errors += 1
+        self._down_until = time.monotonic() + REDIS_RETRY_SECONDS
+        logger.warning("Embedding cache Redis %s failed; skipping Redis for %ds",
+                       operation, REDIS_RETRY_SECONDS, exc_info=True)
+
+    def get_many(self, keys: Sequence[str]) -> List[Optional[bytes]]:
+        if self._available():
+            try:
+                return self.client.mget(keys)
+            except Exception:
+                self._failed("read")
+        return [None] * len(keys)
+
+    def set_many(self, items: Dict[str, bytes]) -> None:
+        if not self._available():
+            return
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for key, value in items.items():
+                pipe.set(key, value, ex=self.ttl_seconds)
+            pipe.execute()
+        except Exception:
+            self._failed("write")
+
+
+class DiskStore:
+    """Persistent tier backed by a local SQLite file, used when Redis is unavailable"""
+
+    name = "disk"
+
+    def __init__(self, path: str):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB NOT NULL)")
+        self._lock = threading.Lock()
+
+    def get_many(self, keys: Sequence[str]) -> List[Optional[bytes]]:
+        found: Dict[str, bytes] = {}
+        with self._lock:
+            # Stay under SQLite's bound-parameter limit
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})", chunk
+                )
+                found.update(rows)
+        return [found.get(key) for key in keys]
+
+    def set_many(self, items: Dict[str, bytes]) -> None:
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)", items.items()
+            )
+
+
+class EmbeddingCache:
+    """
+    Two-tier content-addressed embedding cache.
+
+    Lookups check the in-process LRU first, then the persistent store; vectors
+    found in the persistent store are promoted into the LRU.
+    """
+
+    def __init__(self, persistent, max_memory_items: int):
+        self.memory = LRUStore(max_memory_items)
+        self.persistent = persistent
+        self.memory_hits = 0
+        self.persistent_hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def get_many(self, keys: Sequence[str]) -> List[Optional[np.ndarray]]:
+        """Look up vectors for keys; missing entries are None"""
+        results: List[Optional[np.ndarray]] = [self.memory.get(key) for key in keys]
+        pending = [i for i, vector in enumerate(results) if vector is None]
+        memory_hits = len(keys) - len(pending)
+        persistent_hits = 0
+
+        if pending and self.persistent is not None:
+            raw = self.persistent.get_many([keys[i] for i in pending])
+            for i, value in zip(pending, raw):
+                if value is not None:
+                    vector = np.frombuffer(value, dtype=np.float32)
+                    self.memory.set(keys[i], vector)
+                    results[i] = vector
+                    persistent_hits += 1
+
+        with self._lock:
+            self.memory_hits += memory_hits
+            self.persistent_hits += persistent_hits
+            self.misses += len(pending) - persistent_hits
+        return results
+
+    def set_many(self, keys: Sequence[str], vectors: Sequence[np.ndarray]) -> None:
+        """Store vectors in both tiers"""
+        items = {}
+        for key, vector in zip(keys, vectors):
+            vector = np.asarray(vector, dtype=np.float32)
+            self.memory.set(key, vector)
+            items[key] = vector.tobytes()
+        if items and self.persistent is not None:
+            self.persistent.set_many(items)
+
+    def stats(self) -> Dict[str, object]:
+        """Hit/miss/eviction counters; every hit is one text that was not re-encoded"""
+        lookups = self.memory_hits + self.persistent_hits + self.misses
+        hits = self.memory_hits + self.persistent_hits
+        return {
+            "backend": self.persistent.name if self.persistent is not None else None,
+            "memory_items": len(self.memory),
+            "memory_hits": self.memory_hits,
+            "persistent_hits": self.persistent_hits,
+            "misses": self.misses,
+            "evictions": self.memory.evictions,
+            "persistent_errors": getattr(self.persistent, "errors", 0),
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+def _connect_persistent_store():
+    """Use Redis when reachable, otherwise fall back to the on-disk store"""
+    try:
+        import redis
+
+        client = redis.Redis.from_url(settings.REDIS_URL, socket_connect_timeout=1, socket_timeout=1)
+        client.ping()
+        return RedisStore(client, settings.EMBEDDING_CACHE_TTL_SECONDS)
+    except Exception:
+        return DiskStore(os.path.join(settings.EMBEDDING_CACHE_DIR, "embeddings.sqlite3"))
+
+
+_cache: Optional[EmbeddingCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """Get the process-wide embedding cache"""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = EmbeddingCache(_connect_persistent_store(), settings.EMBEDDING_CACHE_SIZE)
+    return _cache
@@ -0,0 +1,189 @@
+from typing import List, Optional, Sequence
+from uuid import UUID
+
+import numpy as np
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from ..config import settings
+from ..models.job import Job
+from ..models.resume import Resume
+from .embedding_cache import cache_key, get_embedding_cache
+from .model_registry import model_registry
+
+
+def get_model():
+    """Get the sentence-transformers model, loading it once per process"""
+    return model_registry.get("embedding")
+
+
+def job_text(job: Job) -> str:
+    """Build the text that represents a job for embedding"""
+    return f"{job.title}\n{job.company}\n{job.description}"
+
+
+def resume_text(resume: Resume) -> str:
+    """Build the text that represents a resume for embedding"""
+    parts = [resume.raw_text or ""]
+    if resume.skills:
+        parts.append(", ".join(resume.skills))
+    return "\n".join(parts)
+
+
+def token_lengths(texts: Sequence[str]) -> List[int]:
+    """Token count of each text, capped at the model's max sequence length"""
+    model = get_model()
+    encoded = model.tokenizer(
+        list(texts),
+        add_special_tokens=True,
+        truncation=True,
+        max_length=model.max_seq_length,
+    )
+    return [len(ids) for ids in encoded["input_ids"]]
+
+
+def plan_batches(lengths: Sequence[int], max_tokens: int, max_batch_size: int) -> List[List[int]]:
+    """
+    Group text indices into batches bounded by a padded token budget.
+
+    Texts are sorted by length so each batch pads to a similar size; a batch
+    closes once (batch size x longest text) would exceed max_tokens. Short
+    texts therefore run in large batches and long texts in small ones.
+    """
+    order = sorted(range(len(lengths)), key=lambda i: lengths[i])
+    batches: List[List[int]] = []
+    current: List[int] = []
+    for idx in order:
+        # Sorted ascending, so the newest text is always the longest in the batch
+        padded = (len(current) + 1) * lengths[idx]
+        if current and (padded > max_tokens or len(current) >= max_batch_size):
+            batches.append(current)
+            current = []
+        current.append(idx)
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _encode_batched(
+    texts: Sequence[str],
+    max_tokens: Optional[int] = None,
+    max_batch_size: Optional[int] = None,
+) -> np.ndarray:
+    """Run the model over texts in adaptive batches, returning vectors in input order"""
+    model = get_model()
+    max_tokens = max_tokens or settings.EMBEDDING_BATCH_TOKENS
+    max_batch_size = max_batch_size or settings.EMBEDDING_MAX_BATCH_SIZE
+
+    result = np.empty((len(texts), settings.EMBEDDING_DIMENSION), dtype=np.float32)
+    for batch in plan_batches(token_lengths(texts), max_tokens, max_batch_size):
+        vectors = model.encode(
+            [texts[i] for i in batch],
+            batch_size=len(batch),
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=False,
+        )
+        result[batch] = vectors
+    return result
+
+
+def encode_texts(
+    texts: Sequence[str],
+    max_tokens: Optional[int] = None,
+    max_batch_size: Optional[int] = None,
+    use_cache: bool = True,
+) -> np.ndarray:
+    """
+    Encode texts into L2-normalized float32 embeddings, in input order.
+
+    With use_cache, texts are looked up in the content-addressed embedding
+    cache first and only distinct cache misses are sent to the model.
+    """
+    if not texts:
+        return np.zeros((0, settings.EMBEDDING_DIMENSION), dtype=np.float32)
+    if not use_cache:
+        return _encode_batched(texts, max_tokens, max_batch_size)
+
+    cache = get_embedding_cache()
+    keys = [cache_key(text) for text in texts]
+    unique_keys = list(dict.fromkeys(keys))
+    vectors = dict(zip(unique_keys, cache.get_many(unique_keys)))
+
+    missing = [key for key in unique_keys if vectors[key] is None]
+    if missing:
+        first_text = {}
+        for key, text in zip(keys, texts):
+            first_text.setdefault(key, text)
+        encoded = _encode_batched([first_text[key] for key in missing], max_tokens, max_batch_size)
+        cache.set_many(missing, encoded)
+        vectors.update(zip(missing, encoded))
+
+    return np.stack([vectors[key] for key in keys])
+
+
+def embed_jobs(db: Session, job_ids: Optional[List[UUID]] = None, chunk_size: int = 1000) -> int:
+    """
+    Fill Job.embedding for the given jobs, or for all active jobs missing one.
+
+    Jobs are processed in chunks; each chunk is encoded in adaptive batches and
+    written back with one bulk UPDATE and a single commit. Returns the number
+    of jobs embedded.
+    """
+    query = db.query(Job.id, Job.title, Job.company, Job.description)
+    if job_ids is not None:
+        query = query.filter(Job.id.in_(job_ids))
+    else:
+        query = query.filter(Job.embedding.is_(None), Job.is_active == True)
+
+    total = 0
+    last_id = None
+    while True:
+        # Keyset over id so committed rows don't shift the window
+        chunk_query = query
+        if last_id is not None:
+            chunk_query = chunk_query.filter(Job.id > last_id)
+        rows = chunk_query.order_by(Job.id).limit(chunk_size).all()
+        if not rows:
+            break
+
+        vectors = encode_texts([job_text(row) for row in rows])
+        db.execute(
+            update(Job),
+            [{"id": row.id, "embedding": vector} for row, vector in zip(rows, vectors)]
+        )
+        db.commit()
+
+        total += len(rows)
+        last_id = rows[-1].id
+    return total
+
+
+def embed_resumes(db: Session, resume_ids: Optional[List[UUID]] = None, chunk_size: int = 500) -> int:
+    """Fill Resume.embedding for the given resumes, or for all parsed resumes missing one"""
+    query = db.query(Resume.id, Resume.raw_text, Resume.skills)
+    if resume_ids is not None:
+        query = query.filter(Resume.id.in_(resume_ids))
+    else:
+        query = query.filter(Resume.embedding.is_(None), Resume.raw_text.isnot(None))
+
+    total = 0
+    last_id = None
+    while True:
+        chunk_query = query
+        if last_id is not None:
+            chunk_query = chunk_query.filter(Resume.id > last_id)
+        rows = chunk_query.order_by(Resume.id).limit(chunk_size).all()
+        if not rows:
+            break
+
+        vectors = encode_texts([resume_text(row) for row in rows])
+        db.execute(
+            update(Resume),
+            [{"id": row.id, "embedding": vector} for row, vector in zip(rows, vectors)]
+        )
+        db.commit()
+
+        total += len(rows)
+        last_id = rows[-1].id
+    return total
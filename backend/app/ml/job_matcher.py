@@ -0,0 +1,274 @@
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+import numpy as np
+
+# Hybrid score weights: semantic similarity, skill coverage, location/salary fit
+SEMANTIC_WEIGHT = 0.7
+SKILLS_WEIGHT = 0.2
+PREFERENCE_WEIGHT = 0.1
+
+# Score given to a component the job doesn't provide data for
+NEUTRAL_SCORE = 0.5
+
+MAX_REASON_SKILLS = 5
+
+# Set bits per byte value, for popcount over uint64 bitsets viewed as bytes
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+ScoredJob = Tuple[UUID, float, dict]
+
+
+def _normalize(value: Optional[str]) -> str:
+    return (value or "").strip().lower()
+
+
+class SkillVocabulary:
+    """Maps normalized skill names to bit positions"""
+
+    def __init__(self, skills: Iterable[str] = ()):
+        self.index: Dict[str, int] = {}
+        self.names: List[str] = []
+        for skill in skills:
+            self.add(skill)
+
+    def add(self, skill: str) -> int:
+        key = _normalize(skill)
+        if key not in self.index:
+            self.index[key] = len(self.names)
+            self.names.append(key)
+        return self.index[key]
+
+    @property
+    def words(self) -> int:
+        """Number of uint64 words needed per bitset"""
+        return max(1, (len(self.names) + 63) // 64)
+
+    def encode(self, skills: Optional[Sequence[str]], words: int, grow: bool = False) -> np.ndarray:
+        """Encode a skill list as a uint64 bitset; unknown skills are dropped unless grow"""
+        bits = np.zeros(words, dtype=np.uint64)
+        for skill in skills or ():
+            key = _normalize(skill)
+            position = self.add(key) if grow else self.index.get(key)
+            if position is not None and position < words * 64:
+                bits[position // 64] |= np.uint64(1) << np.uint64(position % 64)
+        return bits
+
+    def decode(self, bits: np.ndarray) -> List[str]:
+        """Skill names for the set bits of a bitset"""
+        positions = np.flatnonzero(np.unpackbits(bits.view(np.uint8), bitorder="little"))
+        return [self.names[p] for p in positions if p < len(self.names)]
+
+
+def popcount_rows(bitsets: np.ndarray) -> np.ndarray:
+    """Number of set bits in each row of an (n, words) uint64 array"""
+    return _POPCOUNT[bitsets.view(np.uint8)].sum(axis=1, dtype=np.int32)
+
+
+class JobBlock:
+    """
+    Column-oriented block of jobs ready for vectorized scoring.
+
+    Embeddings must be L2-normalized (as produced by app.ml.embeddings) so a
+    single matmul gives cosine similarity. Skills are stored as one uint64
+    bitset row per job; categorical columns are stored as integer codes so
+    preference filters become lookups into small per-category tables.
+    """
+
+    def __init__(
+        self,
+        job_ids: Sequence[UUID],
+        embeddings: np.ndarray,
+        skills: Sequence[Optional[Sequence[str]]],
+        locations: Sequence[Optional[str]],
+        remote_types: Sequence[Optional[str]],
+        salary_min: Sequence[Optional[int]],
+        salary_max: Sequence[Optional[int]],
+        vocabulary: Optional[SkillVocabulary] = None,
+    ):
+        self.job_ids = list(job_ids)
+        self.embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
+
+        self.vocabulary = vocabulary or SkillVocabulary()
+        for job_skills in skills:
+            for skill in job_skills or ():
+                self.vocabulary.add(skill)
+        words = self.vocabulary.words
+        self.skill_bits = np.zeros((len(self.job_ids), words), dtype=np.uint64)
+        for row, job_skills in enumerate(skills):
+            if job_skills:
+                self.skill_bits[row] = self.vocabulary.encode(job_skills, words)
+        self.skill_counts = popcount_rows(self.skill_bits)
+
+        self.location_names, self.location_codes = np.unique(
+            [_normalize(location) for location in locations], return_inverse=True
+        )
+        self.remote_names, self.remote_codes = np.unique(
+            [_normalize(remote_type) for remote_type in remote_types], return_inverse=True
+        )
+
+        # Missing salaries are NaN so comparisons against them are False
+        self.salary_min = np.array([np.nan if v is None else v for v in salary_min], dtype=np.float64)
+        self.salary_max = np.array([np.nan if v is None else v for v in salary_max], dtype=np.float64)
+
+    def __len__(self) -> int:
+        return len(self.job_ids)
+
+    @classmethod
+    def from_rows(cls, rows: Sequence, vocabulary: Optional[SkillVocabulary] = None) -> "JobBlock":
+        """Build a block from Job rows/ORM objects with id, embedding, skills_required, location, ..."""
+        return cls(
+            job_ids=[row.id for row in rows],
+            embeddings=np.stack([np.asarray(row.embedding, dtype=np.float32) for row in rows])
+            if rows else np.zeros((0, 0), dtype=np.float32),
+            skills=[row.skills_required for row in rows],
+            locations=[row.location for row in rows],
+            remote_types=[row.remote_type for row in rows],
+            salary_min=[row.salary_min for row in rows],
+            salary_max=[row.salary_max for row in rows],
+            vocabulary=vocabulary,
+        )
+
+
+class MatchPreferences:
+    """The subset of UserPreference the scorer uses"""
+
+    def __init__(
+        self,
+        preferred_locations: Optional[Sequence[str]] = None,
+        min_salary: Optional[int] = None,
+        max_salary: Optional[int] = None,
+        remote_preference: Optional[str] = None,
+    ):
+        self.preferred_locations = [_normalize(loc) for loc in preferred_locations or () if loc]
+        self.min_salary = min_salary
+        self.max_salary = max_salary
+        self.remote_preference = _normalize(remote_preference) or "any"
+
+    @classmethod
+    def from_model(cls, preference) -> "MatchPreferences":
+        if preference is None:
+            return cls()
+        return cls(
+            preferred_locations=preference.preferred_locations,
+            min_salary=preference.min_salary,
+            max_salary=preference.max_salary,
+            remote_preference=preference.remote_preference,
+        )
+
+
+class BlockScores:
+    """Per-job score components for one resume against one JobBlock"""
+
+    def __init__(self, total, semantic, skill_overlap, skill_coverage, location_ok, salary_ok, eligible):
+        self.total = total
+        self.semantic = semantic
+        self.skill_overlap = skill_overlap
+        self.skill_coverage = skill_coverage
+        self.location_ok = location_ok
+        self.salary_ok = salary_ok
+        self.eligible = eligible
+
+
+def score_block(
+    block: JobBlock,
+    resume_embedding: np.ndarray,
+    resume_skills: Optional[Sequence[str]],
+    preferences: Optional[MatchPreferences] = None,
+) -> BlockScores:
+    """
+    Score every job in a block for one resume.
+
+    Semantic similarity is one matrix-vector product, skill overlap is a
+    popcount of AND-ed bitsets, and preferences become boolean masks. Jobs
+    failing a hard filter (remote type, salary below the user's minimum)
+    get a total of -1.
+    """
+    preferences = preferences or MatchPreferences()
+    query = np.asarray(resume_embedding, dtype=np.float32)
+
+    semantic = np.clip(block.embeddings @ query, 0.0, 1.0)
+
+    resume_bits = block.vocabulary.encode(resume_skills, block.skill_bits.shape[1])
+    overlap = popcount_rows(block.skill_bits & resume_bits)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        coverage = np.where(block.skill_counts > 0, overlap / block.skill_counts, NEUTRAL_SCORE)
+
+    # Remote filter: jobs with unknown remote type are kept
+    is_remote = block.remote_names == "remote"
+    if preferences.remote_preference in ("remote", "hybrid", "onsite"):
+        allowed = (block.remote_names == preferences.remote_preference) | (block.remote_names == "")
+        remote_ok = allowed[block.remote_codes]
+    else:
+        remote_ok = np.ones(len(block), dtype=bool)
+
+    # Location: per distinct location string, then broadcast through the codes
+    if preferences.preferred_locations:
+        location_table = np.array([
+            any(pref in name for pref in preferences.preferred_locations)
+            for name in block.location_names
+        ], dtype=bool)
+        location_ok = location_table[block.location_codes] | is_remote[block.remote_codes]
+        location_score = location_ok.astype(np.float32)
+    else:
+        location_ok = np.ones(len(block), dtype=bool)
+        location_score = np.full(len(block), NEUTRAL_SCORE, dtype=np.float32)
+
+    # Salary: a job is excluded only when its best known salary is below the user's minimum
+    best_salary = np.fmax(block.salary_max, block.salary_min)
+    known_salary = ~np.isnan(best_salary)
+    if preferences.min_salary is not None:
+        salary_ok = ~known_salary | (best_salary >= preferences.min_salary)
+        salary_score = np.where(known_salary, 1.0, NEUTRAL_SCORE)
+    else:
+        salary_ok = np.ones(len(block), dtype=bool)
+        salary_score = np.full(len(block), NEUTRAL_SCORE)
+
+    eligible = remote_ok & salary_ok
+    total = (
+        SEMANTIC_WEIGHT * semantic
+        + SKILLS_WEIGHT * coverage
+        + PREFERENCE_WEIGHT * (location_score + salary_score) / 2
+    )
+    total = np.where(eligible, total, -1.0)
+
+    return BlockScores(total, semantic, overlap, coverage, location_ok, salary_ok, eligible)
+
+
+def match_reasons(block: JobBlock, scores: BlockScores, row: int, resume_skills: Optional[Sequence[str]]) -> dict:
+    """Compact, JSON-serializable explanation of one job's score"""
+    resume_bits = block.vocabulary.encode(resume_skills, block.skill_bits.shape[1])
+    matched = block.vocabulary.decode(block.skill_bits[row] & resume_bits)
+    return {
+        "semantic": round(float(scores.semantic[row]), 4),
+        "skills": matched[:MAX_REASON_SKILLS],
+        "skill_coverage": round(float(scores.skill_coverage[row]), 4),
+        "location": bool(scores.location_ok[row]),
+        "salary": bool(scores.salary_ok[row]),
+    }
+
+
+def top_matches(
+    block: JobBlock,
+    resume_embedding: np.ndarray,
+    resume_skills: Optional[Sequence[str]],
+    preferences: Optional[MatchPreferences] = None,
+    k: int = 100,
+    min_score: float = 0.0,
+) -> List[ScoredJob]:
+    """Best k eligible jobs in a block with score above min_score, best first"""
+    if len(block) == 0:
+        return []
+    scores = score_block(block, resume_embedding, resume_skills, preferences)
+    candidates = np.flatnonzero(scores.total > min_score)
+    if len(candidates) > k:
+        candidates = candidates[np.argpartition(-scores.total[candidates], k - 1)[:k]]
+    candidates = candidates[np.argsort(-scores.total[candidates], kind="stable")]
+    return [
+        (
+            block.job_ids[row],
+            round(float(scores.total[row]), 4),
+            match_reasons(block, scores, row, resume_skills),
+        )
+        for row in candidates
+    ]
@@ -0,0 +1,79 @@
+import hashlib
+import re
+import zlib
+from typing import List, Optional, Set
+
+import numpy as np
+
+# Words per shingle
+SHINGLE_SIZE = 3
+
+# Fixed seed: signatures are persisted, so the hash family must never change between processes
+SEED = 0x5EED
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_MASK32 = np.uint64(0xFFFFFFFF)
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> Set[int]:
+    """Word n-grams of normalized text, hashed to 32-bit ints"""
+    tokens = _TOKEN_RE.findall((text or "").lower())
+    if len(tokens) < size:
+        return {zlib.crc32(" ".join(tokens).encode())} if tokens else set()
+    return {zlib.crc32(" ".join(tokens[i:i + size]).encode()) for i in range(len(tokens) - size + 1)}
+
+
+def posting_text(title: Optional[str], company: Optional[str], description: Optional[str]) -> str:
+    """The text a posting's near-duplicate signature is computed from"""
+    return f"{title or ''}\n{company or ''}\n{description or ''}"
+
+
+class MinHasher:
+    """
+    MinHash signatures with banded LSH keys.
+
+    Uses `num_perm` multiply-shift hash functions over 32-bit shingle hashes;
+    the estimated Jaccard similarity of two texts is the fraction of equal
+    signature entries. Signatures are split into `bands` bands whose hashes
+    are the LSH bucket keys: texts with similarity s share at least one bucket
+    with probability 1 - (1 - s^r)^b, for r = num_perm / bands rows per band.
+    """
+
+    def __init__(self, num_perm: int = 128, bands: int = 16):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        rng = np.random.default_rng(SEED)
+        # Odd multipliers for the multiply-shift family; uint64 arithmetic wraps by design
+        self._a = rng.integers(1, 2 ** 63, size=num_perm, dtype=np.uint64) | np.uint64(1)
+        self._b = rng.integers(0, 2 ** 63, size=num_perm, dtype=np.uint64)
+
+    @property
+    def threshold(self) -> float:
+        """Similarity at which a pair becomes a candidate with probability ~0.5"""
+        return (1 / self.bands) ** (1 / self.rows)
+
+    def signature(self, text: str) -> np.ndarray:
+        """uint32 MinHash signature of a text"""
+        values = np.fromiter(shingles(text), dtype=np.uint64)
+        if values.size == 0:
+            return np.full(self.num_perm, 0xFFFFFFFF, dtype=np.uint32)
+        with np.errstate(over="ignore"):
+            hashed = (self._a[:, None] * values[None, :] + self._b[:, None]) >> np.uint64(32)
+        return (hashed & _MASK32).min(axis=1).astype(np.uint32)
+
+    def band_keys(self, signature: np.ndarray) -> List[int]:
+        """One signed 64-bit bucket key per band"""
+        keys = []
+        for band in range(self.bands):
+            chunk = signature[band * self.rows:(band + 1) * self.rows].tobytes()
+            digest = hashlib.blake2b(chunk, digest_size=8, person=band.to_bytes(2, "little")).digest()
+            keys.append(int.from_bytes(digest, "little", signed=True))
+        return keys
+
+    @staticmethod
+    def similarity(a: np.ndarray, b: np.ndarray) -> float:
+        """Estimated Jaccard similarity of two signatures"""
+        return float(np.count_nonzero(a == b)) / a.size
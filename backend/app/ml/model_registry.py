@@ -0,0 +1,152 @@
+"""
+Process-wide registry of ML models, loaded lazily and at most once.
+
+Nothing heavy is imported when this module is: each loader imports its library
+(sentence-transformers, torch, ...) on first use, so `import app.main` stays
+fast and API workers that never embed never pay for the model. Models can be
+warmed in a background thread after startup, or preloaded in a parent process
+before it forks workers so the children share the weights copy-on-write.
+"""
+import gc
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, Optional
+
+from ..config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def current_rss_bytes() -> Optional[int]:
+    """Resident set size of this process, or None where /proc is unavailable"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+@dataclass
+class _Entry:
+    loader: Callable[[], object]
+    model: object = None
+    loaded: bool = False
+    error: Optional[str] = None
+    load_seconds: Optional[float] = None
+    rss_delta_bytes: Optional[int] = None
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+class ModelRegistry:
+    """
+    Named models, each loaded by its loader on first get().
+
+    Loads are serialized per model, not globally, so a request that needs the
+    skill automaton never waits behind the embedding model. Load time and the
+    growth in RSS while loading are recorded per model (RSS deltas overlap if
+    two models load at the same time).
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, _Entry] = {}
+
+    def register(self, name: str, loader: Callable[[], object]) -> None:
+        self._entries[name] = _Entry(loader)
+
+    def _entry(self, name: str) -> _Entry:
+        try:
+            return self._entries[name]
+        except KeyError:
+            raise KeyError(f"Unknown model {name!r}; registered: {', '.join(self._entries)}") from None
+
+    def get(self, name: str):
+        """The model, loading it on first use"""
+        entry = self._entry(name)
+        if entry.loaded:
+            return entry.model
+        with entry.lock:
+            if not entry.loaded:
+                rss_before = current_rss_bytes()
+                started = time.perf_counter()
+                try:
+                    entry.model = entry.loader()
+                except Exception as exc:
+                    entry.error = f"{type(exc).__name__}: {exc}"
+                    raise
+                entry.load_seconds = time.perf_counter() - started
+                rss_after = current_rss_bytes()
+                if rss_before is not None and rss_after is not None:
+                    entry.rss_delta_bytes = rss_after - rss_before
+                entry.error = None
+                entry.loaded = True
+                logger.info("Loaded model %s in %.2fs (%+.0f MB RSS)", name, entry.load_seconds,
+                            (entry.rss_delta_bytes or 0) / 2 ** 20)
+        return entry.model
+
+    def is_loaded(self, name: str) -> bool:
+        return self._entry(name).loaded
+
+    def warm(self, names: Iterable[str]) -> None:
+        """Load models now, logging (not raising) failures; requests retry the load on first use"""
+        for name in names:
+            try:
+                self.get(name)
+            except Exception:
+                logger.warning("Warming model %s failed", name, exc_info=True)
+
+    def warm_in_background(self, names: Iterable[str]) -> Optional[threading.Thread]:
+        """Warm models on a daemon thread so startup and health checks don't wait for them"""
+        names = [name for name in names if not self.is_loaded(name)]
+        if not names:
+            return None
+        thread = threading.Thread(target=self.warm, args=(names,), name="model-warmup", daemon=True)
+        thread.start()
+        return thread
+
+    def preload(self, names: Iterable[str]) -> None:
+        """
+        Load models in a parent process that is about to fork workers.
+
+        Afterwards every object allocated so far is moved to the GC's permanent
+        generation, so collections in the children don't write to (and so
+        un-share) the pages holding the model.
+        """
+        self.warm(names)
+        gc.freeze()
+
+    def stats(self) -> Dict[str, object]:
+        """Per-model load state, time and RSS growth, plus this process's RSS"""
+        rss = current_rss_bytes()
+        return {
+            "rss_mb": round(rss / 2 ** 20, 1) if rss is not None else None,
+            **{
+                name: {
+                    "loaded": int(entry.loaded),
+                    "failed": int(entry.error is not None),
+                    "load_seconds": round(entry.load_seconds, 3) if entry.load_seconds is not None else None,
+                    "rss_delta_mb": round(entry.rss_delta_bytes / 2 ** 20, 1)
+                    if entry.rss_delta_bytes is not None else None,
+                }
+                for name, entry in self._entries.items()
+            },
+        }
+
+
+def _load_embedding_model():
+    from sentence_transformers import SentenceTransformer
+
+    return SentenceTransformer(settings.EMBEDDING_MODEL, device="cpu")
+
+
+def _load_skill_automaton():
+    from .skill_extractor import BUNDLED_TAXONOMY, load_or_compile
+
+    return load_or_compile(settings.SKILL_TAXONOMY_PATH or BUNDLED_TAXONOMY, settings.SKILL_CACHE_DIR)
+
+
+model_registry = ModelRegistry()
+model_registry.register("embedding", _load_embedding_model)
+model_registry.register("skills", _load_skill_automaton)
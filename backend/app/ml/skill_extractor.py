@@ -0,0 +1,239 @@
+import csv
+import hashlib
+import logging
+import os
+import re
+import shutil
+import tempfile
+from bisect import bisect_left
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+from .model_registry import model_registry
+
+logger = logging.getLogger(__name__)
+
+# Part of the cache key: bump when tokenization or the on-disk layout changes
+FORMAT_VERSION = 1
+
+BUNDLED_TAXONOMY = os.path.join(os.path.dirname(__file__), "data", "skills.csv")
+
+# Words, keeping the punctuation skill names rely on (c++, c#, node.js, .net)
+_TOKEN_RE = re.compile(r"\.?[a-z0-9+#]+(?:\.[a-z0-9+#]+)*")
+
+_ARRAYS = ("root", "fail", "edge_keys", "edge_next", "out_offsets", "out_skills")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased word tokens, as matched against the taxonomy"""
+    return _TOKEN_RE.findall((text or "").lower())
+
+
+@dataclass
+class Skill:
+    id: str
+    name: str
+    aliases: List[str] = field(default_factory=list)
+
+
+def load_taxonomy(path: str) -> List[Skill]:
+    """Read a taxonomy CSV with id, name and |-separated aliases columns"""
+    with open(path, newline="", encoding="utf-8") as f:
+        return [
+            Skill(
+                id=row["id"].strip(),
+                name=row["name"].strip(),
+                aliases=[alias.strip() for alias in (row.get("aliases") or "").split("|") if alias.strip()],
+            )
+            for row in csv.DictReader(f)
+            if row["id"].strip()
+        ]
+
+
+def taxonomy_digest(path: str) -> str:
+    """Cache key of the automaton compiled from a taxonomy file"""
+    digest = hashlib.sha256(f"skills-v{FORMAT_VERSION}\0".encode())
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()[:32]
+
+
+class SkillAutomaton:
+    """
+    Aho-Corasick automaton over word tokens, matching every taxonomy term in one pass.
+
+    Terms (skill names and aliases) are tokenized like the text, so matches
+    always fall on word boundaries and "scikit-learn" also matches "scikit
+    learn". Scanning costs one dict lookup per word; only words that occur in
+    some term walk the automaton. Transitions are stored as flat arrays
+    (a dense row for the root, sorted state * vocabulary + token keys for the
+    rest) that `save` writes as .npy files and `load` maps read-only, so a
+    worker starts with the page cache rather than a rebuild.
+    """
+
+    def __init__(self, skill_ids: Sequence[str], names: Sequence[str], vocabulary: Sequence[str], **arrays):
+        self.skill_ids = list(skill_ids)
+        self.names = list(names)
+        self.vocabulary = list(vocabulary)
+        self._token_ids = {word: i for i, word in enumerate(self.vocabulary)}
+        self._arrays: Dict[str, np.ndarray] = {name: arrays[name] for name in _ARRAYS}
+        # memoryviews index to plain ints and work with bisect, which numpy scalars make slow
+        self._views = {name: memoryview(np.ascontiguousarray(array)) for name, array in self._arrays.items()}
+
+    @property
+    def states(self) -> int:
+        return len(self._arrays["fail"])
+
+    def matches(self, text: str) -> Iterator[int]:
+        """Skill indices for every term occurrence in text, in text order"""
+        token_ids = self._token_ids
+        width = len(self.vocabulary)
+        root, fail = self._views["root"], self._views["fail"]
+        edge_keys, edge_next = self._views["edge_keys"], self._views["edge_next"]
+        out_offsets, out_skills = self._views["out_offsets"], self._views["out_skills"]
+        edges = len(edge_keys)
+
+        state = 0
+        for word in _TOKEN_RE.findall(text.lower()):
+            token = token_ids.get(word)
+            if token is None:
+                state = 0
+                continue
+            while state:
+                key = state * width + token
+                i = bisect_left(edge_keys, key)
+                if i < edges and edge_keys[i] == key:
+                    state = edge_next[i]
+                    break
+                state = fail[state]
+            else:
+                state = root[token]
+            for i in range(out_offsets[state], out_offsets[state + 1]):
+                yield out_skills[i]
+
+    def extract(self, text: Optional[str]) -> List[str]:
+        """Canonical ids of the skills mentioned in text, in order of first mention"""
+        return [self.skill_ids[i] for i in self._unique(text)]
+
+    def extract_names(self, text: Optional[str]) -> List[str]:
+        """Canonical names of the skills mentioned in text, in order of first mention"""
+        return [self.names[i] for i in self._unique(text)]
+
+    def _unique(self, text: Optional[str]) -> List[int]:
+        return list(dict.fromkeys(self.matches(text))) if text else []
+
+    def save(self, path: str) -> None:
+        """Write the automaton to directory `path`; concurrent writers of the same path are safe"""
+        parent = os.path.dirname(os.path.abspath(path))
+        os.makedirs(parent, exist_ok=True)
+        staging = tempfile.mkdtemp(prefix=".skills-", dir=parent)
+        try:
+            for name, array in self._arrays.items():
+                np.save(os.path.join(staging, f"{name}.npy"), array)
+            with open(os.path.join(staging, "vocabulary.txt"), "w", encoding="utf-8") as f:
+                f.write("\n".join(self.vocabulary))
+            with open(os.path.join(staging, "skills.tsv"), "w", encoding="utf-8") as f:
+                f.write("\n".join(f"{skill_id}\t{name}" for skill_id, name in zip(self.skill_ids, self.names)))
+            os.rename(staging, path)
+        except OSError:
+            shutil.rmtree(staging, ignore_errors=True)
+            # Another process finished the same automaton first
+            if not os.path.isdir(path):
+                raise
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> "SkillAutomaton":
+        """Load a saved automaton, memory-mapping its arrays unless mmap is False"""
+        arrays = {
+            name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r" if mmap else None)
+            for name in _ARRAYS
+        }
+        with open(os.path.join(path, "vocabulary.txt"), encoding="utf-8") as f:
+            vocabulary = f.read().split("\n")
+        with open(os.path.join(path, "skills.tsv"), encoding="utf-8") as f:
+            skill_ids, names = zip(*(line.split("\t", 1) for line in f.read().split("\n")))
+        return cls(skill_ids, names, vocabulary, **arrays)
+
+
+def compile_automaton(skills: Sequence[Skill]) -> SkillAutomaton:
+    """Build the automaton for a taxonomy"""
+    token_ids: Dict[str, int] = {}
+    goto: List[Dict[int, int]] = [{}]
+    outputs: List[set] = [set()]
+    for index, skill in enumerate(skills):
+        for term in (skill.name, *skill.aliases):
+            tokens = tokenize(term)
+            if not tokens:
+                continue
+            state = 0
+            for word in tokens:
+                token = token_ids.setdefault(word, len(token_ids))
+                if token not in goto[state]:
+                    goto[state][token] = len(goto)
+                    goto.append({})
+                    outputs.append(set())
+                state = goto[state][token]
+            outputs[state].add(index)
+
+    # Failure links in breadth-first order, so a state's fallback already has its outputs merged
+    fail = [0] * len(goto)
+    queue = deque(goto[0].values())
+    while queue:
+        state = queue.popleft()
+        for token, child in goto[state].items():
+            fallback = fail[state]
+            while fallback and token not in goto[fallback]:
+                fallback = fail[fallback]
+            fail[child] = goto[fallback].get(token, 0)
+            outputs[child] |= outputs[fail[child]]
+            queue.append(child)
+
+    width = len(token_ids)
+    root = np.zeros(width, dtype=np.int32)
+    for token, child in goto[0].items():
+        root[token] = child
+    edges = sorted(
+        (state * width + token, child)
+        for state, transitions in enumerate(goto) if state
+        for token, child in transitions.items()
+    )
+    out_offsets = np.zeros(len(goto) + 1, dtype=np.int32)
+    out_offsets[1:] = np.cumsum([len(found) for found in outputs])
+    return SkillAutomaton(
+        [skill.id for skill in skills],
+        [skill.name for skill in skills],
+        list(token_ids),
+        root=root,
+        fail=np.array(fail, dtype=np.int32),
+        edge_keys=np.array([key for key, _ in edges], dtype=np.int64),
+        edge_next=np.array([child for _, child in edges], dtype=np.int32),
+        out_offsets=out_offsets,
+        out_skills=np.array([i for found in outputs for i in sorted(found)], dtype=np.int32),
+    )
+
+
+def load_or_compile(taxonomy_path: str, cache_dir: str) -> SkillAutomaton:
+    """The automaton for a taxonomy, from the on-disk cache or compiled (and cached) on first use"""
+    path = os.path.join(cache_dir, taxonomy_digest(taxonomy_path))
+    if os.path.isdir(path):
+        try:
+            return SkillAutomaton.load(path)
+        except (OSError, ValueError):
+            logger.warning("Compiled skill automaton at %s is unreadable; recompiling", path, exc_info=True)
+            shutil.rmtree(path, ignore_errors=True)
+
+    automaton = compile_automaton(load_taxonomy(taxonomy_path))
+    try:
+        automaton.save(path)
+    except OSError:
+        logger.warning("Could not cache the compiled skill automaton in %s", cache_dir, exc_info=True)
+    return automaton
+
+
+def get_skill_automaton() -> SkillAutomaton:
+    """The process-wide automaton for the configured taxonomy"""
+    return model_registry.get("skills")
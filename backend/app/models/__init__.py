@@ -1,13 +1,22 @@
 from .user import User
 from .resume import Resume
-from .job import Job, JobMatch
-from .interaction import UserJobInteraction, UserPreference
+from .job import Job, JobArchive, JobMatch, JobSource, JobSignature, JobLSHBucket
+from .interaction import UserJobInteraction, UserJobListEntry, UserInteractionCount, UserPreference
+from .matching import UserMatchState, PipelineWatermark
 
 __all__ = [
     "User",
     "Resume",
     "Job",
+    "JobArchive",
     "JobMatch",
+    "JobSource",
+    "JobSignature",
+    "JobLSHBucket",
     "UserJobInteraction",
+    "UserJobListEntry",
+    "UserInteractionCount",
     "UserPreference",
+    "UserMatchState",
+    "PipelineWatermark",
 ]
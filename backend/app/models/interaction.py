@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, ARRAY
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, ARRAY, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -12,7 +12,7 @@ class UserJobInteraction(Base):
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     job_id = Column(UUID(as_uuid=True), ForeignKey("jobs.id", ondelete="CASCADE"), nullable=False, index=True)
-    interaction_type = Column(String, nullable=False)  # viewed, liked, disliked, saved, applied, dismissed
+    interaction_type = Column(String, nullable=False)  # viewed, liked, disliked, saved, unsaved, applied, dismissed
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
@@ -23,6 +23,49 @@ class UserJobInteraction(Base):
         return f"<UserJobInteraction(user_id={self.user_id}, job_id={self.job_id}, type={self.interaction_type})>"
 
 
+class UserJobListEntry(Base):
+    """
+    Current state of a job in one of a user's lists (saved, applied).
+
+    Holds the newest interaction among the list's states (e.g. saved/unsaved),
+    upserted with every interaction write, so list pages are read straight off
+    ix_user_job_lists_user_state_changed instead of replaying the history.
+    """
+    __tablename__ = "user_job_lists"
+    __table_args__ = (
+        Index("ix_user_job_lists_user_state_changed", "user_id", "state", "changed_at", "job_id"),
+    )
+
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    list_name = Column(String, primary_key=True)  # saved, applied
+    job_id = Column(UUID(as_uuid=True), ForeignKey("jobs.id", ondelete="CASCADE"), primary_key=True, index=True)
+    state = Column(String, nullable=False)  # the newest interaction type: saved, unsaved, applied
+    changed_at = Column(DateTime(timezone=True), nullable=False)
+
+    def __repr__(self):
+        return f"<UserJobListEntry(user_id={self.user_id}, job_id={self.job_id}, state={self.state})>"
+
+
+class UserInteractionCount(Base):
+    """
+    Running count of a user's interactions by type, bumped on every interaction write.
+
+    Counts are historical: interactions removed by a job being deleted are not
+    subtracted, so "applied" keeps counting applications to jobs that are gone.
+    The dashboard's saved count comes from UserJobListEntry instead, since
+    unsaving takes a job back out of the list.
+    """
+    __tablename__ = "user_interaction_counts"
+
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    interaction_type = Column(String, primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    def __repr__(self):
+        return f"<UserInteractionCount(user_id={self.user_id}, type={self.interaction_type}, count={self.count})>"
+
+
 class UserPreference(Base):
     __tablename__ = "user_preferences"
 
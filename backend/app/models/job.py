@@ -1,13 +1,20 @@
 import uuid
-from sqlalchemy import Column, String, Text, Integer, Boolean, Date, DateTime, ForeignKey, ARRAY, Numeric
-from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy import Column, String, Text, Integer, SmallInteger, BigInteger, Boolean, Date, DateTime, ForeignKey, Numeric, Index, LargeBinary
+from sqlalchemy.dialects.postgresql import UUID, JSONB, ARRAY
+from sqlalchemy.orm import relationship, deferred
+from sqlalchemy.sql import func, text
 from pgvector.sqlalchemy import Vector
 from ..database import Base
 from ..config import settings
 
 
+# Full-text document for job search; queries must use this exact expression to hit ix_jobs_search_document
+SEARCH_DOCUMENT_SQL = (
+    "(setweight(to_tsvector('english'::regconfig, title), 'A') || "
+    "setweight(to_tsvector('english'::regconfig, description), 'B'))"
+)
+
+
 class Job(Base):
     __tablename__ = "jobs"
 
@@ -22,7 +29,7 @@ class Job(Base):
     salary_min = Column(Integer, nullable=True)
     salary_max = Column(Integer, nullable=True)
     description = Column(Text, nullable=False)
-    embedding = Column(Vector(settings.EMBEDDING_DIMENSION), nullable=True)
+    embedding = deferred(Column(Vector(settings.EMBEDDING_DIMENSION), nullable=True))  # loaded only when asked for
     skills_required = Column(ARRAY(String), nullable=True)
     posted_date = Column(Date, nullable=True)
     expires_at = Column(Date, nullable=True)
@@ -31,6 +38,65 @@ class Job(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
+    __table_args__ = (
+        # Approximate nearest-neighbour search over live jobs only
+        Index(
+            "ix_jobs_embedding_hnsw",
+            "embedding",
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
+            postgresql_ops={"embedding": "vector_cosine_ops"},
+            postgresql_where=text("is_active = true"),
+        ),
+        # Expiry sweeper: live jobs past expires_at, or past max age when they have none
+        Index("ix_jobs_active_expires_at", "expires_at", postgresql_where=text("is_active = true")),
+        Index(
+            "ix_jobs_active_undated_posted_date",
+            "posted_date",
+            postgresql_where=text("is_active = true AND expires_at IS NULL"),
+        ),
+        # Archiver: jobs deactivated long enough ago
+        Index("ix_jobs_inactive_updated_at", "updated_at", postgresql_where=text("is_active = false")),
+        # Job search filters and full-text query, over live jobs only
+        Index(
+            "ix_jobs_active_skills_required",
+            "skills_required",
+            postgresql_using="gin",
+            postgresql_where=text("is_active = true"),
+        ),
+        Index(
+            "ix_jobs_search_document",
+            text(SEARCH_DOCUMENT_SQL),
+            postgresql_using="gin",
+            postgresql_where=text("is_active = true"),
+        ),
+        Index(
+            "ix_jobs_active_location_trgm",
+            "location",
+            postgresql_using="gin",
+            postgresql_ops={"location": "gin_trgm_ops"},
+            postgresql_where=text("is_active = true"),
+        ),
+        # The exact expressions the salary filters compare (see services.job_search)
+        Index(
+            "ix_jobs_active_salary_upper",
+            text("coalesce(salary_max, salary_min)"),
+            postgresql_where=text("is_active = true"),
+        ),
+        Index(
+            "ix_jobs_active_salary_lower",
+            text("coalesce(salary_min, salary_max)"),
+            postgresql_where=text("is_active = true"),
+        ),
+        # Default search order: newest first
+        Index(
+            "ix_jobs_active_posted_date_id",
+            text("posted_date DESC NULLS LAST"),
+            "id",
+            postgresql_where=text("is_active = true"),
+        ),
+    )
+
     # Relationships
     matches = relationship("JobMatch", back_populates="job", cascade="all, delete-orphan")
     interactions = relationship("UserJobInteraction", back_populates="job", cascade="all, delete-orphan")
@@ -39,6 +105,33 @@ class Job(Base):
         return f"<Job(id={self.id}, title={self.title}, company={self.company})>"
 
 
+class JobArchive(Base):
+    """A retired job moved out of jobs by the expiry sweeper (embedding dropped)"""
+    __tablename__ = "jobs_archive"
+
+    id = Column(UUID(as_uuid=True), primary_key=True)
+    external_job_id = Column(String, nullable=False, index=True)
+    source = Column(String, nullable=False)
+    title = Column(String, nullable=False)
+    company = Column(String, nullable=False)
+    location = Column(String, nullable=True)
+    remote_type = Column(String, nullable=True)
+    employment_type = Column(String, nullable=True)
+    salary_min = Column(Integer, nullable=True)
+    salary_max = Column(Integer, nullable=True)
+    description = Column(Text, nullable=False)
+    skills_required = Column(ARRAY(String), nullable=True)
+    posted_date = Column(Date, nullable=True)
+    expires_at = Column(Date, nullable=True)
+    application_url = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), nullable=True)
+    updated_at = Column(DateTime(timezone=True), nullable=True)
+    archived_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self):
+        return f"<JobArchive(id={self.id}, title={self.title}, company={self.company})>"
+
+
 class JobMatch(Base):
     __tablename__ = "job_matches"
 
@@ -49,9 +142,55 @@ class JobMatch(Base):
     match_reasons = Column(JSONB, nullable=True)  # Explanation of match
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
+    __table_args__ = (
+        # Keyset pagination of the match feed: WHERE user_id = ? ORDER BY match_score DESC, id DESC
+        Index("ix_job_matches_user_score_id", "user_id", "match_score", "id"),
+    )
+
     # Relationships
     user = relationship("User", back_populates="job_matches")
     job = relationship("Job", back_populates="matches")
 
     def __repr__(self):
         return f"<JobMatch(user_id={self.user_id}, job_id={self.job_id}, score={self.match_score})>"
+
+
+class JobSource(Base):
+    """A near-duplicate posting of a job from another source, collapsed into the canonical job"""
+    __tablename__ = "job_sources"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    job_id = Column(UUID(as_uuid=True), ForeignKey("jobs.id", ondelete="CASCADE"), nullable=False, index=True)
+    external_job_id = Column(String, unique=True, nullable=False)
+    source = Column(String, nullable=False)
+    application_url = Column(Text, nullable=True)
+    similarity = Column(Numeric(precision=5, scale=4), nullable=True)  # estimated Jaccard to the canonical job
+    first_seen_at = Column(DateTime(timezone=True), server_default=func.now())
+    last_seen_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self):
+        return f"<JobSource(job_id={self.job_id}, source={self.source}, external_job_id={self.external_job_id})>"
+
+
+class JobSignature(Base):
+    """MinHash signature of a canonical job's text, for near-duplicate detection"""
+    __tablename__ = "job_signatures"
+
+    job_id = Column(UUID(as_uuid=True), ForeignKey("jobs.id", ondelete="CASCADE"), primary_key=True)
+    signature = Column(LargeBinary, nullable=False)  # uint32 array
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    def __repr__(self):
+        return f"<JobSignature(job_id={self.job_id})>"
+
+
+class JobLSHBucket(Base):
+    """LSH band bucket a canonical job's signature falls in"""
+    __tablename__ = "job_lsh_buckets"
+
+    band = Column(SmallInteger, primary_key=True)
+    bucket = Column(BigInteger, primary_key=True)
+    job_id = Column(UUID(as_uuid=True), ForeignKey("jobs.id", ondelete="CASCADE"), primary_key=True, index=True)
+
+    def __repr__(self):
+        return f"<JobLSHBucket(band={self.band}, bucket={self.bucket}, job_id={self.job_id})>"
@@ -0,0 +1,29 @@
+from sqlalchemy import Column, String, DateTime, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+from ..database import Base
+
+
+class UserMatchState(Base):
+    """Which resume version a user's job_matches were last computed from"""
+    __tablename__ = "user_match_state"
+
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    resume_id = Column(UUID(as_uuid=True), ForeignKey("resumes.id", ondelete="SET NULL"), nullable=True)
+    resume_version = Column(DateTime(timezone=True), nullable=True)  # resume updated_at/created_at when matched
+    matched_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    def __repr__(self):
+        return f"<UserMatchState(user_id={self.user_id}, matched_at={self.matched_at})>"
+
+
+class PipelineWatermark(Base):
+    """High-water mark of the last successful run of a background pipeline"""
+    __tablename__ = "pipeline_watermarks"
+
+    name = Column(String, primary_key=True)
+    watermark = Column(DateTime(timezone=True), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    def __repr__(self):
+        return f"<PipelineWatermark(name={self.name}, watermark={self.watermark})>"
@@ -1,7 +1,7 @@
 import uuid
-from sqlalchemy import Column, String, Text, DateTime, ForeignKey, ARRAY
+from sqlalchemy import Column, String, Text, DateTime, ForeignKey, ARRAY, Index
 from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, deferred
 from sqlalchemy.sql import func
 from pgvector.sqlalchemy import Vector
 from ..database import Base
@@ -14,13 +14,18 @@ class Resume(Base):
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     file_path = Column(Text, nullable=False)
+    content_hash = Column(String(64), nullable=True)  # sha256 of the uploaded file
     raw_text = Column(Text, nullable=True)
     parsed_data = Column(JSONB, nullable=True)  # Structured resume data
-    embedding = Column(Vector(settings.EMBEDDING_DIMENSION), nullable=True)  # 384d vector
+    embedding = deferred(Column(Vector(settings.EMBEDDING_DIMENSION), nullable=True))  # 384d vector, loaded only when asked for
     skills = Column(ARRAY(String), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
+    __table_args__ = (
+        Index("ix_resumes_user_id_content_hash", "user_id", "content_hash"),
+    )
+
     # Relationships
     user = relationship("User", back_populates="resumes")
 
@@ -51,3 +51,15 @@ class JobMatchResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class FacetCount(BaseModel):
+    value: str
+    count: int
+
+
+class JobSearchResponse(BaseModel):
+    total: int
+    total_exact: bool
+    results: List[JobResponse]
+    facets: Dict[str, List[FacetCount]]
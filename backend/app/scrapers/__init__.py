@@ -0,0 +1,16 @@
+from .base import BaseScraper, IngestionSink, Page, ScraperRunner, ScrapeStats, TokenBucket, ValidatorStore
+from .adzuna import AdzunaScraper
+from .run import SCRAPERS, scrape
+
+__all__ = [
+    "BaseScraper",
+    "IngestionSink",
+    "Page",
+    "ScraperRunner",
+    "ScrapeStats",
+    "TokenBucket",
+    "ValidatorStore",
+    "AdzunaScraper",
+    "SCRAPERS",
+    "scrape",
+]
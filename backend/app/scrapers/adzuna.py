@@ -0,0 +1,66 @@
+import re
+from typing import List, Optional
+from urllib.parse import urlencode
+
+import httpx
+
+from ..config import settings
+from ..schemas.job import JobCreate
+from .base import BaseScraper, Page
+
+_TAG_RE = re.compile(r"<[^>]+>")
+
+# Adzuna contract_time/contract_type -> Job.employment_type
+EMPLOYMENT_TYPES = {"full_time": "full-time", "part_time": "part-time", "contract": "contract"}
+
+
+def _strip_tags(value: Optional[str]) -> str:
+    return _TAG_RE.sub("", value or "").strip()
+
+
+def _salary(value) -> Optional[int]:
+    return int(value) if value is not None else None
+
+
+class AdzunaScraper(BaseScraper):
+    """Adzuna job search API (https://developer.adzuna.com)"""
+
+    source = "adzuna"
+    base_url = "https://api.adzuna.com/v1/api"
+
+    def __init__(self, base_url: Optional[str] = None, max_pages: Optional[int] = None, query: Optional[str] = None):
+        super().__init__(base_url=base_url, max_pages=max_pages or settings.ADZUNA_MAX_PAGES)
+        self.query = query if query is not None else settings.ADZUNA_QUERY
+        self.rate_per_second = settings.ADZUNA_REQUESTS_PER_MINUTE / 60
+        self.burst = 1
+
+    def page(self, number: int) -> Page:
+        url = f"{self.base_url}/jobs/{settings.ADZUNA_COUNTRY}/search/{number}"
+        params = {"results_per_page": settings.ADZUNA_RESULTS_PER_PAGE, "content-type": "application/json"}
+        if self.query:
+            params["what"] = self.query
+        # Every parameter that shapes the page, so changing one doesn't reuse another page's validators
+        key = f"{url}?{urlencode(sorted(params.items()))}"
+        return Page(
+            url=url,
+            params={"app_id": settings.ADZUNA_APP_ID, "app_key": settings.ADZUNA_APP_KEY, **params},
+            key=key,
+        )
+
+    def parse(self, response: httpx.Response) -> List[JobCreate]:
+        records = []
+        for result in response.json().get("results", []):
+            records.append(JobCreate(
+                external_job_id=f"adzuna-{result['id']}",
+                source=self.source,
+                title=_strip_tags(result.get("title")),
+                company=(result.get("company") or {}).get("display_name") or "Unknown",
+                location=(result.get("location") or {}).get("display_name"),
+                employment_type=EMPLOYMENT_TYPES.get(result.get("contract_type") or result.get("contract_time")),
+                salary_min=_salary(result.get("salary_min")),
+                salary_max=_salary(result.get("salary_max")),
+                description=_strip_tags(result.get("description")),
+                posted_date=(result.get("created") or "")[:10] or None,
+                application_url=result.get("redirect_url"),
+            ))
+        return records
@@ -0,0 +1,342 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+import httpx
+
+from ..config import settings
+from ..database import SessionLocal
+from ..schemas.job import JobCreate
+from ..services.job_ingestion import JobIngester
+
+logger = logging.getLogger(__name__)
+
+# Statuses worth retrying after a pause
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+MAX_RETRIES = 2
+
+# Called once a page's records are durably stored
+Committed = Callable[[], Awaitable[None]]
+# Takes a page's records and calls `committed` once they are stored (possibly later, e.g. on close)
+Sink = Callable[[List[JobCreate], Committed], Awaitable[None]]
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """The pooled client every scraper in a run shares (HTTP/2 where the server offers it)"""
+    return httpx.AsyncClient(
+        http2=settings.SCRAPER_HTTP2,
+        limits=httpx.Limits(
+            max_connections=settings.SCRAPER_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.SCRAPER_MAX_CONNECTIONS,
+            keepalive_expiry=30,
+        ),
+        timeout=settings.SCRAPER_TIMEOUT_SECONDS,
+        headers={"User-Agent": settings.SCRAPER_USER_AGENT},
+        follow_redirects=True,
+    )
+
+
+class TokenBucket:
+    """Allows `rate` requests per second on average, with bursts of up to `burst`"""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class ValidatorStore:
+    """In-process ETag/Last-Modified store, keyed by page"""
+
+    def __init__(self):
+        self._validators: Dict[str, Dict[str, str]] = {}
+
+    async def get(self, key: str) -> Optional[Dict[str, str]]:
+        return self._validators.get(key)
+
+    async def set(self, key: str, validators: Dict[str, str]) -> None:
+        self._validators[key] = validators
+
+
+class RedisValidatorStore(ValidatorStore):
+    """Validators kept in Redis so they survive between scrape runs; falls back to memory"""
+
+    def __init__(self, url: str, ttl_seconds: int):
+        super().__init__()
+        import redis.asyncio
+
+        self._redis = redis.asyncio.Redis.from_url(url, socket_timeout=1, socket_connect_timeout=1)
+        self.ttl_seconds = ttl_seconds
+
+    async def get(self, key: str) -> Optional[Dict[str, str]]:
+        try:
+            raw = await self._redis.hgetall(f"scrape:validators:{key}")
+        except Exception:
+            logger.debug("Validator store Redis unavailable", exc_info=True)
+            return await super().get(key)
+        return {k.decode(): v.decode() for k, v in raw.items()} or None
+
+    async def set(self, key: str, validators: Dict[str, str]) -> None:
+        await super().set(key, validators)
+        try:
+            redis_key = f"scrape:validators:{key}"
+            async with self._redis.pipeline(transaction=True) as pipe:
+                await pipe.delete(redis_key).hset(redis_key, mapping=validators).expire(
+                    redis_key, self.ttl_seconds
+                ).execute()
+        except Exception:
+            logger.debug("Validator store Redis unavailable", exc_info=True)
+
+    async def close(self) -> None:
+        await self._redis.close()
+
+
+@dataclass
+class Page:
+    """One listing page request"""
+    url: str
+    params: Dict[str, object] = field(default_factory=dict)
+    # Identifies the page for conditional requests; must not contain credentials
+    key: str = ""
+
+
+@dataclass
+class ScrapeStats:
+    source: str
+    pages: int = 0
+    not_modified: int = 0
+    empty: int = 0
+    errors: int = 0
+    postings: int = 0
+    elapsed_s: float = 0.0
+
+    def as_dict(self) -> Dict[str, object]:
+        return {
+            "source": self.source,
+            "pages": self.pages,
+            "not_modified": self.not_modified,
+            "empty": self.empty,
+            "errors": self.errors,
+            "postings": self.postings,
+            "elapsed_s": round(self.elapsed_s, 3),
+            "postings_per_minute": round(self.postings / self.elapsed_s * 60, 1) if self.elapsed_s else 0.0,
+        }
+
+
+class BaseScraper:
+    """
+    A paginated job source.
+
+    Subclasses describe how to request page N and how to parse a response into
+    JobCreate records; ScraperRunner does the fetching, rate limiting,
+    conditional requests and ingestion. Pages are requested in order until one
+    comes back empty or `max_pages` is reached.
+    """
+
+    source: str = ""
+    base_url: str = ""
+    rate_per_second: float = 2.0
+    burst: int = 4
+    concurrency: int = 4
+    max_pages: int = 20
+
+    def __init__(self, base_url: Optional[str] = None, max_pages: Optional[int] = None):
+        if base_url is not None:
+            self.base_url = base_url.rstrip("/")
+        if max_pages is not None:
+            self.max_pages = max_pages
+
+    def page(self, number: int) -> Page:
+        raise NotImplementedError
+
+    def parse(self, response: httpx.Response) -> List[JobCreate]:
+        raise NotImplementedError
+
+
+class IngestionSink:
+    """
+    Streams scraped records into JobIngester as pages arrive.
+
+    The ingester commits in batches spanning many pages, so each page's
+    `committed` callback is held until every batch holding its records has
+    been written, and dropped if any of them failed; the page is then fetched
+    again next run rather than answered 304 with its postings missing.
+    """
+
+    def __init__(self, batch_size: Optional[int] = None):
+        self.db = SessionLocal()
+        self.ingester = JobIngester(self.db, batch_size=batch_size)
+        # The ingester and its session are used from one worker thread at a time
+        self._lock = asyncio.Lock()
+        # (start, end) posting numbers of each page still waiting on a flush, with its callback
+        self._waiting: List[Tuple[int, int, Committed]] = []
+        self.pages_failed = 0
+
+    async def __call__(self, records: List[JobCreate], committed: Committed) -> None:
+        async with self._lock:
+            start = self.ingester.received
+            await asyncio.to_thread(self.ingester.add_many, records)
+            self._waiting.append((start, self.ingester.received, committed))
+            await self._settle()
+
+    async def _settle(self) -> None:
+        """Run the callbacks of pages whose postings have all been through a flush"""
+        waiting = []
+        for start, end, committed in self._waiting:
+            if end > self.ingester.settled:
+                waiting.append((start, end, committed))
+            elif any(start < failed_end and failed_start < end
+                     for failed_start, failed_end in self.ingester.failed_ranges):
+                self.pages_failed += 1
+            else:
+                await committed()
+        self._waiting = waiting
+
+    async def close(self) -> Dict[str, object]:
+        async with self._lock:
+            try:
+                await asyncio.to_thread(self.ingester.flush)
+                await self._settle()
+                return {**self.ingester.stats(), "pages_failed": self.pages_failed}
+            finally:
+                self.db.close()
+
+
+class ScraperRunner:
+    """
+    Runs scrapers concurrently over one pooled HTTP client.
+
+    Each source gets a token bucket (shared by every scraper of that source in
+    the run) and fetches at most `concurrency` pages at a time. Pages are
+    requested with the ETag/Last-Modified seen last time and skipped on 304;
+    a page's validators are only stored once the sink reports its records
+    committed.
+    """
+
+    def __init__(
+        self,
+        sink: Sink,
+        client: Optional[httpx.AsyncClient] = None,
+        validators: Optional[ValidatorStore] = None,
+    ):
+        self.sink = sink
+        self.client = client
+        self.validators = validators or ValidatorStore()
+        self._owns_client = client is None
+        self._buckets: Dict[str, TokenBucket] = {}
+
+    async def __aenter__(self) -> "ScraperRunner":
+        if self.client is None:
+            self.client = create_http_client()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        if self._owns_client and self.client is not None:
+            await self.client.aclose()
+            self.client = None
+
+    def _bucket(self, scraper: BaseScraper) -> TokenBucket:
+        if scraper.source not in self._buckets:
+            self._buckets[scraper.source] = TokenBucket(scraper.rate_per_second, scraper.burst)
+        return self._buckets[scraper.source]
+
+    async def run_all(self, scrapers: Sequence[BaseScraper]) -> List[ScrapeStats]:
+        return list(await asyncio.gather(*(self.run(scraper) for scraper in scrapers)))
+
+    async def run(self, scraper: BaseScraper) -> ScrapeStats:
+        stats = ScrapeStats(scraper.source)
+        started = time.perf_counter()
+        semaphore = asyncio.Semaphore(scraper.concurrency)
+        exhausted = asyncio.Event()
+        tasks = []
+
+        for number in range(1, scraper.max_pages + 1):
+            await semaphore.acquire()
+            if exhausted.is_set():
+                semaphore.release()
+                break
+            tasks.append(asyncio.create_task(self._fetch_page(scraper, number, semaphore, exhausted, stats)))
+        await asyncio.gather(*tasks)
+
+        stats.elapsed_s = time.perf_counter() - started
+        return stats
+
+    async def _fetch_page(
+        self,
+        scraper: BaseScraper,
+        number: int,
+        semaphore: asyncio.Semaphore,
+        exhausted: asyncio.Event,
+        stats: ScrapeStats,
+    ) -> None:
+        try:
+            page = scraper.page(number)
+            key = f"{scraper.source}:{page.key or page.url}"
+            response = await self._get(scraper, page, await self.validators.get(key))
+            stats.pages += 1
+            if response.status_code == 304:
+                stats.not_modified += 1
+                return
+            response.raise_for_status()
+
+            records = scraper.parse(response)
+            if not records:
+                stats.empty += 1
+                exhausted.set()
+                return
+            validators = {
+                header: response.headers[header]
+                for header in ("etag", "last-modified")
+                if header in response.headers
+            }
+
+            async def committed() -> None:
+                if validators:
+                    await self.validators.set(key, validators)
+
+            await self.sink(records, committed)
+            stats.postings += len(records)
+        except Exception:
+            stats.errors += 1
+            logger.warning("Failed to scrape %s page %d", scraper.source, number, exc_info=True)
+        finally:
+            semaphore.release()
+
+    async def _get(self, scraper: BaseScraper, page: Page, validators: Optional[Dict[str, str]]) -> httpx.Response:
+        headers = {}
+        if validators:
+            if "etag" in validators:
+                headers["If-None-Match"] = validators["etag"]
+            if "last-modified" in validators:
+                headers["If-Modified-Since"] = validators["last-modified"]
+
+        bucket = self._bucket(scraper)
+        for attempt in range(MAX_RETRIES + 1):
+            await bucket.acquire()
+            response = await self.client.get(page.url, params=page.params, headers=headers)
+            if response.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                return response
+            await asyncio.sleep(_retry_delay(response, attempt))
+        return response
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    retry_after = response.headers.get("retry-after", "")
+    if retry_after.isdigit():
+        return min(float(retry_after), 60.0)
+    return 2.0 ** attempt
@@ -0,0 +1,31 @@
+from typing import Dict, List, Optional, Sequence
+
+from ..config import settings
+from .adzuna import AdzunaScraper
+from .base import IngestionSink, RedisValidatorStore, ScraperRunner
+
+SCRAPERS = {
+    "adzuna": AdzunaScraper,
+}
+
+
+def configured_sources() -> List[str]:
+    """Sources whose credentials are set"""
+    sources = []
+    if settings.ADZUNA_APP_ID and settings.ADZUNA_APP_KEY:
+        sources.append("adzuna")
+    return sources
+
+
+async def scrape(sources: Optional[Sequence[str]] = None) -> Dict[str, object]:
+    """Scrape the given (default: all configured) sources into the jobs table"""
+    sources = list(sources) if sources is not None else configured_sources()
+    sink = IngestionSink()
+    validators = RedisValidatorStore(settings.REDIS_URL, settings.SCRAPER_VALIDATOR_TTL_SECONDS)
+    try:
+        async with ScraperRunner(sink, validators=validators) as runner:
+            stats = await runner.run_all([SCRAPERS[source]() for source in sources])
+    finally:
+        ingestion = await sink.close()
+        await validators.close()
+    return {"sources": [s.as_dict() for s in stats], "ingestion": ingestion}
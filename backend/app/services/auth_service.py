@@ -1,32 +1,51 @@
 from datetime import datetime, timedelta
 from typing import Optional
 from jose import JWTError, jwt
-from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 
 from ..config import settings
-from ..database import get_db
+from ..database import get_async_db
 from ..models.user import User
 from ..schemas.user import TokenData
-
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from .password_hasher import PasswordHasherBusyError, password_hasher
+from .user_cache import UserPrincipal, user_cache
 
 # OAuth2 scheme
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
 
-def hash_password(password: str) -> str:
-    """Hash a password"""
-    return pwd_context.hash(password)
+async def hash_password(password: str) -> str:
+    """Hash a password on the password hashing pool
+
+    Raises a 503 when the pool is saturated.
+    """
+    try:
+        return await password_hasher.hash(password)
+    except PasswordHasherBusyError:
+        raise _busy_exception()
+
+
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password against its hash on the password hashing pool
+
+    Raises a 503 when the pool is saturated.
+    """
+    try:
+        return await password_hasher.verify(plain_password, hashed_password)
+    except PasswordHasherBusyError:
+        raise _busy_exception()
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a password against its hash"""
-    return pwd_context.verify(plain_password, hashed_password)
+def _busy_exception() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Too many authentication requests, please retry shortly",
+        headers={"Retry-After": "1"},
+    )
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -42,31 +61,36 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     return encoded_jwt
 
 
-def get_user_by_email(db: Session, email: str) -> Optional[User]:
+async def get_user_by_email(db: AsyncSession, email: str) -> Optional[User]:
     """Get a user by email"""
-    return db.query(User).filter(User.email == email).first()
+    return (await db.execute(select(User).where(User.email == email))).scalar_one_or_none()
 
 
-def get_user_by_id(db: Session, user_id: UUID) -> Optional[User]:
+async def get_user_by_id(db: AsyncSession, user_id: UUID) -> Optional[User]:
     """Get a user by ID"""
-    return db.query(User).filter(User.id == user_id).first()
+    return await db.get(User, user_id)
 
 
-def authenticate_user(db: Session, email: str, password: str) -> Optional[User]:
+async def authenticate_user(db: AsyncSession, email: str, password: str) -> Optional[User]:
     """Authenticate a user"""
-    user = get_user_by_email(db, email)
+    user = await get_user_by_email(db, email)
     if not user:
         return None
-    if not verify_password(password, user.password_hash):
+    # Return the connection to the pool while bcrypt runs; `user` stays loaded, detached
+    await db.close()
+    if not await verify_password(password, user.password_hash):
         return None
     return user
 
 
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db)
-) -> User:
-    """Get the current authenticated user from JWT token"""
+    db: AsyncSession = Depends(get_async_db)
+) -> UserPrincipal:
+    """Get the current authenticated user from JWT token
+
+    Served from the user principal cache; the users table is only queried on a miss.
+    """
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -82,7 +106,14 @@ async def get_current_user(
     except (JWTError, ValueError):
         raise credentials_exception
 
-    user = get_user_by_id(db, user_id=token_data.user_id)
+    principal = await user_cache.get(token_data.user_id)
+    if principal is not None:
+        return principal
+
+    user = await db.get(User, token_data.user_id)
     if user is None:
         raise credentials_exception
-    return user
+
+    principal = UserPrincipal.from_user(user)
+    await user_cache.set(principal)
+    return principal
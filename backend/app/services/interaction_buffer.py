@@ -0,0 +1,183 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Deque, Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy.exc import IntegrityError
+
+from ..config import settings
+from ..database import AsyncSessionLocal
+from ..models.interaction import UserJobInteraction
+from .user_stats import record_interactions
+
+logger = logging.getLogger(__name__)
+
+SHUTDOWN_TIMEOUT_SECONDS = 10
+
+
+@dataclass
+class _Pending:
+    user_id: UUID
+    job_id: UUID
+    interaction_type: str
+    # Set for events whose caller waits for the write to commit
+    committed: Optional[asyncio.Future] = None
+    # When the event happened; stamped at enqueue so events sharing a batch keep their order
+    created_at: Optional[datetime] = None
+
+
+class InteractionBuffer:
+    """
+    Batches user/job interaction writes off the request path.
+
+    Routes queue events in memory and a single background flusher writes them
+    every `flush_interval_ms`, or as soon as `batch_size` are waiting, in one
+    transaction per batch. `enqueue` is fire-and-forget (used for views) and
+    drops events once `max_size` are queued; `submit` waits until its event is
+    committed, so explicit actions like saving a job keep read-your-writes
+    while still sharing a transaction with concurrent events. `stop` drains
+    everything that is queued.
+
+    Events are timestamped when queued, strictly increasing per process, rather
+    than by the batch transaction's now(), so a save and an unsave written in
+    the same batch are still ordered the way they happened.
+    """
+
+    def __init__(self, flush_interval_ms: int, batch_size: int, max_size: int):
+        self.flush_interval = flush_interval_ms / 1000
+        self.batch_size = batch_size
+        self.max_size = max_size
+        self._queue: Deque[_Pending] = deque()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._closing = False
+        self._last_stamp = datetime.min.replace(tzinfo=timezone.utc)
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+        self.batches = 0
+        self.flush_ms_total = 0.0
+
+    def _ensure_started(self) -> None:
+        if self._task is None or self._task.done():
+            self._closing = False
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def start(self) -> None:
+        """Start the background flusher (also started lazily by the first event)"""
+        self._ensure_started()
+
+    def enqueue(self, user_id: UUID, job_id: UUID, interaction_type: str) -> bool:
+        """Queue an event without waiting for it; False if the buffer is full and it was dropped"""
+        self._ensure_started()
+        if len(self._queue) >= self.max_size:
+            self.dropped += 1
+            return False
+        self._push(_Pending(user_id, job_id, interaction_type))
+        return True
+
+    async def submit(self, user_id: UUID, job_id: UUID, interaction_type: str) -> None:
+        """Queue an event and wait until the batch containing it has committed"""
+        self._ensure_started()
+        committed = asyncio.get_running_loop().create_future()
+        self._push(_Pending(user_id, job_id, interaction_type, committed))
+        await committed
+
+    def _push(self, pending: _Pending) -> None:
+        stamp = datetime.now(timezone.utc)
+        if stamp <= self._last_stamp:
+            stamp = self._last_stamp + timedelta(microseconds=1)
+        pending.created_at = self._last_stamp = stamp
+        self._queue.append(pending)
+        if len(self._queue) >= self.batch_size:
+            self._wakeup.set()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+            while self._queue:
+                batch = [self._queue.popleft() for _ in range(min(self.batch_size, len(self._queue)))]
+                await self._flush(batch)
+                if not self._closing and len(self._queue) < self.batch_size:
+                    break
+
+            if self._closing and not self._queue:
+                return
+
+    async def _flush(self, batch: List[_Pending]) -> None:
+        started = time.perf_counter()
+        try:
+            await self._write(batch)
+        except IntegrityError:
+            # Usually a job deleted since the event was queued; keep the rest of the batch
+            for pending in batch:
+                try:
+                    await self._write([pending])
+                except Exception as exc:
+                    logger.warning("Dropped %s interaction of user %s with job %s: %s", pending.interaction_type,
+                                   pending.user_id, pending.job_id, exc.__class__.__name__, exc_info=True)
+                    self._fail([pending], exc)
+        except Exception as exc:
+            logger.exception("Failed to write %d interactions", len(batch))
+            self._fail(batch, exc)
+        self.batches += 1
+        self.flush_ms_total += (time.perf_counter() - started) * 1000
+
+    async def _write(self, batch: List[_Pending]) -> None:
+        async with AsyncSessionLocal() as db:
+            await record_interactions(db, [
+                UserJobInteraction(user_id=p.user_id, job_id=p.job_id, interaction_type=p.interaction_type,
+                                   created_at=p.created_at)
+                for p in batch
+            ])
+            await db.commit()
+        self.written += len(batch)
+        for pending in batch:
+            if pending.committed is not None and not pending.committed.done():
+                pending.committed.set_result(None)
+
+    def _fail(self, batch: List[_Pending], exc: Exception) -> None:
+        self.failed += len(batch)
+        for pending in batch:
+            if pending.committed is not None and not pending.committed.done():
+                pending.committed.set_exception(exc)
+
+    async def stop(self) -> None:
+        """Flush everything queued and stop the flusher"""
+        if self._task is None:
+            return
+        self._closing = True
+        self._wakeup.set()
+        try:
+            await asyncio.wait_for(self._task, timeout=SHUTDOWN_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            logger.error("Interaction buffer drain timed out with %d events queued", len(self._queue))
+            self._task.cancel()
+        self._task = None
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "queued": len(self._queue),
+            "written": self.written,
+            "dropped": self.dropped,
+            "failed": self.failed,
+            "batches": self.batches,
+            "avg_flush_ms": round(self.flush_ms_total / self.batches, 3) if self.batches else 0.0,
+        }
+
+
+interaction_buffer = InteractionBuffer(
+    flush_interval_ms=settings.INTERACTION_FLUSH_INTERVAL_MS,
+    batch_size=settings.INTERACTION_BATCH_SIZE,
+    max_size=settings.INTERACTION_BUFFER_SIZE,
+)
@@ -0,0 +1,212 @@
+import uuid
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+import numpy as np
+from psycopg2.extras import execute_values
+from sqlalchemy import bindparam, text
+from sqlalchemy.dialects.postgresql import ARRAY, BIGINT, SMALLINT
+from sqlalchemy.orm import Session
+
+from ..config import settings
+from ..ml.minhash import MinHasher, posting_text
+from ..schemas.job import JobCreate
+
+_hasher: Optional[MinHasher] = None
+
+
+def get_hasher() -> MinHasher:
+    """The process-wide MinHasher configured from settings"""
+    global _hasher
+    if _hasher is None:
+        _hasher = MinHasher(num_perm=settings.JOB_DEDUP_NUM_PERM, bands=settings.JOB_DEDUP_BANDS)
+    return _hasher
+
+
+def job_signature(hasher: MinHasher, job) -> np.ndarray:
+    return hasher.signature(posting_text(job.title, job.company, job.description))
+
+
+@dataclass
+class Partition:
+    """An ingestion batch split into postings to store and near-duplicates to collapse"""
+    # (job id, posting, signature); the id is the existing row's for known postings
+    canonical: List[Tuple[UUID, JobCreate, np.ndarray]] = field(default_factory=list)
+    # (canonical job id, posting, estimated similarity or None if already known)
+    duplicates: List[Tuple[UUID, JobCreate, Optional[float]]] = field(default_factory=list)
+
+
+class JobDeduplicator:
+    """
+    Collapses near-duplicate postings into one canonical job before storage.
+
+    Canonical jobs' MinHash signatures and LSH band buckets are persisted in
+    job_signatures/job_lsh_buckets, so a new posting is only compared with the
+    active jobs sharing one of its buckets (and with earlier postings of the
+    same batch), never with the whole table. A posting whose estimated Jaccard
+    similarity to a candidate reaches `threshold` is recorded in job_sources
+    against that job instead of becoming a job of its own.
+    """
+
+    def __init__(self, db: Session, hasher: Optional[MinHasher] = None, threshold: Optional[float] = None):
+        self.db = db
+        self.hasher = hasher or get_hasher()
+        self.threshold = threshold if threshold is not None else settings.JOB_DEDUP_THRESHOLD
+
+    def partition(self, postings: Sequence[JobCreate]) -> Partition:
+        result = Partition()
+        external_ids = [p.external_job_id for p in postings]
+        known_jobs = dict(self.db.execute(
+            text("SELECT external_job_id, id FROM jobs WHERE external_job_id = ANY(:ids)"),
+            {"ids": external_ids}
+        ).all())
+        known_aliases = dict(self.db.execute(
+            text("SELECT external_job_id, job_id FROM job_sources WHERE external_job_id = ANY(:ids)"),
+            {"ids": external_ids}
+        ).all())
+
+        new = []
+        for posting in postings:
+            if posting.external_job_id in known_jobs:
+                job_id = known_jobs[posting.external_job_id]
+                result.canonical.append((job_id, posting, job_signature(self.hasher, posting)))
+            elif posting.external_job_id in known_aliases:
+                result.duplicates.append((known_aliases[posting.external_job_id], posting, None))
+            else:
+                new.append((posting, job_signature(self.hasher, posting)))
+        if not new:
+            return result
+
+        keys = {id(posting): self.hasher.band_keys(signature) for posting, signature in new}
+        stored = self._candidates(keys.values())
+
+        # Postings accepted earlier in this batch, by bucket
+        batch_buckets: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+        batch_signatures: List[Tuple[UUID, np.ndarray]] = []
+        for job_id, _, signature in result.canonical:
+            self._add_to_batch(batch_buckets, batch_signatures, job_id, signature)
+
+        for posting, signature in new:
+            best_id, best_similarity = None, 0.0
+            candidates: Dict[UUID, np.ndarray] = {}
+            for band, bucket in enumerate(keys[id(posting)]):
+                candidates.update(stored.get((band, bucket), ()))
+                candidates.update(batch_signatures[i] for i in batch_buckets.get((band, bucket), ()))
+            for job_id, candidate in candidates.items():
+                similarity = self.hasher.similarity(signature, candidate)
+                if similarity > best_similarity:
+                    best_id, best_similarity = job_id, similarity
+
+            if best_id is not None and best_similarity >= self.threshold:
+                result.duplicates.append((best_id, posting, best_similarity))
+            else:
+                job_id = uuid.uuid4()
+                result.canonical.append((job_id, posting, signature))
+                self._add_to_batch(batch_buckets, batch_signatures, job_id, signature)
+        return result
+
+    def _add_to_batch(self, batch_buckets, batch_signatures, job_id: UUID, signature: np.ndarray) -> None:
+        index = len(batch_signatures)
+        batch_signatures.append((job_id, signature))
+        for band, bucket in enumerate(self.hasher.band_keys(signature)):
+            batch_buckets[(band, bucket)].append(index)
+
+    def _candidates(self, keys) -> Dict[Tuple[int, int], List[Tuple[UUID, np.ndarray]]]:
+        """Active stored jobs sharing a bucket with any of `keys`, with their signatures"""
+        bands, buckets = [], []
+        for posting_keys in keys:
+            for band, bucket in enumerate(posting_keys):
+                bands.append(band)
+                buckets.append(bucket)
+        rows = self.db.execute(
+            text("""
+                SELECT b.band, b.bucket, b.job_id, s.signature
+                FROM unnest(:bands, :buckets) AS k(band, bucket)
+                JOIN job_lsh_buckets b ON b.band = k.band AND b.bucket = k.bucket
+                JOIN job_signatures s ON s.job_id = b.job_id
+                JOIN jobs j ON j.id = b.job_id
+                WHERE j.is_active
+            """).bindparams(
+                bindparam("bands", type_=ARRAY(SMALLINT)),
+                bindparam("buckets", type_=ARRAY(BIGINT)),
+            ),
+            {"bands": bands, "buckets": buckets}
+        ).all()
+
+        signatures: Dict[UUID, np.ndarray] = {}
+        candidates: Dict[Tuple[int, int], List[Tuple[UUID, np.ndarray]]] = defaultdict(list)
+        for band, bucket, job_id, raw in rows:
+            if job_id not in signatures:
+                signatures[job_id] = np.frombuffer(raw, dtype=np.uint32)
+            candidates[(band, bucket)].append((job_id, signatures[job_id]))
+        return candidates
+
+    def store_signatures(self, signatures: Dict[UUID, np.ndarray]) -> None:
+        """Replace the persisted signatures and buckets of the given jobs (caller commits)"""
+        if not signatures:
+            return
+        job_ids = [str(job_id) for job_id in signatures]
+        self.db.execute(text("DELETE FROM job_lsh_buckets WHERE job_id = ANY(CAST(:ids AS uuid[]))"), {"ids": job_ids})
+        with self.db.connection().connection.cursor() as cursor:
+            execute_values(
+                cursor,
+                """
+                INSERT INTO job_signatures (job_id, signature) VALUES %s
+                ON CONFLICT (job_id) DO UPDATE SET signature = EXCLUDED.signature, updated_at = now()
+                """,
+                [(str(job_id), signature.astype(np.uint32).tobytes()) for job_id, signature in signatures.items()],
+                template="(%s::uuid, %s)",
+                page_size=1000,
+            )
+            execute_values(
+                cursor,
+                "INSERT INTO job_lsh_buckets (band, bucket, job_id) VALUES %s ON CONFLICT DO NOTHING",
+                [
+                    (band, bucket, str(job_id))
+                    for job_id, signature in signatures.items()
+                    for band, bucket in enumerate(self.hasher.band_keys(signature))
+                ],
+                template="(%s, %s, %s::uuid)",
+                page_size=5000,
+            )
+
+    def store_duplicates(self, duplicates: Sequence[Tuple[UUID, JobCreate, Optional[float]]]) -> None:
+        """Record near-duplicate postings as alternate sources of their canonical jobs (caller commits)"""
+        if not duplicates:
+            return
+        with self.db.connection().connection.cursor() as cursor:
+            execute_values(
+                cursor,
+                """
+                INSERT INTO job_sources (id, job_id, external_job_id, source, application_url, similarity) VALUES %s
+                ON CONFLICT (external_job_id) DO UPDATE SET
+                    application_url = EXCLUDED.application_url,
+                    last_seen_at = now()
+                """,
+                [
+                    (str(uuid.uuid4()), str(job_id), p.external_job_id, p.source, p.application_url, similarity)
+                    for job_id, p, similarity in duplicates
+                ],
+                template="(%s::uuid, %s::uuid, %s, %s, %s, %s)",
+                page_size=1000,
+            )
+
+
+def index_jobs(db: Session, chunk_size: int = 1000) -> int:
+    """Compute and store signatures for active jobs that don't have one yet (e.g. after migrating)"""
+    dedup = JobDeduplicator(db)
+    total = 0
+    while True:
+        rows = db.execute(text("""
+            SELECT j.id, j.title, j.company, j.description
+            FROM jobs j LEFT JOIN job_signatures s ON s.job_id = j.id
+            WHERE j.is_active AND s.job_id IS NULL
+            LIMIT :limit
+        """), {"limit": chunk_size}).all()
+        if not rows:
+            return total
+        dedup.store_signatures({row.id: job_signature(dedup.hasher, row) for row in rows})
+        db.commit()
+        total += len(rows)
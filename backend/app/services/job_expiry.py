@@ -0,0 +1,166 @@
+import time
+from typing import Dict, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from ..config import settings
+from .response_cache import job_key, response_cache
+
+# Interactions that keep an inactive job in jobs, so users' saved/applied lists still resolve it
+RETAINED_INTERACTIONS = ("saved", "unsaved", "applied")
+
+ARCHIVE_COLUMNS = (
+    "id", "external_job_id", "source", "title", "company", "location", "remote_type", "employment_type",
+    "salary_min", "salary_max", "description", "skills_required", "posted_date", "expires_at",
+    "application_url", "created_at", "updated_at",
+)
+
+
+def expired_sql(expires_at: str, posted_date: str, max_age_days: str) -> str:
+    """
+    SQL condition that a posting has expired: past expires_at, or max_age_days
+    after posted_date when it has no expires_at.
+
+    Shared with the ingestion upsert so a re-scraped posting gets the same
+    is_active the sweeper would give it, instead of being revived every scrape.
+    """
+    return f"({expires_at} < current_date OR ({expires_at} IS NULL AND {posted_date} < current_date - {max_age_days}))"
+
+
+_DEACTIVATE_SQL = text("""
+    WITH batch AS (
+        SELECT id FROM jobs
+        WHERE is_active
+          AND {expired}
+        LIMIT :batch_size
+        FOR UPDATE SKIP LOCKED
+    ), deactivated AS (
+        UPDATE jobs SET is_active = false, updated_at = now()
+        FROM batch WHERE jobs.id = batch.id
+        RETURNING jobs.id
+    ), purged AS (
+        DELETE FROM job_matches USING deactivated WHERE job_matches.job_id = deactivated.id
+        RETURNING job_matches.user_id
+    )
+    SELECT
+        (SELECT count(*) FROM deactivated),
+        (SELECT count(*) FROM purged),
+        (SELECT array_agg(id) FROM deactivated),
+        (SELECT array_agg(DISTINCT user_id) FROM purged)
+""".format(expired=expired_sql("expires_at", "posted_date", "CAST(:max_age_days AS integer)")))
+
+_ARCHIVE_SQL = text("""
+    WITH batch AS (
+        SELECT id FROM jobs
+        WHERE NOT is_active
+          AND updated_at < now() - make_interval(days => CAST(:after_days AS integer))
+          AND NOT EXISTS (
+            SELECT 1 FROM user_job_interactions i
+            WHERE i.job_id = jobs.id AND i.interaction_type = ANY(:retained)
+          )
+        LIMIT :batch_size
+        FOR UPDATE SKIP LOCKED
+    ), moved AS (
+        DELETE FROM jobs USING batch WHERE jobs.id = batch.id
+        RETURNING {returning}
+    ), archived AS (
+        INSERT INTO jobs_archive ({columns})
+        SELECT {columns} FROM moved
+        ON CONFLICT (id) DO NOTHING
+    )
+    SELECT count(*) FROM moved
+""".format(
+    columns=", ".join(ARCHIVE_COLUMNS),
+    returning=", ".join(f"jobs.{c}" for c in ARCHIVE_COLUMNS),
+))
+
+
+def _timings(batch_ms: List[float]) -> Dict[str, float]:
+    ordered = sorted(batch_ms)
+    if not ordered:
+        return {"batches": 0, "total_ms": 0.0, "max_batch_ms": 0.0, "p99_batch_ms": 0.0}
+    return {
+        "batches": len(ordered),
+        "total_ms": round(sum(ordered), 1),
+        "max_batch_ms": round(ordered[-1], 2),
+        "p99_batch_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))], 2),
+    }
+
+
+def deactivate_expired_jobs(
+    db: Session,
+    batch_size: Optional[int] = None,
+    max_age_days: Optional[int] = None,
+) -> Dict[str, object]:
+    """
+    Deactivate live jobs past expires_at (or older than max_age_days when undated) and purge their matches.
+
+    Works in short batches, each its own transaction: rows are claimed with
+    FOR UPDATE SKIP LOCKED so ingestion writing the same jobs is never blocked
+    behind a sweep, and row locks are held only for one batch. Deactivated jobs
+    drop out of the partial HNSW index and every active-jobs query immediately;
+    their cached detail responses are dropped and affected users' match feeds
+    get a new version.
+    """
+    batch_size = batch_size or settings.JOB_SWEEP_BATCH_SIZE
+    max_age_days = max_age_days if max_age_days is not None else settings.JOB_MAX_AGE_DAYS
+    batch_ms = []
+    deactivated = 0
+    purged_matches = 0
+    while True:
+        started = time.perf_counter()
+        jobs, matches, job_ids, user_ids = db.execute(
+            _DEACTIVATE_SQL, {"batch_size": batch_size, "max_age_days": max_age_days}
+        ).one()
+        db.commit()
+        response_cache.invalidate(job_key(job_id) for job_id in job_ids or ())
+        response_cache.bump_match_versions(user_ids or ())
+        batch_ms.append((time.perf_counter() - started) * 1000)
+        deactivated += jobs
+        purged_matches += matches
+        if jobs < batch_size:
+            break
+
+    return {"deactivated": deactivated, "purged_matches": purged_matches, **_timings(batch_ms)}
+
+
+def archive_inactive_jobs(
+    db: Session,
+    batch_size: Optional[int] = None,
+    after_days: Optional[int] = None,
+) -> Dict[str, object]:
+    """
+    Move jobs inactive for `after_days` into jobs_archive, in short batches.
+
+    Deleting them from jobs keeps the table and its indexes sized to live jobs;
+    their signatures, alternate sources and remaining view/like interactions
+    go with them (interaction counters are unaffected). Jobs someone saved or
+    applied to stay in jobs so those lists keep working.
+    """
+    batch_size = batch_size or settings.JOB_SWEEP_BATCH_SIZE
+    after_days = after_days if after_days is not None else settings.JOB_ARCHIVE_AFTER_DAYS
+
+    batch_ms = []
+    archived = 0
+    while True:
+        started = time.perf_counter()
+        moved = db.execute(_ARCHIVE_SQL, {
+            "batch_size": batch_size,
+            "after_days": after_days,
+            "retained": list(RETAINED_INTERACTIONS),
+        }).scalar()
+        db.commit()
+        batch_ms.append((time.perf_counter() - started) * 1000)
+        archived += moved
+        if moved < batch_size:
+            break
+    return {"archived": archived, **_timings(batch_ms)}
+
+
+def sweep_jobs(db: Session) -> Dict[str, object]:
+    """Deactivate expired jobs, then archive long-inactive ones"""
+    return {
+        "deactivate": deactivate_expired_jobs(db),
+        "archive": archive_inactive_jobs(db),
+    }
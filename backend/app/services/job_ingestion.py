@@ -0,0 +1,224 @@
+import logging
+import time
+import uuid
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+from uuid import UUID
+
+from psycopg2.extras import execute_values
+from sqlalchemy.orm import Session
+
+from ..config import settings
+from ..ml.skill_extractor import get_skill_automaton
+from ..schemas.job import JobCreate
+from .job_dedup import JobDeduplicator
+from .job_expiry import expired_sql
+from .response_cache import job_key, response_cache
+
+logger = logging.getLogger(__name__)
+
+# JobCreate fields written to jobs, in column order
+INGEST_COLUMNS = (
+    "external_job_id", "source", "title", "company", "location", "remote_type", "employment_type",
+    "salary_min", "salary_max", "description", "skills_required", "posted_date", "expires_at",
+    "application_url",
+)
+
+# Fields the embedding is computed from (see ml.embeddings.job_text)
+EMBEDDED_COLUMNS = ("title", "company", "description")
+
+_UPSERT_SQL = """
+    INSERT INTO jobs (id, {columns}, is_active, created_at)
+    VALUES %s
+    ON CONFLICT (external_job_id) DO UPDATE SET
+        {updates},
+        is_active = EXCLUDED.is_active,
+        updated_at = now(),
+        embedding = CASE
+            WHEN ({embedded_existing}) IS DISTINCT FROM ({embedded_excluded}) THEN NULL
+            ELSE jobs.embedding
+        END
+    WHERE ({existing}, jobs.is_active) IS DISTINCT FROM ({excluded}, EXCLUDED.is_active)
+    RETURNING id, (xmax = 0) AS inserted, (embedding IS NULL) AS needs_embedding
+""".format(
+    columns=", ".join(INGEST_COLUMNS),
+    updates=",\n        ".join(f"{c} = EXCLUDED.{c}" for c in INGEST_COLUMNS if c != "external_job_id"),
+    embedded_existing=", ".join(f"jobs.{c}" for c in EMBEDDED_COLUMNS),
+    embedded_excluded=", ".join(f"EXCLUDED.{c}" for c in EMBEDDED_COLUMNS),
+    existing=", ".join(f"jobs.{c}" for c in INGEST_COLUMNS),
+    excluded=", ".join(f"EXCLUDED.{c}" for c in INGEST_COLUMNS),
+)
+
+# is_active follows the sweeper's expiry rule (undated, unposted postings never expire),
+# so stale postings stay retired when re-scraped instead of flipping back on every cycle
+_ROW_TEMPLATE = "(%(id)s::uuid, " + ", ".join(
+    f"%({c})s::varchar[]" if c == "skills_required" else f"%({c})s" for c in INGEST_COLUMNS
+) + ", NOT coalesce({expired}, false), now())".format(
+    expired=expired_sql("%(expires_at)s::date", "%(posted_date)s::date", str(int(settings.JOB_MAX_AGE_DAYS)))
+)
+
+
+def _enqueue_embedding(job_ids: List[UUID]) -> None:
+    from ..workers.tasks import embed_jobs_task
+
+    embed_jobs_task.delay([str(i) for i in job_ids])
+
+
+class JobIngester:
+    """
+    Upserts scraped postings into jobs in large batches.
+
+    Each batch is one multi-row INSERT ... ON CONFLICT (external_job_id) DO
+    UPDATE, committed on its own. Updates whose values are identical to the
+    stored row are skipped by the conflict WHERE clause, so re-scraping an
+    unchanged posting writes nothing and leaves updated_at alone (the match
+    pipeline only revisits jobs whose updated_at moved). Rows whose title,
+    company or description changed get their embedding cleared and, with
+    `enqueue_embeddings`, are handed to the embedding worker. is_active is
+    computed with the expiry sweeper's rule, so a re-scraped posting the
+    sweeper retired stays retired and counts as unchanged.
+
+    With `dedup` (JOB_DEDUP_ENABLED by default), each batch first goes through
+    JobDeduplicator: near-duplicates of an existing job are recorded as extra
+    sources of it rather than inserted. Postings that arrive without
+    skills_required get the taxonomy skills found in their title and description.
+
+    A batch that fails to write is rolled back, logged and counted as failed,
+    so the session stays usable and later batches still go in. Postings are
+    numbered in the order they were added: the first `settled` have been
+    through a flush, and `failed_ranges` holds the [start, end) spans of the
+    batches that did not commit, so callers can tell whether theirs did.
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        batch_size: Optional[int] = None,
+        enqueue_embeddings: bool = True,
+        dedup: Optional[bool] = None,
+    ):
+        self.db = db
+        self.batch_size = batch_size or settings.JOB_INGEST_BATCH_SIZE
+        self.enqueue_embeddings = enqueue_embeddings
+        if dedup is None:
+            dedup = settings.JOB_DEDUP_ENABLED
+        self.dedup = JobDeduplicator(db) if dedup else None
+        self._pending: Dict[str, JobCreate] = {}
+        self._started = time.perf_counter()
+        self.received = 0
+        self.inserted = 0
+        self.updated = 0
+        self.unchanged = 0
+        self.reembed = 0
+        self.duplicates = 0
+        self.failed = 0
+        self.settled = 0
+        self.failed_ranges: List[Tuple[int, int]] = []
+
+    def add(self, job: Union[JobCreate, dict]) -> None:
+        """Queue a posting, writing a batch once `batch_size` are queued"""
+        if not isinstance(job, JobCreate):
+            job = JobCreate.model_validate(job)
+        self.received += 1
+        # Later deliveries of the same posting win; ON CONFLICT can't touch a row twice per statement
+        self._pending[job.external_job_id] = job
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def add_many(self, jobs: Iterable[Union[JobCreate, dict]]) -> None:
+        for job in jobs:
+            self.add(job)
+
+    def flush(self) -> None:
+        """Write and commit the queued postings"""
+        if not self._pending:
+            return
+        batch = list(self._pending.values())
+        self._pending = {}
+        span = (self.settled, self.received)
+        self.settled = self.received
+
+        try:
+            automaton = get_skill_automaton()
+            for job in batch:
+                if job.skills_required is None:
+                    job.skills_required = automaton.extract_names(f"{job.title}\n{job.description or ''}")
+
+            if self.dedup is not None:
+                # Near-duplicates of stored or same-batch postings become job_sources rows instead
+                partition = self.dedup.partition(batch)
+                canonical, duplicates = partition.canonical, partition.duplicates
+            else:
+                canonical, duplicates = [(uuid.uuid4(), job, None) for job in batch], []
+
+            written = []
+            if canonical:
+                rows = [
+                    {"id": str(job_id), **{column: getattr(job, column) for column in INGEST_COLUMNS}}
+                    for job_id, job, _ in canonical
+                ]
+                with self.db.connection().connection.cursor() as cursor:
+                    written = execute_values(
+                        cursor, _UPSERT_SQL, rows, template=_ROW_TEMPLATE, page_size=len(rows), fetch=True
+                    )
+            if self.dedup is not None:
+                # Only rows the upsert actually wrote need their signature (re)stored
+                signatures = {str(job_id): signature for job_id, _, signature in canonical}
+                self.dedup.store_signatures({
+                    str(job_id): signatures[str(job_id)] for job_id, _, _ in written if str(job_id) in signatures
+                })
+                self.dedup.store_duplicates(duplicates)
+            self.db.commit()
+        except Exception:
+            # Leave the connection usable for the next batch instead of in an aborted transaction
+            self.db.rollback()
+            self.failed += len(batch)
+            self.failed_ranges.append(span)
+            logger.exception("Failed to ingest a batch of %d postings", len(batch))
+            return
+
+        inserted = sum(1 for _, was_inserted, _ in written if was_inserted)
+        response_cache.invalidate(job_key(job_id) for job_id, was_inserted, _ in written if not was_inserted)
+        reembed_ids = [job_id for job_id, _, needs_embedding in written if needs_embedding]
+        self.inserted += inserted
+        self.updated += len(written) - inserted
+        self.unchanged += len(canonical) - len(written)
+        self.duplicates += len(duplicates)
+        self.reembed += len(reembed_ids)
+
+        if self.enqueue_embeddings and reembed_ids:
+            try:
+                _enqueue_embedding(reembed_ids)
+            except Exception:
+                # The periodic embed-pending-jobs task picks these up anyway
+                logger.warning("Could not enqueue embedding for %d jobs", len(reembed_ids), exc_info=True)
+
+    def stats(self) -> Dict[str, object]:
+        elapsed = time.perf_counter() - self._started
+        written = self.inserted + self.updated + self.unchanged
+        handled = written + self.duplicates
+        return {
+            "received": self.received,
+            "inserted": self.inserted,
+            "updated": self.updated,
+            "unchanged": self.unchanged,
+            "reembed": self.reembed,
+            "duplicates": self.duplicates,
+            "failed": self.failed,
+            "elapsed_s": round(elapsed, 3),
+            "rows_per_s": round(handled / elapsed, 1) if elapsed else 0.0,
+            "noop_share": round(self.unchanged / written, 4) if written else 0.0,
+        }
+
+
+def ingest_jobs(
+    db: Session,
+    jobs: Iterable[Union[JobCreate, dict]],
+    batch_size: Optional[int] = None,
+    enqueue_embeddings: bool = True,
+    dedup: Optional[bool] = None,
+) -> Dict[str, object]:
+    """Upsert a stream of postings and return ingestion stats"""
+    ingester = JobIngester(db, batch_size=batch_size, enqueue_embeddings=enqueue_embeddings, dedup=dedup)
+    ingester.add_many(jobs)
+    ingester.flush()
+    return ingester.stats()
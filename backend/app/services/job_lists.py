@@ -0,0 +1,113 @@
+import base64
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import select, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models.interaction import UserJobInteraction, UserJobListEntry
+from ..models.job import Job
+from .match_feed import CURSOR_SEPARATOR, InvalidCursorError
+
+# Interaction types that together decide whether a job is in a list; the newest one wins
+LIST_STATES: Dict[str, Tuple[str, ...]] = {
+    "saved": ("saved", "unsaved"),
+    "applied": ("applied",),
+}
+_LIST_OF_STATE = {state: list_name for list_name, states in LIST_STATES.items() for state in states}
+
+
+def encode_cursor(changed_at: datetime, job_id: UUID) -> str:
+    """Encode the (changed_at, job_id) keyset position of a list entry as an opaque cursor"""
+    raw = f"{changed_at.isoformat()}{CURSOR_SEPARATOR}{job_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """Decode a cursor produced by encode_cursor"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+        changed_at, job_id = raw.split(CURSOR_SEPARATOR, 1)
+        return datetime.fromisoformat(changed_at), UUID(job_id)
+    except (ValueError, UnicodeDecodeError):
+        raise InvalidCursorError("Invalid cursor")
+
+
+def list_states_stmt(interactions: Iterable[UserJobInteraction]):
+    """
+    Upsert moving each list entry the interactions touch to its newest state, or None.
+
+    Entries only move forward in time, so batches committed out of order (e.g.
+    by two API processes) still leave the newest interaction in place.
+    """
+    latest: Dict[Tuple[UUID, str, UUID], dict] = {}
+    for interaction in interactions:
+        list_name = _LIST_OF_STATE.get(interaction.interaction_type)
+        if list_name is None:
+            continue
+        key = (interaction.user_id, list_name, interaction.job_id)
+        changed_at = interaction.created_at or datetime.now(timezone.utc)
+        # Later events in the batch win ties
+        if key not in latest or changed_at >= latest[key]["changed_at"]:
+            latest[key] = {"user_id": interaction.user_id, "list_name": list_name, "job_id": interaction.job_id,
+                           "state": interaction.interaction_type, "changed_at": changed_at}
+    if not latest:
+        return None
+
+    # Sorted so concurrent writers take row locks in the same order
+    stmt = insert(UserJobListEntry).values([latest[key] for key in sorted(latest, key=lambda k: tuple(map(str, k)))])
+    return stmt.on_conflict_do_update(
+        index_elements=[UserJobListEntry.user_id, UserJobListEntry.list_name, UserJobListEntry.job_id],
+        set_={"state": stmt.excluded.state, "changed_at": stmt.excluded.changed_at},
+        where=UserJobListEntry.changed_at <= stmt.excluded.changed_at,
+    )
+
+
+async def get_job_list(
+    db: AsyncSession,
+    user_id: UUID,
+    list_name: str,
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    active_only: bool = False,
+) -> Tuple[List[Job], Optional[str]]:
+    """
+    Get one page of a user's saved or applied jobs, most recent first.
+
+    Reads the maintained current state in user_job_lists (so saving twice lists
+    the job once, and unsaving removes it) through
+    ix_user_job_lists_user_state_changed, joined to jobs in the same query.
+    Pages are keyset-paginated on the entry's (changed_at, job_id), so a page
+    costs the same however long the user's history is.
+
+    Returns the jobs and the cursor for the next page, or None when there are
+    no more results.
+    """
+    entry = UserJobListEntry
+    query = (
+        select(Job, entry.changed_at)
+        .join(entry, Job.id == entry.job_id)
+        .where(entry.user_id == user_id, entry.state == list_name)
+    )
+    if active_only:
+        query = query.where(Job.is_active == True)
+
+    if cursor:
+        changed_at, job_id = decode_cursor(cursor)
+        query = query.where(tuple_(entry.changed_at, entry.job_id) < tuple_(changed_at, job_id))
+
+    # Fetch one extra row to know whether another page exists
+    rows = (await db.execute(
+        query.order_by(entry.changed_at.desc(), entry.job_id.desc()).limit(limit + 1)
+    )).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        job, changed_at = rows[-1]
+        next_cursor = encode_cursor(changed_at, job.id)
+
+    return [job for job, _ in rows], next_cursor
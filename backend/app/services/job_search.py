@@ -0,0 +1,164 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence
+
+from sqlalchemy import String, cast, func, literal_column, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..config import settings
+from ..models.job import SEARCH_DOCUMENT_SQL, Job
+
+# Annual salary band edges for the salary facet; the last band is open-ended
+SALARY_BANDS = (0, 250000, 500000, 750000, 1000000, 1500000)
+
+SEARCH_DOCUMENT = literal_column(SEARCH_DOCUMENT_SQL)
+
+FACETS = ("skills", "location", "remote_type", "employment_type", "salary")
+
+
+@dataclass
+class JobSearchFilters:
+    q: Optional[str] = None
+    skills: Sequence[str] = ()
+    match_all_skills: bool = True
+    location: Optional[str] = None
+    remote_types: Sequence[str] = ()
+    employment_types: Sequence[str] = ()
+    salary_min: Optional[int] = None
+    salary_max: Optional[int] = None
+
+
+@dataclass
+class JobSearchResult:
+    jobs: List[Job]
+    total: int
+    # False when more jobs matched than the facet scan covers; counts are then lower bounds
+    total_exact: bool
+    facets: Dict[str, List[Dict[str, object]]] = field(default_factory=dict)
+
+
+def _salary_band_label(band: int) -> str:
+    """Label for a width_bucket() band over SALARY_BANDS (1-based)"""
+    low = SALARY_BANDS[max(band, 1) - 1]
+    if band >= len(SALARY_BANDS):
+        return f"{low}+"
+    return f"{low}-{SALARY_BANDS[band]}"
+
+
+def _tsquery(q: str):
+    return func.websearch_to_tsquery(literal_column("'english'::regconfig"), q)
+
+
+def _conditions(filters: JobSearchFilters) -> list:
+    # Literal is_active = true, so the partial search indexes apply
+    conditions = [Job.is_active == True]
+    if filters.q:
+        conditions.append(SEARCH_DOCUMENT.op("@@")(_tsquery(filters.q)))
+    if filters.skills:
+        skills = list(filters.skills)
+        conditions.append(
+            Job.skills_required.contains(skills) if filters.match_all_skills else Job.skills_required.overlap(skills)
+        )
+    if filters.location:
+        escaped = filters.location.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        conditions.append(Job.location.ilike(f"%{escaped}%"))
+    if filters.remote_types:
+        conditions.append(Job.remote_type.in_(list(filters.remote_types)))
+    if filters.employment_types:
+        conditions.append(Job.employment_type.in_(list(filters.employment_types)))
+    # Salary filters keep jobs whose advertised range overlaps the requested one; the
+    # coalesce() expressions must stay identical to ix_jobs_active_salary_upper/_lower
+    if filters.salary_min is not None:
+        conditions.append(func.coalesce(Job.salary_max, Job.salary_min) >= filters.salary_min)
+    if filters.salary_max is not None:
+        conditions.append(func.coalesce(Job.salary_min, Job.salary_max) <= filters.salary_max)
+    return conditions
+
+
+def _facet_query(conditions: list, scan_limit: int, size: int):
+    """Total plus every facet's counts over the matching jobs, as (facet, value, count) rows"""
+    matched = (
+        select(
+            Job.skills_required, Job.location, Job.remote_type, Job.employment_type,
+            func.width_bucket(
+                func.coalesce(Job.salary_max, Job.salary_min), literal_column(f"ARRAY{list(SALARY_BANDS)}")
+            ).label("salary_band"),
+        )
+        .where(*conditions)
+        .limit(scan_limit)
+        .cte("matched")
+        .prefix_with("MATERIALIZED")
+    )
+    skills = select(func.unnest(matched.c.skills_required).label("skill")).subquery("skills")
+    count = func.count().label("count")
+
+    def facet(name, column, source=matched, top=None):
+        query = (
+            select(literal_column(f"'{name}'").label("facet"), cast(column, String).label("value"), count)
+            .select_from(source)
+            .where(column.isnot(None))
+            .group_by(column)
+        )
+        if top:
+            query = query.order_by(count.desc(), column).limit(top)
+        return query
+
+    return union_all(
+        select(
+            literal_column("'total'").label("facet"), cast(literal_column("NULL"), String).label("value"), count
+        ).select_from(matched),
+        facet("skills", skills.c.skill, source=skills, top=size),
+        facet("location", matched.c.location, top=size),
+        facet("remote_type", matched.c.remote_type),
+        facet("employment_type", matched.c.employment_type),
+        facet("salary", matched.c.salary_band),
+    )
+
+
+async def search_jobs(
+    db: AsyncSession,
+    filters: JobSearchFilters,
+    limit: int = 20,
+    offset: int = 0,
+) -> JobSearchResult:
+    """
+    Search live jobs by text, skills, location, work arrangement and salary, with facet counts.
+
+    Every filter is served by a partial index over active jobs: GIN on
+    skills_required (@> for all-of, && for any-of), GIN on the weighted
+    title/description tsvector, trigram GIN on location and btree expression
+    indexes on the salary bounds the filters compare.
+    Results are ranked by text relevance when `q` is given, newest first
+    otherwise. Facets are counted in a single statement over at most
+    JOB_SEARCH_FACET_SCAN_LIMIT matching jobs, so broad searches stay cheap.
+    """
+    conditions = _conditions(filters)
+
+    query = select(Job).where(*conditions)
+    if filters.q:
+        rank = func.ts_rank_cd(SEARCH_DOCUMENT, _tsquery(filters.q))
+        query = query.order_by(rank.desc(), Job.id)
+    else:
+        query = query.order_by(Job.posted_date.desc().nulls_last(), Job.id)
+    jobs = list((await db.execute(query.limit(limit).offset(offset))).scalars())
+
+    scan_limit = settings.JOB_SEARCH_FACET_SCAN_LIMIT
+    total = 0
+    counts: Dict[str, Dict[str, int]] = {name: {} for name in FACETS}
+    for name, value, number in await db.execute(
+        _facet_query(conditions, scan_limit, settings.JOB_SEARCH_FACET_SIZE)
+    ):
+        if name == "total":
+            total = number
+        else:
+            counts[name][value] = number
+
+    facets = {
+        name: [{"value": value, "count": number} for value, number in sorted(values.items(), key=lambda i: -i[1])]
+        for name, values in counts.items() if name != "salary"
+    }
+    facets["salary"] = [
+        {"value": _salary_band_label(band), "count": counts["salary"][str(band)]}
+        for band in sorted(int(value) for value in counts["salary"])
+    ]
+
+    return JobSearchResult(jobs=jobs, total=total, total_exact=total < scan_limit, facets=facets)
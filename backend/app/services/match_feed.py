@@ -0,0 +1,97 @@
+import base64
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import or_, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import contains_eager
+
+from ..models.job import Job, JobMatch
+from ..models.matching import UserMatchState
+
+# Separator between score and id inside a decoded cursor
+CURSOR_SEPARATOR = "|"
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a match feed cursor cannot be decoded"""
+
+
+def encode_cursor(match_score: Decimal, match_id: UUID) -> str:
+    """Encode the (match_score, id) keyset position of a match as an opaque cursor"""
+    raw = f"{match_score}{CURSOR_SEPARATOR}{match_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[Decimal, UUID]:
+    """Decode a cursor produced by encode_cursor"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+        score, match_id = raw.split(CURSOR_SEPARATOR, 1)
+        score, match_id = Decimal(score), UUID(match_id)
+    except (ValueError, InvalidOperation, UnicodeDecodeError):
+        raise InvalidCursorError("Invalid cursor")
+    # match_score is numeric(5, 4); anything else would fail (or overflow) in the query instead
+    if not score.is_finite() or abs(score) >= 10:
+        raise InvalidCursorError("Invalid cursor")
+    return score, match_id
+
+
+async def get_match_feed(
+    db: AsyncSession,
+    user_id: UUID,
+    limit: int = 20,
+    cursor: Optional[str] = None,
+) -> Tuple[List[JobMatch], Optional[str]]:
+    """
+    Get one page of a user's job matches, best first.
+
+    Matches and their jobs are loaded in a single joined query and paginated
+    by keyset on (match_score, id), so every page costs the same index range
+    scan on ix_job_matches_user_score_id regardless of how deep it is.
+    Inactive and expired jobs are filtered out in SQL.
+
+    Returns the matches (with `match.job` populated) and the cursor for the
+    next page, or None when there are no more results.
+    """
+    query = (
+        select(JobMatch)
+        .join(JobMatch.job)
+        .options(contains_eager(JobMatch.job))
+        .where(
+            JobMatch.user_id == user_id,
+            Job.is_active == True,
+            or_(Job.expires_at.is_(None), Job.expires_at >= date.today()),
+        )
+    )
+
+    if cursor:
+        score, match_id = decode_cursor(cursor)
+        query = query.where(tuple_(JobMatch.match_score, JobMatch.id) < tuple_(score, match_id))
+
+    # Fetch one extra row to know whether another page exists
+    result = await db.execute(
+        query.order_by(
+            JobMatch.match_score.desc(),
+            JobMatch.id.desc()
+        ).limit(limit + 1)
+    )
+    matches = list(result.scalars().all())
+
+    next_cursor = None
+    if len(matches) > limit:
+        matches = matches[:limit]
+        last = matches[-1]
+        next_cursor = encode_cursor(last.match_score, last.id)
+
+    return matches, next_cursor
+
+
+async def get_matched_at(db: AsyncSession, user_id: UUID) -> Optional[datetime]:
+    """When the user's matches were last computed, or None if they never have been"""
+    return (await db.execute(
+        select(UserMatchState.matched_at).where(UserMatchState.user_id == user_id)
+    )).scalar_one_or_none()
@@ -0,0 +1,312 @@
+import time
+import uuid
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from psycopg2.extras import Json, execute_values
+from sqlalchemy import delete, func, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from ..config import settings
+from ..ml.job_matcher import JobBlock, MatchPreferences, ScoredJob, top_matches
+from ..models.interaction import UserPreference
+from ..models.job import Job, JobMatch
+from ..models.matching import PipelineWatermark, UserMatchState
+from ..models.resume import Resume
+from .response_cache import response_cache
+from .vector_search import search_similar_jobs
+
+WATERMARK_NAME = "job_matches"
+
+# Jobs stamp updated_at with their transaction's start time but only become visible
+# on commit, so the watermark is held back to the oldest transaction still open
+# (bounded, so a session left idle in transaction can't pin it)
+_WATERMARK_SQL = text("""
+    SELECT greatest(
+        least(now(), (
+            SELECT min(xact_start) FROM pg_stat_activity
+            WHERE datname = current_database()
+              AND backend_type = 'client backend'
+              AND pid <> pg_backend_pid()
+        )),
+        now() - make_interval(secs => :max_lag)
+    )
+""")
+
+# Columns the scoring kernel needs from each job
+JOB_SCORING_COLUMNS = (
+    Job.id, Job.embedding, Job.skills_required, Job.location,
+    Job.remote_type, Job.salary_min, Job.salary_max,
+)
+
+
+def bulk_insert_matches(db: Session, user_id: UUID, scored: Sequence[ScoredJob]) -> int:
+    """Insert match rows with a single multi-row INSERT in the session's transaction"""
+    if not scored:
+        return 0
+    rows = [
+        (str(uuid.uuid4()), str(user_id), str(job_id), score, Json(reasons))
+        for job_id, score, reasons in scored
+    ]
+    with db.connection().connection.cursor() as cursor:
+        execute_values(
+            cursor,
+            "INSERT INTO job_matches (id, user_id, job_id, match_score, match_reasons) VALUES %s",
+            rows,
+            page_size=1000,
+        )
+    return len(rows)
+
+
+def _mark_matched(db: Session, user_id: UUID, resume_id: UUID, resume_version: datetime) -> None:
+    stmt = insert(UserMatchState).values(
+        user_id=user_id, resume_id=resume_id, resume_version=resume_version, matched_at=func.now()
+    )
+    db.execute(stmt.on_conflict_do_update(
+        index_elements=[UserMatchState.user_id],
+        set_={"resume_id": resume_id, "resume_version": resume_version, "matched_at": func.now()},
+    ))
+
+
+def replace_user_matches(db: Session, user_id: UUID, scored: Sequence[ScoredJob]) -> int:
+    """Atomically replace all of a user's job_matches rows (caller commits)"""
+    db.query(JobMatch).filter(JobMatch.user_id == user_id).delete(synchronize_session=False)
+    return bulk_insert_matches(db, user_id, scored)
+
+
+def _trim_to_top_k(db: Session, user_ids: Sequence[UUID], k: int) -> None:
+    """Delete everything below each user's k-th best match"""
+    db.execute(text("""
+        DELETE FROM job_matches WHERE id IN (
+            SELECT id FROM (
+                SELECT id, row_number() OVER (
+                    PARTITION BY user_id ORDER BY match_score DESC, id DESC
+                ) AS rank
+                FROM job_matches
+                WHERE user_id = ANY(CAST(:user_ids AS uuid[]))
+            ) ranked
+            WHERE rank > :k
+        )
+    """), {"user_ids": [str(user_id) for user_id in user_ids], "k": k})
+
+
+def compute_user_matches(db: Session, user, preferences: MatchPreferences, k: int) -> List[ScoredJob]:
+    """
+    Full top-k recompute for one user.
+
+    The ANN index narrows the corpus to the semantically closest candidates,
+    which the hybrid kernel then re-ranks with skills and preferences.
+    """
+    candidates = search_similar_jobs(db, user.embedding, k=k * settings.MATCH_CANDIDATE_MULTIPLIER)
+    if not candidates:
+        return []
+    rows = db.query(*JOB_SCORING_COLUMNS).filter(Job.id.in_([job_id for job_id, _ in candidates])).all()
+    return top_matches(JobBlock.from_rows(rows), user.embedding, user.skills, preferences, k=k)
+
+
+def _latest_resumes(db: Session, after_user_id: Optional[UUID], limit: int,
+                    user_ids: Optional[Sequence[UUID]] = None):
+    """Each user's most recent embedded resume, in user_id order"""
+    version = func.coalesce(Resume.updated_at, Resume.created_at)
+    query = db.query(
+        Resume.user_id, Resume.id, Resume.embedding, Resume.skills, version.label("version")
+    ).filter(Resume.embedding.isnot(None))
+    if after_user_id is not None:
+        query = query.filter(Resume.user_id > after_user_id)
+    if user_ids is not None:
+        query = query.filter(Resume.user_id.in_(user_ids))
+    return query.distinct(Resume.user_id).order_by(Resume.user_id, version.desc()).limit(limit).all()
+
+
+def _changed_jobs(db: Session, since: Optional[datetime]) -> JobBlock:
+    """Active, embedded jobs created or updated after `since`"""
+    query = db.query(*JOB_SCORING_COLUMNS).filter(Job.is_active == True, Job.embedding.isnot(None))
+    if since is not None:
+        query = query.filter(func.coalesce(Job.updated_at, Job.created_at) > since)
+    return JobBlock.from_rows(query.all())
+
+
+def _preferences(db: Session, user_ids: Sequence[UUID]) -> Dict[UUID, MatchPreferences]:
+    rows = db.query(UserPreference).filter(UserPreference.user_id.in_(user_ids)).all()
+    return {row.user_id: MatchPreferences.from_model(row) for row in rows}
+
+
+def _list_bounds(db: Session, user_ids: Sequence[UUID]) -> Dict[UUID, Tuple[int, float]]:
+    """Each user's number of match rows and lowest score (users without rows are absent)"""
+    rows = db.query(
+        JobMatch.user_id, func.count(JobMatch.id), func.min(JobMatch.match_score)
+    ).filter(JobMatch.user_id.in_(user_ids)).group_by(JobMatch.user_id).all()
+    return {user_id: (count, float(min_score)) for user_id, count, min_score in rows}
+
+
+def _current_thresholds(db: Session, user_ids: Sequence[UUID], k: int) -> Dict[UUID, float]:
+    """Score a new job must beat to enter each user's top k (0 while a list is not full)"""
+    return {
+        user_id: min_score if count >= k else 0.0
+        for user_id, (count, min_score) in _list_bounds(db, user_ids).items()
+    }
+
+
+def _merge_changed_jobs(
+    db: Session,
+    users: Sequence,
+    preferences: Dict[UUID, MatchPreferences],
+    changed: JobBlock,
+    k: int,
+) -> int:
+    """
+    Fold new/changed jobs into existing top-k lists for a block of users.
+
+    Old rows for the changed jobs are dropped, jobs that beat a user's
+    remaining k-th score are inserted, and each list is trimmed back to k, all
+    in one transaction. Unchanged jobs outside a full list scored no higher
+    than its old k-th score, so a full list that lost changed jobs and now
+    ends short of k, or below that score, may be missing some of them and is
+    recomputed in full. The block's match versions are bumped after the
+    commit, so cached feed pages (which also embed the changed jobs) are rebuilt.
+    """
+    user_ids = [user.user_id for user in users]
+    before = _list_bounds(db, user_ids)
+    removed = set(db.execute(delete(JobMatch).where(
+        JobMatch.user_id.in_(user_ids),
+        JobMatch.job_id.in_(changed.job_ids),
+    ).returning(JobMatch.user_id).execution_options(synchronize_session=False)).scalars())
+    # Taken from what is left once the changed jobs' old rows are gone
+    thresholds = _current_thresholds(db, user_ids, k)
+
+    written = 0
+    for user in users:
+        scored = top_matches(
+            changed, user.embedding, user.skills, preferences.get(user.user_id),
+            k=k, min_score=thresholds.get(user.user_id, 0.0),
+        )
+        written += bulk_insert_matches(db, user.user_id, scored)
+        _mark_matched(db, user.user_id, user.id, user.version)
+
+    _trim_to_top_k(db, user_ids, k)
+
+    # Only full lists can have left out unchanged jobs
+    shrunk = [user_id for user_id in removed if before[user_id][0] >= k]
+    after = _list_bounds(db, shrunk) if shrunk else {}
+    for user in users:
+        if user.user_id not in shrunk:
+            continue
+        count, min_score = after.get(user.user_id, (0, 0.0))
+        if count < k or min_score < before[user.user_id][1]:
+            scored = compute_user_matches(db, user, preferences.get(user.user_id, MatchPreferences()), k)
+            written += replace_user_matches(db, user.user_id, scored)
+    db.commit()
+    response_cache.bump_match_versions(user_ids)
+    return written
+
+
+def latest_parsed_resume_ids(db: Session, user_ids: Sequence[UUID]) -> List[UUID]:
+    """Each user's most recent resume that has been parsed, i.e. the one to (re-)embed"""
+    version = func.coalesce(Resume.updated_at, Resume.created_at)
+    rows = db.query(Resume.id).filter(
+        Resume.user_id.in_(user_ids), Resume.raw_text.isnot(None)
+    ).distinct(Resume.user_id).order_by(Resume.user_id, version.desc()).all()
+    return [row.id for row in rows]
+
+
+def rematch_users(db: Session, user_ids: Sequence[UUID], k: Optional[int] = None) -> Dict[str, object]:
+    """
+    Full recompute for specific users, e.g. after they edited their resume.
+
+    Callers re-embed the users' resumes first. Users left without an embedded
+    resume (they deleted it) have their matches cleared.
+    """
+    k = k or settings.MATCH_TOP_K
+    started = time.perf_counter()
+    users = _latest_resumes(db, None, len(user_ids), user_ids=user_ids)
+    preferences = _preferences(db, [user.user_id for user in users])
+    stats = {"users_full": 0, "users_cleared": 0, "rows_written": 0}
+
+    for user in users:
+        scored = compute_user_matches(db, user, preferences.get(user.user_id, MatchPreferences()), k)
+        stats["rows_written"] += replace_user_matches(db, user.user_id, scored)
+        _mark_matched(db, user.user_id, user.id, user.version)
+        db.commit()
+        stats["users_full"] += 1
+
+    without_resume = set(user_ids) - {user.user_id for user in users}
+    if without_resume:
+        db.query(JobMatch).filter(JobMatch.user_id.in_(without_resume)).delete(synchronize_session=False)
+        db.query(UserMatchState).filter(UserMatchState.user_id.in_(without_resume)).delete(synchronize_session=False)
+        db.commit()
+        stats["users_cleared"] = len(without_resume)
+
+    response_cache.bump_match_versions(user_ids)
+    stats["seconds"] = round(time.perf_counter() - started, 3)
+    return stats
+
+
+def refresh_matches(db: Session, k: Optional[int] = None, block_size: int = 500) -> Dict[str, object]:
+    """
+    Incrementally materialize every user's top-k JobMatch rows.
+
+    Users whose latest resume changed since it was last matched get a full
+    recompute (ANN candidates re-ranked by the hybrid kernel). Everyone else
+    only has jobs created or changed since the previous run scored against
+    their resume, so a new scrape batch costs users x new_jobs rather than
+    users x all_jobs.
+    """
+    k = k or settings.MATCH_TOP_K
+    started = time.perf_counter()
+    watermark = db.execute(_WATERMARK_SQL, {"max_lag": settings.MATCH_WATERMARK_MAX_LAG_SECONDS}).scalar()
+    previous = db.get(PipelineWatermark, WATERMARK_NAME)
+    since = previous.watermark if previous else None
+
+    changed: Optional[JobBlock] = None
+    stats = {"users_full": 0, "users_incremental": 0, "jobs_changed": 0, "rows_written": 0}
+
+    last_user_id = None
+    while True:
+        users = _latest_resumes(db, last_user_id, block_size)
+        if not users:
+            break
+        last_user_id = users[-1].user_id
+
+        states = {
+            state.user_id: state
+            for state in db.query(UserMatchState).filter(
+                UserMatchState.user_id.in_([user.user_id for user in users])
+            )
+        }
+        preferences = _preferences(db, [user.user_id for user in users])
+        stale, fresh = [], []
+        for user in users:
+            state = states.get(user.user_id)
+            if state is None or state.resume_id != user.id or state.resume_version < user.version:
+                stale.append(user)
+            else:
+                fresh.append(user)
+
+        for user in stale:
+            scored = compute_user_matches(db, user, preferences.get(user.user_id, MatchPreferences()), k)
+            stats["rows_written"] += replace_user_matches(db, user.user_id, scored)
+            _mark_matched(db, user.user_id, user.id, user.version)
+            db.commit()
+            response_cache.bump_match_versions([user.user_id])
+        stats["users_full"] += len(stale)
+
+        if fresh:
+            if changed is None:
+                changed = _changed_jobs(db, since)
+                stats["jobs_changed"] = len(changed)
+            if len(changed):
+                stats["rows_written"] += _merge_changed_jobs(db, fresh, preferences, changed, k)
+                stats["users_incremental"] += len(fresh)
+
+    # Jobs committed while this run was in progress, or still uncommitted when it began,
+    # are picked up by the next one; re-merging a job this run already saw is harmless
+    db.execute(insert(PipelineWatermark).values(name=WATERMARK_NAME, watermark=watermark).on_conflict_do_update(
+        index_elements=[PipelineWatermark.name],
+        set_={"watermark": watermark, "updated_at": func.now()},
+    ))
+    db.commit()
+
+    stats["seconds"] = round(time.perf_counter() - started, 3)
+    return stats
@@ -0,0 +1,243 @@
+import logging
+import re
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+slow_query_logger = logging.getLogger("app.sql.slow")
+
+# Seconds
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+# Longest statement text written to the slow-query log
+MAX_LOGGED_STATEMENT = 2000
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+Labels = Tuple[str, ...]
+
+
+def _format_labels(names: Sequence[str], values: Labels, extra: str = "") -> str:
+    pairs = [
+        '{}="{}"'.format(name, str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for name, value in zip(names, values)
+    ]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+def _flatten(prefix: str, stats: Dict[str, object]):
+    """Numeric entries of a stats() dict as (metric name, value); nested dicts extend the name"""
+    for key, value in stats.items():
+        name = re.sub(r"[^a-zA-Z0-9_]", "_", f"{prefix}_{key}")
+        if isinstance(value, dict):
+            yield from _flatten(name, value)
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            yield name, value
+
+
+class Counter:
+    """Monotonic counter, one series per label combination"""
+
+    type = "counter"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self._values: Dict[Labels, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, labels: Labels = (), amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            values = dict(self._values)
+        return [
+            f"{self.name}{_format_labels(self.labels, labels)} {_format_value(value)}"
+            for labels, value in sorted(values.items())
+        ]
+
+
+class Histogram:
+    """Cumulative-bucket histogram, one series per label combination"""
+
+    type = "histogram"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self.buckets = tuple(buckets)
+        # Per series: [count per bucket (last is +Inf)], sum
+        self._series: Dict[Labels, list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, labels: Labels = ()) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][index] += 1
+            series[1] += value
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            snapshot = {labels: (list(counts), total) for labels, (counts, total) in self._series.items()}
+        lines = []
+        for labels, (counts, total) in sorted(snapshot.items()):
+            cumulative = 0
+            for bound, count in zip((*self.buckets, "+Inf"), counts):
+                cumulative += count
+                le = 'le="{}"'.format(bound if bound == "+Inf" else _format_value(bound))
+                lines.append(f"{self.name}_bucket{_format_labels(self.labels, labels, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labels, labels)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(self.labels, labels)} {cumulative}")
+        return lines
+
+
+class Registry:
+    """
+    Process-local metrics in the Prometheus text exposition format.
+
+    Each API worker process keeps its own registry; scrape every worker (or
+    run one per container) to see all traffic. Components that already keep
+    counters expose them through stats collectors, rendered as gauges.
+    """
+
+    def __init__(self):
+        self._metrics: List = []
+        self._collectors: List[Tuple[str, Callable[[], Dict[str, object]]]] = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def add_stats_collector(self, prefix: str, collect: Callable[[], Dict[str, object]]) -> None:
+        """Expose the numeric values of a component's stats() dict as `<prefix>_<key>` gauges"""
+        self._collectors.append((prefix, collect))
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics:
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            lines.extend(metric.samples())
+        for prefix, collect in self._collectors:
+            try:
+                stats = collect()
+            except Exception:
+                logger.warning("Metrics collector %s failed", prefix, exc_info=True)
+                continue
+            for name, value in _flatten(prefix, stats):
+                lines.append(f"# TYPE {name} gauge")
+                lines.append(f"{name} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+http_request_duration = registry.register(Histogram(
+    "http_request_duration_seconds", "HTTP request latency by route", ("method", "route", "status"),
+))
+http_request_db_queries = registry.register(Histogram(
+    "http_request_db_queries", "SQL statements executed per HTTP request", ("method", "route"),
+    buckets=QUERY_COUNT_BUCKETS,
+))
+http_request_db_seconds = registry.register(Counter(
+    "http_request_db_seconds_total", "Time spent in SQL statements while serving requests", ("method", "route"),
+))
+http_requests_n_plus_one = registry.register(Counter(
+    "http_requests_n_plus_one_total", "Requests that ran more SQL statements than the N+1 threshold",
+    ("method", "route"),
+))
+db_queries = registry.register(Counter("db_queries_total", "SQL statements executed"))
+db_slow_queries = registry.register(Counter("db_slow_queries_total", "SQL statements slower than SLOW_QUERY_MS"))
+
+
+@dataclass
+class RequestStats:
+    """SQL work done on behalf of the current request"""
+    queries: int = 0
+    db_seconds: float = 0.0
+    path: str = ""
+
+
+# Set by InstrumentationMiddleware; copied into threadpool calls and asyncpg greenlets with the context
+request_stats: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+
+def route_label(scope) -> str:
+    """The matched route template, so /api/jobs/<uuid> is one series rather than one per job"""
+    route = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
+def record_request(method: str, route: str, status: int, seconds: float, stats: RequestStats,
+                   n_plus_one_threshold: int) -> None:
+    http_request_duration.observe(seconds, (method, route, str(status)))
+    http_request_db_queries.observe(stats.queries, (method, route))
+    if stats.db_seconds:
+        http_request_db_seconds.inc((method, route), stats.db_seconds)
+    if stats.queries > n_plus_one_threshold:
+        http_requests_n_plus_one.inc((method, route))
+        logger.warning("%s %s ran %d SQL statements (threshold %d); possible N+1",
+                       method, route, stats.queries, n_plus_one_threshold)
+
+
+def redact_statement(statement: str, parameters) -> str:
+    """Statement text for logs: whitespace collapsed, truncated, bound values replaced by their count"""
+    text = _WHITESPACE_RE.sub(" ", statement).strip()
+    if len(text) > MAX_LOGGED_STATEMENT:
+        text = text[:MAX_LOGGED_STATEMENT] + "..."
+    if isinstance(parameters, (list, tuple)) and parameters and isinstance(parameters[0], (list, tuple, dict)):
+        return f"{text} [{len(parameters)} parameter sets redacted]"
+    count = len(parameters) if isinstance(parameters, (list, tuple, dict)) else 0
+    return f"{text} [{count} parameters redacted]" if count else text
+
+
+def install_query_hooks(engine: Engine, slow_query_ms: float) -> None:
+    """Count statements and DB time per request, and log slow statements, for a (sync) engine"""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_started"].pop()
+        db_queries.inc()
+        stats = request_stats.get()
+        if stats is not None:
+            stats.queries += 1
+            stats.db_seconds += elapsed
+        if elapsed * 1000 >= slow_query_ms:
+            db_slow_queries.inc()
+            slow_query_logger.warning(
+                "Slow query (%.1f ms)%s: %s",
+                elapsed * 1000,
+                f" in {stats.path}" if stats is not None and stats.path else "",
+                redact_statement(statement, parameters),
+            )
+
+    @event.listens_for(engine, "handle_error")
+    def _handle_error(exception_context):
+        started = exception_context.connection.info.get("query_started") if exception_context.connection else None
+        if started:
+            started.pop()
@@ -0,0 +1,85 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional, TypeVar
+
+from passlib.context import CryptContext
+
+from ..config import settings
+
+T = TypeVar("T")
+
+# Password hashing context
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.PASSWORD_BCRYPT_ROUNDS)
+
+
+class PasswordHasherBusyError(RuntimeError):
+    """Raised when the password hashing queue is full"""
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt on a small dedicated thread pool.
+
+    bcrypt releases the GIL, so threads hash in parallel without blocking the
+    event loop, and sizing the pool caps how many cores a login storm can take
+    from request handling. At most `workers + max_pending` operations are
+    accepted at once; beyond that callers get PasswordHasherBusyError
+    immediately instead of queueing behind work that will time out anyway.
+    """
+
+    def __init__(self, workers: int, max_pending: int):
+        self.workers = workers
+        self.max_pending = max_pending
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+
+    def _acquire(self) -> None:
+        with self._lock:
+            if self._in_flight >= self.workers + self.max_pending:
+                self.rejected += 1
+                raise PasswordHasherBusyError("Password hashing queue is full")
+            self._in_flight += 1
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="bcrypt")
+
+    def _release(self, _future=None) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            self.completed += 1
+
+    async def _run(self, fn: Callable[..., T], *args) -> T:
+        self._acquire()
+        try:
+            future = self._executor.submit(fn, *args)
+        except Exception:
+            self._release()
+            raise
+        # Released when the hash actually finishes, even if the request is cancelled first
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+
+    async def hash(self, password: str) -> str:
+        """Hash a password"""
+        return await self._run(pwd_context.hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """Verify a password against its hash"""
+        return await self._run(pwd_context.verify, plain_password, hashed_password)
+
+    def stats(self) -> Dict[str, int]:
+        return {"in_flight": self._in_flight, "completed": self.completed, "rejected": self.rejected}
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+password_hasher = PasswordHasher(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+)
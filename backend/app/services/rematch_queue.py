@@ -0,0 +1,132 @@
+import logging
+import time
+from typing import Dict, Iterable, List, Optional
+from uuid import UUID
+
+from ..config import settings
+
+logger = logging.getLogger(__name__)
+
+REDIS_RETRY_SECONDS = 30
+
+# Atomically take up to ARGV[3] users that are due: quiet since ARGV[1] or first marked before ARGV[2]
+_CLAIM_SCRIPT = """
+local claimed = {}
+local seen = {}
+local function take(candidates)
+    for _, user_id in ipairs(candidates) do
+        if #claimed >= tonumber(ARGV[3]) then return end
+        if not seen[user_id] then
+            seen[user_id] = true
+            redis.call('ZREM', KEYS[1], user_id)
+            redis.call('ZREM', KEYS[2], user_id)
+            table.insert(claimed, user_id)
+        end
+    end
+end
+take(redis.call('ZRANGEBYSCORE', KEYS[2], '-inf', ARGV[2], 'LIMIT', 0, ARGV[3]))
+take(redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[3]))
+return claimed
+"""
+
+
+class RematchQueue:
+    """
+    Users whose matches need a full recompute, debounced and de-duplicated in Redis.
+
+    Edits that change what a user is matched on (resume skills, a new or
+    deleted resume) mark the user dirty. Marks live in two sorted sets keyed
+    by user: the time of the latest edit, which each new edit pushes back, and
+    the time of the first still-pending edit. A user becomes due once they
+    have been quiet for the debounce window, or once the first pending edit is
+    max_wait old so a steady stream of edits can't postpone them forever.
+
+    The scheduler claims due users atomically, so a burst of edits becomes one
+    recompute and concurrent workers never take the same user. An edit that
+    lands after a user was claimed marks them again. Without Redis nothing is
+    marked; the periodic refresh still picks up changed resumes by version.
+    """
+
+    LAST_KEY = "match:dirty:last"
+    FIRST_KEY = "match:dirty:first"
+
+    def __init__(self, debounce_seconds: int, max_wait_seconds: int, redis_url: Optional[str] = None):
+        self.debounce_seconds = debounce_seconds
+        self.max_wait_seconds = max_wait_seconds
+        self.redis_url = redis_url
+        self._redis = None
+        self._redis_down_until = 0.0
+        self._claim = None
+        self.marked = 0
+        self.claimed = 0
+
+    def _redis_client(self):
+        """The Redis client, or None if Redis is disabled or recently failed"""
+        if not self.redis_url or time.monotonic() < self._redis_down_until:
+            return None
+        if self._redis is None:
+            import redis
+
+            self._redis = redis.Redis.from_url(self.redis_url, socket_timeout=0.5, socket_connect_timeout=0.5)
+            self._claim = self._redis.register_script(_CLAIM_SCRIPT)
+        return self._redis
+
+    def _redis_failed(self) -> None:
+        self._redis_down_until = time.monotonic() + REDIS_RETRY_SECONDS
+
+    def mark_dirty(self, user_ids: Iterable[UUID]) -> None:
+        """Schedule a recompute for users, pushing back any recompute already pending"""
+        user_ids = [str(user_id) for user_id in user_ids]
+        client = self._redis_client()
+        if client is None or not user_ids:
+            return
+        now = time.time()
+        try:
+            pipe = client.pipeline(transaction=False)
+            pipe.zadd(self.LAST_KEY, {user_id: now for user_id in user_ids})
+            pipe.zadd(self.FIRST_KEY, {user_id: now for user_id in user_ids}, nx=True)
+            pipe.execute()
+        except Exception:
+            logger.warning("Could not mark %d users for re-matching", len(user_ids), exc_info=True)
+            self._redis_failed()
+            return
+        self.marked += len(user_ids)
+
+    def claim_due(self, limit: int) -> List[UUID]:
+        """Take up to `limit` due users off the queue; the caller must recompute (or re-mark) them"""
+        client = self._redis_client()
+        if client is None:
+            return []
+        now = time.time()
+        try:
+            claimed = self._claim(
+                keys=[self.LAST_KEY, self.FIRST_KEY],
+                args=[now - self.debounce_seconds, now - self.max_wait_seconds, limit],
+            )
+        except Exception:
+            logger.warning("Could not claim users for re-matching", exc_info=True)
+            self._redis_failed()
+            return []
+        self.claimed += len(claimed)
+        return [UUID(user_id.decode()) for user_id in claimed]
+
+    def pending(self) -> Optional[int]:
+        """Users waiting for a recompute, or None when Redis is unavailable"""
+        client = self._redis_client()
+        if client is None:
+            return None
+        try:
+            return client.zcard(self.LAST_KEY)
+        except Exception:
+            self._redis_failed()
+            return None
+
+    def stats(self) -> Dict[str, object]:
+        return {"marked": self.marked, "claimed": self.claimed, "pending": self.pending()}
+
+
+rematch_queue = RematchQueue(
+    debounce_seconds=settings.MATCH_REMATCH_DEBOUNCE_SECONDS,
+    max_wait_seconds=settings.MATCH_REMATCH_MAX_WAIT_SECONDS,
+    redis_url=settings.REDIS_URL,
+)
@@ -0,0 +1,247 @@
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Optional
+from uuid import UUID
+
+from fastapi import Request, Response
+from fastapi.concurrency import run_in_threadpool
+
+from ..config import settings
+
+logger = logging.getLogger(__name__)
+
+REDIS_RETRY_SECONDS = 30
+
+# Responses may be stored by the browser but must be revalidated with If-None-Match
+CACHE_CONTROL = "private, no-cache"
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A serialized JSON response body with its ETag and extra headers"""
+    etag: str
+    body: bytes
+    headers: Dict[str, str] = field(default_factory=dict)
+
+    def to_json(self) -> str:
+        return json.dumps({"etag": self.etag, "body": self.body.decode(), "headers": self.headers})
+
+    @classmethod
+    def from_json(cls, raw) -> "CachedResponse":
+        data = json.loads(raw)
+        return cls(etag=data["etag"], body=data["body"].encode(), headers=data["headers"])
+
+
+def make_etag(*parts) -> str:
+    """Strong ETag derived from the values a response's content depends on"""
+    digest = hashlib.sha1("\0".join(str(part) for part in parts).encode()).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def not_modified(request: Request, etag: str) -> bool:
+    """Whether the request's If-None-Match already names this ETag"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = {candidate.strip().removeprefix("W/") for candidate in header.split(",")}
+    return etag in candidates or "*" in candidates
+
+
+def respond(request: Request, entry: CachedResponse) -> Response:
+    """The cached body, or an empty 304 when the client already has it"""
+    headers = {"ETag": entry.etag, "Cache-Control": CACHE_CONTROL, **entry.headers}
+    if not_modified(request, entry.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(entry.body, media_type="application/json", headers=headers)
+
+
+def job_key(job_id: UUID) -> str:
+    return f"response:job:{job_id}"
+
+
+class ResponseCache:
+    """
+    Cache of serialized API responses, plus per-user match versions.
+
+    Same two tiers as the principal cache: an in-process TTL/LRU that answers
+    most lookups without I/O, and Redis shared by every worker. Writers of the
+    underlying data (ingestion, the expiry sweeper) delete affected entries
+    from Redis; other processes' in-process copies expire within the shorter
+    local TTL.
+
+    Match feed pages are keyed by a per-user match version kept in Redis. The
+    matching pipeline and the sweeper bump it whenever a user's job_matches
+    change, which orphans every cached page of the old version at once. Without
+    Redis there is no shared version, so feed pages are not cached at all.
+    """
+
+    def __init__(self, ttl_seconds: int, local_ttl_seconds: int, max_size: int, redis_url: Optional[str] = None):
+        self.ttl_seconds = ttl_seconds
+        self.local_ttl_seconds = local_ttl_seconds
+        self.max_size = max_size
+        self.redis_url = redis_url
+        self._redis = None
+        self._redis_down_until = 0.0
+        self._local: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.local_hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+
+    def _redis_client(self):
+        """The Redis client, or None if Redis is disabled or recently failed"""
+        if not self.redis_url or time.monotonic() < self._redis_down_until:
+            return None
+        if self._redis is None:
+            import redis
+
+            self._redis = redis.Redis.from_url(self.redis_url, socket_timeout=0.05, socket_connect_timeout=0.05)
+        return self._redis
+
+    def _redis_failed(self) -> None:
+        # Skip Redis for a while instead of paying the timeout on every lookup
+        self._redis_down_until = time.monotonic() + REDIS_RETRY_SECONDS
+        logger.debug("Response cache Redis unavailable", exc_info=True)
+
+    def _get_local(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._local.get(key)
+            if entry is None:
+                return None
+            response, expires_at = entry
+            if expires_at < time.monotonic():
+                del self._local[key]
+                return None
+            self._local.move_to_end(key)
+            return response
+
+    def _set_local(self, key: str, response: CachedResponse) -> None:
+        with self._lock:
+            self._local[key] = (response, time.monotonic() + self.local_ttl_seconds)
+            self._local.move_to_end(key)
+            while len(self._local) > self.max_size:
+                self._local.popitem(last=False)
+
+    def _get_redis(self, key: str) -> Optional[CachedResponse]:
+        client = self._redis_client()
+        if client is None:
+            return None
+        try:
+            raw = client.get(key)
+        except Exception:
+            self._redis_failed()
+            return None
+        return CachedResponse.from_json(raw) if raw else None
+
+    def _set_redis(self, key: str, response: CachedResponse) -> None:
+        client = self._redis_client()
+        if client is None:
+            return
+        try:
+            client.set(key, response.to_json(), ex=self.ttl_seconds)
+        except Exception:
+            self._redis_failed()
+
+    async def get(self, key: str) -> Optional[CachedResponse]:
+        response = self._get_local(key)
+        if response is not None:
+            self.local_hits += 1
+            return response
+        if self.redis_url:
+            response = await run_in_threadpool(self._get_redis, key)
+            if response is not None:
+                self.redis_hits += 1
+                self._set_local(key, response)
+                return response
+        self.misses += 1
+        return None
+
+    async def set(self, key: str, response: CachedResponse) -> None:
+        self._set_local(key, response)
+        if self.redis_url:
+            await run_in_threadpool(self._set_redis, key, response)
+
+    def invalidate(self, keys: Iterable[str]) -> None:
+        """Drop entries from this process and from Redis"""
+        keys = list(keys)
+        if not keys:
+            return
+        with self._lock:
+            for key in keys:
+                self._local.pop(key, None)
+        client = self._redis_client()
+        if client is not None:
+            try:
+                client.delete(*keys)
+            except Exception:
+                logger.warning("Response cache Redis invalidation failed for %d keys", len(keys), exc_info=True)
+                self._redis_failed()
+
+    @staticmethod
+    def _version_key(user_id: UUID) -> str:
+        return f"match:version:{user_id}"
+
+    def _read_match_version(self, user_id: UUID) -> Optional[int]:
+        client = self._redis_client()
+        if client is None:
+            return None
+        key = self._version_key(user_id)
+        try:
+            # Seed a missing counter with the clock so a lost key never reuses an old version
+            pipe = client.pipeline(transaction=False)
+            pipe.set(key, time.time_ns(), nx=True).get(key)
+            _, version = pipe.execute()
+        except Exception:
+            self._redis_failed()
+            return None
+        return int(version)
+
+    async def match_version(self, user_id: UUID) -> Optional[int]:
+        """The user's current match version, or None when it can't be read (don't cache then)"""
+        if not self.redis_url:
+            return None
+        return await run_in_threadpool(self._read_match_version, user_id)
+
+    def bump_match_versions(self, user_ids: Iterable[UUID]) -> None:
+        """Mark users' match feeds changed, orphaning their cached pages"""
+        user_ids = list(user_ids)
+        client = self._redis_client()
+        if client is None or not user_ids:
+            return
+        try:
+            pipe = client.pipeline(transaction=False)
+            for user_id in user_ids:
+                key = self._version_key(user_id)
+                pipe.set(key, time.time_ns(), nx=True).incr(key)
+            pipe.execute()
+        except Exception:
+            logger.warning("Could not bump match versions for %d users", len(user_ids), exc_info=True)
+            self._redis_failed()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._local.clear()
+
+    def stats(self) -> Dict[str, object]:
+        """Hit/miss counters; every miss is a response built from Postgres"""
+        lookups = self.local_hits + self.redis_hits + self.misses
+        return {
+            "local_items": len(self._local),
+            "local_hits": self.local_hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "hit_rate": round((self.local_hits + self.redis_hits) / lookups, 4) if lookups else 0.0,
+        }
+
+
+response_cache = ResponseCache(
+    ttl_seconds=settings.RESPONSE_CACHE_TTL_SECONDS,
+    local_ttl_seconds=settings.RESPONSE_CACHE_LOCAL_TTL_SECONDS,
+    max_size=settings.RESPONSE_CACHE_SIZE,
+    redis_url=settings.REDIS_URL if settings.RESPONSE_CACHE_REDIS else None,
+)
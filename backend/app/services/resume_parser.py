@@ -0,0 +1,117 @@
+"""
+Resume text extraction and parsing.
+
+Everything here is CPU-bound and free of app state (no settings, no database),
+so it can run inside a process pool worker.
+"""
+import os
+import re
+import time
+from typing import Dict, List
+
+EMAIL_RE = re.compile(r"[\w.+-]+@[\w-]+\.[\w.-]+")
+PHONE_RE = re.compile(r"\+?\(?\d{1,4}\)?[\s.-]?\d{2,4}[\s.-]?\d{3,4}(?:[\s.-]?\d{3,4})?")
+URL_RE = re.compile(r"(?:https?://|www\.)\S+|(?:linkedin|github)\.com/\S+", re.IGNORECASE)
+
+# Headings that start a new resume section, mapped to a canonical section name
+SECTION_HEADINGS = {
+    "summary": "summary",
+    "profile": "summary",
+    "objective": "summary",
+    "experience": "experience",
+    "work experience": "experience",
+    "professional experience": "experience",
+    "employment history": "experience",
+    "education": "education",
+    "skills": "skills",
+    "technical skills": "skills",
+    "core competencies": "skills",
+    "projects": "projects",
+    "certifications": "certifications",
+    "languages": "languages",
+}
+
+SKILL_SEPARATORS_RE = re.compile(r"[,;|•·\n]")
+
+
+class ResumeParseError(Exception):
+    """Raised when a resume file cannot be read"""
+
+
+def extract_text(file_path: str) -> str:
+    """Extract plain text from a PDF or DOCX resume"""
+    ext = os.path.splitext(file_path)[1].lower()
+    try:
+        if ext == ".pdf":
+            import pdfplumber
+
+            with pdfplumber.open(file_path) as pdf:
+                return "\n".join(page.extract_text() or "" for page in pdf.pages)
+        if ext == ".docx":
+            import docx
+
+            document = docx.Document(file_path)
+            return "\n".join(paragraph.text for paragraph in document.paragraphs)
+    except Exception as exc:
+        raise ResumeParseError(f"Could not read {os.path.basename(file_path)}: {exc}") from exc
+    raise ResumeParseError(f"Unsupported resume format: {ext}")
+
+
+def split_sections(text: str) -> Dict[str, str]:
+    """Split resume text into canonical sections keyed by heading"""
+    sections: Dict[str, List[str]] = {"header": []}
+    current = "header"
+    for line in text.splitlines():
+        heading = line.strip().rstrip(":").lower()
+        if heading in SECTION_HEADINGS:
+            current = SECTION_HEADINGS[heading]
+            sections.setdefault(current, [])
+            continue
+        sections[current].append(line)
+    return {name: "\n".join(lines).strip() for name, lines in sections.items() if any(lines)}
+
+
+def extract_skills(sections: Dict[str, str]) -> List[str]:
+    """Skills listed in the skills section, de-duplicated in order"""
+    seen = {}
+    for item in SKILL_SEPARATORS_RE.split(sections.get("skills", "")):
+        skill = item.strip(" -\t")
+        if skill and len(skill) <= 50:
+            seen.setdefault(skill.lower(), skill)
+    return list(seen.values())
+
+
+def parse_resume_text(text: str) -> Dict:
+    """Structured data extracted from resume text"""
+    sections = split_sections(text)
+    return {
+        "contact": {
+            "emails": sorted(set(EMAIL_RE.findall(text))),
+            "phones": sorted(set(
+                match.strip() for match in PHONE_RE.findall(text)
+                if sum(ch.isdigit() for ch in match) >= 9  # skip date ranges like 2020-2024
+            ))[:3],
+            "links": sorted(set(URL_RE.findall(text))),
+        },
+        "sections": sections,
+    }
+
+
+def parse_resume_file(file_path: str) -> Dict:
+    """Extract and parse a resume file, with per-stage timings in milliseconds"""
+    started = time.perf_counter()
+    # Postgres text columns reject NUL bytes, which some PDFs contain
+    raw_text = extract_text(file_path).replace("\x00", "")
+    extracted = time.perf_counter()
+    parsed_data = parse_resume_text(raw_text)
+    skills = extract_skills(parsed_data["sections"])
+    parsed = time.perf_counter()
+    return {
+        "raw_text": raw_text,
+        "parsed_data": parsed_data,
+        "skills": skills,
+        "timings_ms": {
+            "extract": round((extracted - started) * 1000, 2),
+            "parse": round((parsed - extracted) * 1000, 2),
+        },
+    }
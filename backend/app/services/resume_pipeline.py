@@ -0,0 +1,174 @@
+import asyncio
+import logging
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Set
+from uuid import UUID
+
+from fastapi.concurrency import run_in_threadpool
+
+from ..config import settings
+from ..database import SessionLocal
+from ..ml.skill_extractor import get_skill_automaton
+from ..models.resume import Resume
+from .resume_parser import ResumeParseError, parse_resume_file
+
+logger = logging.getLogger(__name__)
+
+STAGES = ("queue_wait", "extract", "parse", "skills", "save", "enqueue_embedding", "total")
+
+
+def _load_file_path(resume_id: UUID) -> Optional[str]:
+    db = SessionLocal()
+    try:
+        resume = db.query(Resume.file_path).filter(Resume.id == resume_id).first()
+        return resume.file_path if resume else None
+    finally:
+        db.close()
+
+
+def _tag_skills(raw_text: str, listed: Optional[List[str]]) -> List[str]:
+    """Taxonomy skills mentioned anywhere in the resume, then listed skills the taxonomy doesn't know"""
+    automaton = get_skill_automaton()
+    skills = automaton.extract_names(raw_text)
+    for item in listed or ():
+        if not automaton.extract(item):
+            skills.append(item)
+    return skills
+
+
+def _save_parse_result(resume_id: UUID, result: Dict) -> None:
+    db = SessionLocal()
+    try:
+        db.query(Resume).filter(Resume.id == resume_id).update({
+            Resume.raw_text: result["raw_text"],
+            Resume.parsed_data: result["parsed_data"],
+            Resume.skills: result["skills"],
+        }, synchronize_session=False)
+        db.commit()
+    finally:
+        db.close()
+
+
+def _enqueue_embedding(resume_id: UUID) -> None:
+    from ..workers.tasks import embed_resumes_task
+
+    embed_resumes_task.delay([str(resume_id)])
+
+
+class ResumeParsePipeline:
+    """
+    Parses uploaded resumes off the event loop.
+
+    Text extraction and parsing run in a process pool, database writes in the
+    threadpool, and embedding is handed to the Celery worker. At most
+    `concurrency` resumes are in flight at once; further uploads wait their
+    turn as cheap pending coroutines, so a burst of uploads cannot take more
+    than the configured CPU away from request handling.
+    """
+
+    def __init__(self, workers: int, concurrency: int):
+        self.workers = workers
+        self.concurrency = concurrency
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._tasks: Set[asyncio.Task] = set()
+        self.completed = 0
+        self.failed = 0
+        self.stage_totals_ms: Dict[str, float] = {stage: 0.0 for stage in STAGES}
+
+    def _ensure_started(self) -> None:
+        if self._pool is None:
+            # spawn, not fork: never copy the API process's threads and event loop
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+            )
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+
+    def schedule(self, resume_id: UUID) -> asyncio.Task:
+        """Start processing a resume in the background"""
+        self._ensure_started()
+        task = asyncio.create_task(self.process(resume_id))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def process(self, resume_id: UUID) -> Dict[str, float]:
+        """Parse a resume, store the results and queue its embedding; returns stage timings (ms)"""
+        self._ensure_started()
+        queued = time.perf_counter()
+        timings: Dict[str, float] = {}
+
+        async with self._semaphore:
+            started = time.perf_counter()
+            timings["queue_wait"] = (started - queued) * 1000
+            try:
+                file_path = await run_in_threadpool(_load_file_path, resume_id)
+                if file_path is None:
+                    return timings
+
+                loop = asyncio.get_running_loop()
+                try:
+                    result = await loop.run_in_executor(self._pool, parse_resume_file, file_path)
+                except ResumeParseError as exc:
+                    logger.warning("Resume %s could not be parsed: %s", resume_id, exc)
+                    result = {"raw_text": None, "parsed_data": {"error": str(exc)}, "skills": None,
+                              "timings_ms": {}}
+                timings.update(result["timings_ms"])
+
+                if result["raw_text"]:
+                    stage = time.perf_counter()
+                    result["skills"] = await run_in_threadpool(_tag_skills, result["raw_text"], result["skills"])
+                    timings["skills"] = (time.perf_counter() - stage) * 1000
+
+                stage = time.perf_counter()
+                await run_in_threadpool(_save_parse_result, resume_id, result)
+                timings["save"] = (time.perf_counter() - stage) * 1000
+
+                if result["raw_text"]:
+                    stage = time.perf_counter()
+                    try:
+                        await run_in_threadpool(_enqueue_embedding, resume_id)
+                    except Exception:
+                        # The periodic backlog task embeds anything missed here
+                        logger.exception("Could not enqueue embedding for resume %s", resume_id)
+                    timings["enqueue_embedding"] = (time.perf_counter() - stage) * 1000
+            except Exception:
+                self.failed += 1
+                logger.exception("Resume pipeline failed for %s", resume_id)
+                raise
+
+        timings["total"] = (time.perf_counter() - queued) * 1000
+        self.completed += 1
+        for stage, value in timings.items():
+            self.stage_totals_ms[stage] = self.stage_totals_ms.get(stage, 0.0) + value
+        logger.info("Resume %s processed: %s", resume_id,
+                    {stage: round(value, 1) for stage, value in timings.items()})
+        return timings
+
+    def stats(self) -> Dict[str, object]:
+        """Completed/failed counts, in-flight work and mean per-stage timings"""
+        return {
+            "completed": self.completed,
+            "failed": self.failed,
+            "pending": len(self._tasks),
+            "mean_stage_ms": {
+                stage: round(total / self.completed, 2) if self.completed else 0.0
+                for stage, total in self.stage_totals_ms.items()
+            },
+        }
+
+    async def shutdown(self) -> None:
+        """Let in-flight resumes finish, then stop the worker processes"""
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+
+resume_pipeline = ResumeParsePipeline(
+    workers=settings.RESUME_PARSE_WORKERS,
+    concurrency=settings.RESUME_PARSE_CONCURRENCY,
+)
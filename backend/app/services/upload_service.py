@@ -0,0 +1,78 @@
+import hashlib
+import os
+import uuid
+from typing import Optional
+
+import aiofiles
+import aiofiles.os
+
+# Bytes read from the upload per iteration; bounds memory per concurrent upload
+CHUNK_SIZE = 64 * 1024
+
+
+class UploadTooLargeError(Exception):
+    """Raised when an upload crosses the configured size limit"""
+
+
+class StoredUpload:
+    """A fully received upload sitting in a temp file next to its final location"""
+
+    def __init__(self, temp_path: str, size: int, sha256: str):
+        self.temp_path = temp_path
+        self.size = size
+        self.sha256 = sha256
+
+    async def commit(self, final_path: str) -> str:
+        """Atomically move the upload to its final path"""
+        await aiofiles.os.replace(self.temp_path, final_path)
+        return final_path
+
+    async def discard(self) -> None:
+        """Delete the temp file"""
+        try:
+            await aiofiles.os.remove(self.temp_path)
+        except FileNotFoundError:
+            pass
+
+
+async def stream_to_temp_file(source, directory: str, max_size: int) -> StoredUpload:
+    """
+    Copy an async readable (e.g. UploadFile) to a temp file in `directory`.
+
+    Reads CHUNK_SIZE bytes at a time, hashing as it goes, and aborts with
+    UploadTooLargeError as soon as more than max_size bytes have been read.
+    The temp file lives in the destination directory so StoredUpload.commit
+    is a same-filesystem rename.
+    """
+    await aiofiles.os.makedirs(directory, exist_ok=True)
+    temp_path = os.path.join(directory, f".upload-{uuid.uuid4().hex}.part")
+    digest = hashlib.sha256()
+    size = 0
+
+    try:
+        async with aiofiles.open(temp_path, "wb") as out:
+            while True:
+                chunk = await source.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > max_size:
+                    raise UploadTooLargeError(f"Upload exceeds {max_size} bytes")
+                digest.update(chunk)
+                await out.write(chunk)
+    except BaseException:
+        try:
+            await aiofiles.os.remove(temp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+    return StoredUpload(temp_path, size, digest.hexdigest())
+
+
+def content_length_exceeds(content_length: Optional[str], max_size: int, overhead: int = 64 * 1024) -> bool:
+    """Whether a Content-Length header already rules out a body within max_size (plus multipart overhead)"""
+    try:
+        return content_length is not None and int(content_length) > max_size + overhead
+    except ValueError:
+        return False
@@ -0,0 +1,252 @@
+import asyncio
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Dict, Iterable, Optional
+from uuid import UUID
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import event, inspect, select
+from sqlalchemy.orm import Session
+
+from ..config import settings
+from ..models.user import User
+
+logger = logging.getLogger(__name__)
+
+REDIS_RETRY_SECONDS = 30
+
+
+@dataclass(frozen=True)
+class UserPrincipal:
+    """
+    The authenticated user, as seen by route handlers.
+
+    A plain immutable snapshot rather than a session-bound ORM instance, so it
+    can be cached across requests. Carries exactly the fields UserResponse
+    exposes.
+    """
+    id: UUID
+    email: str
+    full_name: Optional[str]
+    email_verified: bool
+    created_at: datetime
+
+    @classmethod
+    def from_user(cls, user: User) -> "UserPrincipal":
+        return cls(
+            id=user.id,
+            email=user.email,
+            full_name=user.full_name,
+            email_verified=bool(user.email_verified),
+            created_at=user.created_at,
+        )
+
+    def to_json(self) -> str:
+        data = asdict(self)
+        data["id"] = str(self.id)
+        data["created_at"] = self.created_at.isoformat() if self.created_at else None
+        return json.dumps(data)
+
+    @classmethod
+    def from_json(cls, raw) -> "UserPrincipal":
+        data = json.loads(raw)
+        data["id"] = UUID(data["id"])
+        data["created_at"] = datetime.fromisoformat(data["created_at"]) if data["created_at"] else None
+        return cls(**data)
+
+
+class UserPrincipalCache:
+    """
+    Short-TTL cache of UserPrincipal by user id.
+
+    An in-process TTL/LRU tier answers most lookups without any I/O; an
+    optional Redis tier lets workers share entries. Entries are invalidated
+    once a session that updated or deleted users (through the ORM or an ORM
+    bulk update/delete) commits; other processes' in-process entries, and
+    changes made in raw SQL, expire within the TTLs.
+    """
+
+    def __init__(self, ttl_seconds: int, local_ttl_seconds: int, max_size: int, redis_url: Optional[str] = None):
+        self.ttl_seconds = ttl_seconds
+        self.local_ttl_seconds = local_ttl_seconds
+        self.max_size = max_size
+        self.redis_url = redis_url
+        self._redis = None
+        self._redis_down_until = 0.0
+        self._local: "OrderedDict[UUID, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.local_hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def _redis_client(self):
+        """The Redis client, or None if Redis is disabled or recently failed"""
+        if not self.redis_url or time.monotonic() < self._redis_down_until:
+            return None
+        if self._redis is None:
+            import redis
+
+            self._redis = redis.Redis.from_url(self.redis_url, socket_timeout=0.05, socket_connect_timeout=0.05)
+        return self._redis
+
+    def _redis_failed(self) -> None:
+        # Skip Redis for a while instead of paying the timeout on every lookup
+        self._redis_down_until = time.monotonic() + REDIS_RETRY_SECONDS
+        logger.debug("User cache Redis unavailable", exc_info=True)
+
+    @staticmethod
+    def _key(user_id: UUID) -> str:
+        return f"user:principal:{user_id}"
+
+    def _get_local(self, user_id: UUID) -> Optional[UserPrincipal]:
+        with self._lock:
+            entry = self._local.get(user_id)
+            if entry is None:
+                return None
+            principal, expires_at = entry
+            if expires_at < time.monotonic():
+                del self._local[user_id]
+                return None
+            self._local.move_to_end(user_id)
+            return principal
+
+    def _set_local(self, principal: UserPrincipal) -> None:
+        with self._lock:
+            self._local[principal.id] = (principal, time.monotonic() + self.local_ttl_seconds)
+            self._local.move_to_end(principal.id)
+            while len(self._local) > self.max_size:
+                self._local.popitem(last=False)
+
+    def _get_redis(self, user_id: UUID) -> Optional[UserPrincipal]:
+        client = self._redis_client()
+        if client is None:
+            return None
+        try:
+            raw = client.get(self._key(user_id))
+        except Exception:
+            self._redis_failed()
+            return None
+        return UserPrincipal.from_json(raw) if raw else None
+
+    def _set_redis(self, principal: UserPrincipal) -> None:
+        client = self._redis_client()
+        if client is None:
+            return
+        try:
+            client.set(self._key(principal.id), principal.to_json(), ex=self.ttl_seconds)
+        except Exception:
+            self._redis_failed()
+
+    async def get(self, user_id: UUID) -> Optional[UserPrincipal]:
+        principal = self._get_local(user_id)
+        if principal is not None:
+            self.local_hits += 1
+            return principal
+        if self.redis_url:
+            principal = await run_in_threadpool(self._get_redis, user_id)
+            if principal is not None:
+                self.redis_hits += 1
+                self._set_local(principal)
+                return principal
+        self.misses += 1
+        return None
+
+    async def set(self, principal: UserPrincipal) -> None:
+        self._set_local(principal)
+        if self.redis_url:
+            await run_in_threadpool(self._set_redis, principal)
+
+    def _delete_redis(self, user_ids: list) -> None:
+        client = self._redis_client()
+        if client is None:
+            return
+        try:
+            client.delete(*(self._key(user_id) for user_id in user_ids))
+        except Exception:
+            logger.warning("User cache Redis invalidation failed for %d users", len(user_ids), exc_info=True)
+            self._redis_failed()
+
+    def invalidate(self, user_ids: Iterable[UUID]) -> None:
+        """Drop users from both tiers; on an event loop the Redis delete runs in the threadpool"""
+        user_ids = list(user_ids)
+        if not user_ids:
+            return
+        with self._lock:
+            for user_id in user_ids:
+                self._local.pop(user_id, None)
+        self.invalidations += len(user_ids)
+        if not self.redis_url:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._delete_redis(user_ids)
+        else:
+            loop.run_in_executor(None, self._delete_redis, user_ids)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._local.clear()
+
+    def stats(self) -> Dict[str, object]:
+        """Hit/miss counters; every miss is one users-table query"""
+        lookups = self.local_hits + self.redis_hits + self.misses
+        return {
+            "local_items": len(self._local),
+            "local_hits": self.local_hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "hit_rate": round((self.local_hits + self.redis_hits) / lookups, 4) if lookups else 0.0,
+        }
+
+
+user_cache = UserPrincipalCache(
+    ttl_seconds=settings.USER_CACHE_TTL_SECONDS,
+    local_ttl_seconds=settings.USER_CACHE_LOCAL_TTL_SECONDS,
+    max_size=settings.USER_CACHE_SIZE,
+    redis_url=settings.REDIS_URL if settings.USER_CACHE_REDIS else None,
+)
+
+
+_PENDING_KEY = "user_cache_invalidate"
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _collect_user(mapper, connection, target: User) -> None:
+    # Flush runs before commit: invalidating now would let a concurrent request
+    # re-cache the old row, so remember the id until the transaction commits
+    session = Session.object_session(target)
+    if session is not None:
+        session.info.setdefault(_PENDING_KEY, set()).add(target.id)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_bulk_users(orm_execute_state) -> None:
+    """Record the users an ORM bulk update(User)/delete(User) is about to change"""
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    if orm_execute_state.bind_mapper is not inspect(User):
+        return
+    query = select(User.id)
+    if orm_execute_state.statement.whereclause is not None:
+        query = query.where(orm_execute_state.statement.whereclause)
+    user_ids = orm_execute_state.session.execute(query).scalars().all()
+    orm_execute_state.session.info.setdefault(_PENDING_KEY, set()).update(user_ids)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed(session: Session) -> None:
+    user_cache.invalidate(session.info.pop(_PENDING_KEY, ()))
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_rolled_back(session: Session, previous_transaction) -> None:
+    session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,83 @@
+from collections import Counter
+from typing import Dict, Iterable, Tuple
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models.interaction import UserInteractionCount, UserJobInteraction, UserJobListEntry
+from ..models.job import Job, JobMatch
+from ..models.resume import Resume
+from .job_lists import list_states_stmt
+
+# Interaction types surfaced on the dashboard from the running counters
+DASHBOARD_INTERACTIONS = ("applied",)
+
+
+def increment_counts_stmt(counts: Dict[Tuple[UUID, str], int]):
+    """Upsert that adds `counts[(user_id, interaction_type)]` to the running counters"""
+    stmt = insert(UserInteractionCount).values([
+        {"user_id": user_id, "interaction_type": interaction_type, "count": n}
+        for (user_id, interaction_type), n in counts.items()
+    ])
+    return stmt.on_conflict_do_update(
+        index_elements=[UserInteractionCount.user_id, UserInteractionCount.interaction_type],
+        set_={"count": UserInteractionCount.count + stmt.excluded.count, "updated_at": func.now()}
+    )
+
+
+async def record_interactions(db: AsyncSession, interactions: Iterable[UserJobInteraction]) -> None:
+    """
+    Add interactions to the session, bump the matching counters and move the
+    saved/applied list entries they touch.
+
+    All writes go through the caller's transaction, so counters and lists only
+    move when the interactions are committed.
+    """
+    interactions = list(interactions)
+    if not interactions:
+        return
+    db.add_all(interactions)
+    counts = Counter((i.user_id, i.interaction_type) for i in interactions)
+    # Sorted so concurrent writers take counter row locks in the same order
+    await db.execute(increment_counts_stmt(dict(sorted(counts.items(), key=lambda kv: (str(kv[0][0]), kv[0][1])))))
+    lists = list_states_stmt(interactions)
+    if lists is not None:
+        await db.execute(lists)
+
+
+async def get_user_stats(db: AsyncSession, user_id: UUID) -> Dict[str, int]:
+    """
+    Dashboard counts for a user in one round trip.
+
+    Resume and match counts are index-only counts bounded by the number of
+    resumes and MATCH_TOP_K; applications come from the maintained counters,
+    so cost does not grow with interaction history. Saved jobs are counted
+    from the current saved list exactly as /saved/list shows it, bounded by
+    its length, so unsaving lowers the count.
+    """
+    resumes = select(func.count()).select_from(Resume).where(Resume.user_id == user_id).scalar_subquery()
+    matches = select(func.count()).select_from(JobMatch).where(JobMatch.user_id == user_id).scalar_subquery()
+    interactions = [
+        func.coalesce(
+            select(UserInteractionCount.count).where(
+                UserInteractionCount.user_id == user_id,
+                UserInteractionCount.interaction_type == interaction_type
+            ).scalar_subquery(),
+            0
+        ).label(interaction_type)
+        for interaction_type in DASHBOARD_INTERACTIONS
+    ]
+    saved = (
+        select(func.count())
+        .select_from(UserJobListEntry)
+        .join(Job, Job.id == UserJobListEntry.job_id)
+        .where(UserJobListEntry.user_id == user_id, UserJobListEntry.state == "saved", Job.is_active == True)
+        .scalar_subquery()
+    )
+
+    row = (await db.execute(
+        select(resumes.label("resumes"), matches.label("matches"), *interactions, saved.label("saved"))
+    )).one()
+    return dict(row._mapping)
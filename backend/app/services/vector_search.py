@@ -0,0 +1,57 @@
+from typing import List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from ..config import settings
+from ..models.job import Job
+
+
+def _set_local(db: Session, name: str, value) -> None:
+    """Set a planner/index GUC for the current transaction only"""
+    db.execute(text("SELECT set_config(:name, :value, true)"), {"name": name, "value": str(value)})
+
+
+def search_similar_jobs(
+    db: Session,
+    embedding: Sequence[float],
+    k: int = 100,
+    ef_search: Optional[int] = None,
+    probes: Optional[int] = None,
+    exact: bool = False,
+    exclude_job_ids: Optional[Sequence[UUID]] = None,
+) -> List[Tuple[UUID, float]]:
+    """
+    Find the k active jobs whose embeddings are closest (cosine) to `embedding`.
+
+    Served by the partial HNSW index ix_jobs_embedding_hnsw. `ef_search` trades
+    recall for latency on HNSW (higher = more accurate, slower); `probes` is the
+    equivalent knob if the index is rebuilt as IVFFlat. Both are applied with
+    SET LOCAL semantics so they only affect this transaction. `exact` disables
+    index scans for this query only, to get brute-force ground truth.
+
+    Returns (job_id, cosine_similarity) pairs, most similar first.
+    """
+    # HNSW returns at most ef_search candidates, so never go below k
+    _set_local(db, "hnsw.ef_search", max(ef_search or settings.VECTOR_SEARCH_EF_SEARCH, k))
+    _set_local(db, "ivfflat.probes", probes or settings.VECTOR_SEARCH_PROBES)
+    indexscan = None
+    if exact:
+        indexscan = db.execute(text("SELECT current_setting('enable_indexscan')")).scalar()
+        _set_local(db, "enable_indexscan", "off")
+
+    distance = Job.embedding.cosine_distance(embedding)
+    query = db.query(Job.id, (1 - distance).label("similarity")).filter(
+        Job.is_active == True,
+        Job.embedding.isnot(None),
+    )
+    if exclude_job_ids:
+        query = query.filter(Job.id.notin_(exclude_job_ids))
+
+    rows = query.order_by(distance).limit(k).all()
+    if indexscan is not None:
+        # Don't turn the rest of the caller's transaction into sequential scans
+        # (a failed query aborts the transaction, and its rollback resets this anyway)
+        _set_local(db, "enable_indexscan", indexscan)
+    return [(row.id, float(row.similarity)) for row in rows]
@@ -0,0 +1,70 @@
+from celery import Celery
+from celery.signals import worker_init, worker_process_init
+
+from ..config import settings
+
+celery_app = Celery(
+    "resumeseeker",
+    broker=settings.celery_broker,
+    backend=settings.celery_backend,
+    include=["app.workers.tasks"],
+)
+
+celery_app.conf.update(
+    task_serializer="json",
+    result_serializer="json",
+    accept_content=["json"],
+    timezone="UTC",
+    enable_utc=True,
+    task_acks_late=True,
+    worker_prefetch_multiplier=1,
+    beat_schedule={
+        "refresh-job-matches": {
+            "task": "matching.refresh_matches",
+            "schedule": settings.MATCH_REFRESH_INTERVAL_SECONDS,
+        },
+        "rematch-edited-users": {
+            "task": "matching.rematch_dirty",
+            "schedule": settings.MATCH_REMATCH_POLL_SECONDS,
+        },
+        "embed-pending-resumes": {
+            "task": "embeddings.embed_resumes",
+            "schedule": 300,
+        },
+        "embed-pending-jobs": {
+            "task": "embeddings.embed_jobs",
+            "schedule": 300,
+        },
+        "sweep-expired-jobs": {
+            "task": "jobs.sweep_expired",
+            "schedule": settings.JOB_SWEEP_INTERVAL_SECONDS,
+        },
+    },
+)
+
+
+@worker_init.connect
+def preload_models(**kwargs):
+    """Load models in the parent before the pool forks, so every child shares the weights"""
+    # Only loading happens here; inference, which starts torch's thread pools, runs in the children
+    from ..ml.model_registry import model_registry
+
+    model_registry.preload(settings.worker_model_preload_list)
+
+
+@worker_process_init.connect
+def warm_embedding_model(**kwargs):
+    """Load the embedding model in pool processes that didn't inherit it from the parent"""
+    from ..ml.model_registry import model_registry
+
+    model_registry.warm(["embedding"])
+
+
+@worker_process_init.connect
+def install_slow_query_log(**kwargs):
+    """Log slow statements from tasks the same way the API does"""
+    if settings.METRICS_ENABLED:
+        from ..database import engine
+        from ..services.metrics import install_query_hooks
+
+        install_query_hooks(engine, settings.SLOW_QUERY_MS)
@@ -0,0 +1,100 @@
+import asyncio
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from .celery_app import celery_app
+from ..config import settings
+from ..database import SessionLocal
+from ..ml.embedding_cache import get_embedding_cache
+from ..ml.embeddings import embed_jobs, embed_resumes
+from ..models.resume import Resume
+from ..services.job_dedup import index_jobs
+from ..services.job_expiry import sweep_jobs
+from ..services.match_pipeline import latest_parsed_resume_ids, refresh_matches, rematch_users
+from ..services.rematch_queue import rematch_queue
+
+
+@celery_app.task(name="embeddings.embed_jobs")
+def embed_jobs_task(job_ids: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Embed the given jobs, or every active job still missing an embedding"""
+    db = SessionLocal()
+    try:
+        ids = [UUID(i) for i in job_ids] if job_ids is not None else None
+        embedded = embed_jobs(db, ids)
+        return {"embedded": embedded, "cache": get_embedding_cache().stats()}
+    finally:
+        db.close()
+
+
+@celery_app.task(name="embeddings.embed_resumes")
+def embed_resumes_task(resume_ids: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Embed the given resumes, or every parsed resume still missing an embedding"""
+    db = SessionLocal()
+    try:
+        ids = [UUID(i) for i in resume_ids] if resume_ids is not None else None
+        embedded = embed_resumes(db, ids)
+        if ids:
+            # Newly parsed resumes: match their owners without waiting for the next full refresh
+            rematch_queue.mark_dirty(
+                user_id for (user_id,) in db.query(Resume.user_id).filter(Resume.id.in_(ids)).distinct()
+            )
+        return {"embedded": embedded, "cache": get_embedding_cache().stats()}
+    finally:
+        db.close()
+
+
+@celery_app.task(name="matching.refresh_matches")
+def refresh_matches_task() -> Dict[str, Any]:
+    """Incrementally refresh every user's materialized top-K job matches"""
+    db = SessionLocal()
+    try:
+        return refresh_matches(db)
+    finally:
+        db.close()
+
+
+@celery_app.task(name="matching.rematch_dirty")
+def rematch_dirty_task() -> Dict[str, Any]:
+    """Re-embed and fully re-match users whose resume edits have settled"""
+    user_ids = rematch_queue.claim_due(settings.MATCH_REMATCH_BATCH_SIZE)
+    if not user_ids:
+        return {"users": 0}
+    db = SessionLocal()
+    try:
+        # Skill edits change the embedded text; unchanged resumes are embedding cache hits
+        embed_resumes(db, latest_parsed_resume_ids(db, user_ids))
+        return {"users": len(user_ids), **rematch_users(db, user_ids)}
+    except Exception:
+        # Claimed users are off the queue; put them back so the work isn't lost
+        rematch_queue.mark_dirty(user_ids)
+        raise
+    finally:
+        db.close()
+
+
+@celery_app.task(name="dedup.index_jobs")
+def index_jobs_task() -> Dict[str, Any]:
+    """Add active jobs without a MinHash signature to the near-duplicate index"""
+    db = SessionLocal()
+    try:
+        return {"indexed": index_jobs(db)}
+    finally:
+        db.close()
+
+
+@celery_app.task(name="scraping.scrape_jobs")
+def scrape_jobs_task(sources: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Scrape job sources (default: every configured one) and ingest the postings"""
+    from ..scrapers import scrape
+
+    return asyncio.run(scrape(sources))
+
+
+@celery_app.task(name="jobs.sweep_expired")
+def sweep_expired_jobs_task() -> Dict[str, Any]:
+    """Retire expired jobs and archive long-inactive ones"""
+    db = SessionLocal()
+    try:
+        return sweep_jobs(db)
+    finally:
+        db.close()
@@ -0,0 +1,12 @@
+"""
+Benchmarks, run from backend/ as modules (python -m benchmarks.<name>).
+
+Typical regression check on one Linux box with a local Postgres:
+    python -m benchmarks.seed                      # reproducible dataset (once)
+    python -m benchmarks.micro --out base-micro.json
+    python -m benchmarks.load --url http://localhost:8000 --out base-load.json
+    ... change code, re-run with other --out files ...
+    python -m benchmarks.compare base-load.json new-load.json
+
+The bench_* scripts each measure one optimisation in isolation.
+"""
@@ -0,0 +1,88 @@
+"""
+Throughput of blocking psycopg2 calls inside `async def` vs the asyncpg AsyncSession.
+
+Mounts two endpoints that run the same query (a short pg_sleep standing in for
+a typical indexed lookup plus network latency) and fires N concurrent requests
+at each through the ASGI app. The sync endpoint reproduces the old pattern of a
+SessionLocal query inside an `async def` route, which blocks the event loop and
+serializes every request; the async endpoint uses get_async_db's session.
+
+Usage (from backend/, against a reachable database):
+    python -m benchmarks.bench_async_db [--concurrency 500] [--query-ms 5]
+"""
+import argparse
+import asyncio
+import json
+import time
+
+import httpx
+from fastapi import Depends, FastAPI
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.database import SessionLocal, get_async_db
+from benchmarks.common import summarize
+
+QUERY = text("SELECT pg_sleep(:seconds), 1")
+
+
+def build_app(query_seconds: float) -> FastAPI:
+    bench_app = FastAPI()
+
+    @bench_app.get("/sync")
+    async def sync_route():
+        db = SessionLocal()
+        try:
+            return {"value": db.execute(QUERY, {"seconds": query_seconds}).scalar()}
+        finally:
+            db.close()
+
+    @bench_app.get("/async")
+    async def async_route(db: AsyncSession = Depends(get_async_db)):
+        return {"value": (await db.execute(QUERY, {"seconds": query_seconds})).scalar()}
+
+    return bench_app
+
+
+async def hammer(client: httpx.AsyncClient, path: str, concurrency: int) -> dict:
+    latencies = []
+
+    async def one():
+        started = time.perf_counter()
+        response = await client.get(path)
+        response.raise_for_status()
+        latencies.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    return {"requests_per_s": round(concurrency / elapsed, 1), "elapsed_s": round(elapsed, 3), **summarize(latencies)}
+
+
+async def run(args) -> dict:
+    transport = httpx.ASGITransport(app=build_app(args.query_ms / 1000))
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        # Warm both pools
+        await hammer(client, "/sync", 10)
+        await hammer(client, "/async", 10)
+        return {
+            "benchmark": "async_db",
+            "concurrency": args.concurrency,
+            "query_ms": args.query_ms,
+            "pool": {"size": settings.DB_POOL_SIZE, "max_overflow": settings.DB_MAX_OVERFLOW},
+            "sync_session_in_async_route": await hammer(client, "/sync", args.concurrency),
+            "async_session": await hammer(client, "/async", args.concurrency),
+        }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--concurrency", type=int, default=500)
+    parser.add_argument("--query-ms", type=float, default=5.0)
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(run(args)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+/api/jobs latency while /api/auth/login is hammered.
+
+Measures GET /api/jobs/ p50/p99 on its own, then again while --login-concurrency
+clients loop on POST /api/auth/login for the same duration. With bcrypt on the
+bounded password hashing pool the feed latency should barely move; excess
+logins are shed with 503 rather than queueing. Login status counts and the
+hasher's stats are reported alongside.
+
+Usage (from backend/, against a migrated database):
+    python -m benchmarks.bench_auth_load [--seconds 10] [--login-concurrency 200] [--feed-concurrency 20]
+"""
+import argparse
+import asyncio
+import json
+import time
+from collections import Counter
+
+import httpx
+from sqlalchemy import text
+
+from app.database import SessionLocal
+from app.main import app
+from app.services.auth_service import create_access_token
+from app.services.password_hasher import password_hasher, pwd_context
+from benchmarks.common import summarize
+
+BENCH_EMAIL = "auth-load@bench.local"
+BENCH_PASSWORD = "bench-password"
+
+
+def fixture_user():
+    db = SessionLocal()
+    try:
+        user_id = db.execute(text("""
+            INSERT INTO users (id, email, password_hash) VALUES (gen_random_uuid(), :email, :hash)
+            ON CONFLICT (email) DO UPDATE SET password_hash = excluded.password_hash
+            RETURNING id
+        """), {"email": BENCH_EMAIL, "hash": pwd_context.hash(BENCH_PASSWORD)}).scalar()
+        db.commit()
+        return user_id
+    finally:
+        db.close()
+
+
+async def feed_load(client: httpx.AsyncClient, token: str, seconds: float, concurrency: int) -> dict:
+    latencies = []
+    deadline = time.perf_counter() + seconds
+
+    async def worker():
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            response = await client.get("/api/jobs/", headers={"Authorization": f"Bearer {token}"})
+            response.raise_for_status()
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return {"requests": len(latencies), **summarize(latencies)}
+
+
+async def login_load(client: httpx.AsyncClient, seconds: float, concurrency: int) -> Counter:
+    statuses = Counter()
+    deadline = time.perf_counter() + seconds
+
+    async def worker():
+        while time.perf_counter() < deadline:
+            response = await client.post(
+                "/api/auth/login", json={"email": BENCH_EMAIL, "password": BENCH_PASSWORD}
+            )
+            statuses[response.status_code] += 1
+            if response.status_code == 503:
+                # Honour Retry-After loosely so rejected clients don't spin
+                await asyncio.sleep(0.05)
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return statuses
+
+
+async def run(args) -> dict:
+    token = create_access_token({"sub": str(fixture_user())})
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=60) as client:
+        await feed_load(client, token, 1, 2)  # warm pools and the user cache
+        baseline = await feed_load(client, token, args.seconds, args.feed_concurrency)
+        under_load, logins = await asyncio.gather(
+            feed_load(client, token, args.seconds, args.feed_concurrency),
+            login_load(client, args.seconds, args.login_concurrency),
+        )
+    return {
+        "benchmark": "auth_load",
+        "seconds": args.seconds,
+        "login_concurrency": args.login_concurrency,
+        "jobs_feed_baseline": baseline,
+        "jobs_feed_during_login_storm": under_load,
+        "login_statuses": {str(code): n for code, n in sorted(logins.items())},
+        "logins_per_s": round(logins.get(200, 0) / args.seconds, 1),
+        "hasher": password_hasher.stats(),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--login-concurrency", type=int, default=200)
+    parser.add_argument("--feed-concurrency", type=int, default=20)
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(run(args)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
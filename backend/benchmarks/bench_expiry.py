@@ -0,0 +1,128 @@
+"""
+Expiry sweeper timings on a large jobs table, and its effect on concurrent writers.
+
+Seeds --jobs postings (1M by default), --expired-share of them past expires_at,
+with a few matches each, then runs deactivate_expired_jobs and
+archive_inactive_jobs (archiving immediately). While the sweep runs, a writer
+thread keeps updating random live jobs, the way ingestion would; its p99/max
+statement latency shows whether the sweep holds locks long enough to matter.
+
+Usage (from backend/, against a migrated database):
+    python -m benchmarks.bench_expiry [--jobs 1000000] [--expired-share 0.5] [--batch-size 5000] [--cleanup]
+"""
+import argparse
+import json
+import random
+import threading
+import time
+
+from sqlalchemy import text
+
+from app.database import SessionLocal
+from app.services.job_expiry import archive_inactive_jobs, deactivate_expired_jobs
+from benchmarks.common import summarize
+
+BENCH_SOURCE = "bench-expiry"
+BENCH_EMAIL = "expiry@bench.local"
+
+
+def seed(db, n_jobs: int, expired_share: float) -> None:
+    db.execute(text("DELETE FROM jobs WHERE source = :source"), {"source": BENCH_SOURCE})
+    db.execute(text("""
+        INSERT INTO jobs (id, external_job_id, source, title, company, description, is_active, posted_date, expires_at)
+        SELECT gen_random_uuid(), :source || '-' || g, :source, 'Engineer ' || g, 'Company ' || (g % 500),
+               repeat('lorem ipsum ', 50), true, current_date - 10,
+               CASE WHEN random() < :expired THEN current_date - 1 ELSE current_date + 30 END
+        FROM generate_series(1, :n) g
+    """), {"n": n_jobs, "source": BENCH_SOURCE, "expired": expired_share})
+    user_id = db.execute(text("""
+        INSERT INTO users (id, email, password_hash) VALUES (gen_random_uuid(), :email, 'x')
+        ON CONFLICT (email) DO UPDATE SET email = excluded.email
+        RETURNING id
+    """), {"email": BENCH_EMAIL}).scalar()
+    db.execute(text("""
+        INSERT INTO job_matches (id, user_id, job_id, match_score)
+        SELECT gen_random_uuid(), :user_id, id, 0.5 FROM jobs
+        WHERE source = :source AND random() < 0.1
+    """), {"user_id": user_id, "source": BENCH_SOURCE})
+    db.commit()
+    db.execute(text("ANALYZE jobs"))
+    db.commit()
+
+
+class Writer(threading.Thread):
+    """Updates random live bench jobs one statement at a time until stopped"""
+
+    def __init__(self, job_ids):
+        super().__init__(daemon=True)
+        self.job_ids = job_ids
+        self.latencies = []
+        self.stop = threading.Event()
+
+    def run(self) -> None:
+        db = SessionLocal()
+        try:
+            while not self.stop.is_set():
+                started = time.perf_counter()
+                db.execute(
+                    text("UPDATE jobs SET salary_min = salary_min WHERE id = :id"),
+                    {"id": random.choice(self.job_ids)}
+                )
+                db.commit()
+                self.latencies.append((time.perf_counter() - started) * 1000)
+        finally:
+            db.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--jobs", type=int, default=1_000_000)
+    parser.add_argument("--expired-share", type=float, default=0.5)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--cleanup", action="store_true")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        started = time.perf_counter()
+        seed(db, args.jobs, args.expired_share)
+        seed_s = time.perf_counter() - started
+
+        sample = [row[0] for row in db.execute(
+            text("SELECT id FROM jobs WHERE source = :source LIMIT 10000"), {"source": BENCH_SOURCE}
+        )]
+        db.commit()
+
+        writer = Writer(sample)
+        writer.start()
+        try:
+            deactivate = deactivate_expired_jobs(db, batch_size=args.batch_size)
+            archive = archive_inactive_jobs(db, batch_size=args.batch_size, after_days=0)
+        finally:
+            writer.stop.set()
+            writer.join()
+
+        print(json.dumps({
+            "benchmark": "expiry",
+            "jobs": args.jobs,
+            "expired_share": args.expired_share,
+            "batch_size": args.batch_size,
+            "seed_s": round(seed_s, 1),
+            "deactivate": deactivate,
+            "archive": archive,
+            "concurrent_writer": {
+                **summarize(writer.latencies),
+                "max_ms": round(max(writer.latencies, default=0.0), 3),
+            },
+        }, indent=2))
+    finally:
+        if args.cleanup:
+            db.execute(text("DELETE FROM jobs WHERE source = :source"), {"source": BENCH_SOURCE})
+            db.execute(text("DELETE FROM jobs_archive WHERE source = :source"), {"source": BENCH_SOURCE})
+            db.execute(text("DELETE FROM users WHERE email = :email"), {"email": BENCH_EMAIL})
+            db.commit()
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Overhead of request instrumentation: InstrumentationMiddleware and the SQL statement hooks.
+
+Times --requests calls to a trivial route on two otherwise identical apps, one
+wrapped in InstrumentationMiddleware, and --queries statements on an in-memory
+SQLite engine with and without install_query_hooks. Needs no database or Redis.
+
+Usage (from backend/):
+    python -m benchmarks.bench_instrumentation [--requests 5000] [--queries 20000]
+"""
+import argparse
+import asyncio
+import json
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import create_engine, text
+
+from app.middleware import InstrumentationMiddleware
+from app.services.metrics import install_query_hooks
+from benchmarks.common import summarize, time_async_calls, time_calls
+
+
+def make_app(instrumented: bool) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int):
+        return {"id": item_id}
+
+    if instrumented:
+        app.add_middleware(InstrumentationMiddleware, n_plus_one_threshold=20)
+    return app
+
+
+async def time_requests(instrumented: bool, n_requests: int) -> list:
+    transport = httpx.ASGITransport(app=make_app(instrumented))
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        return await time_async_calls(lambda: client.get("/items/1"), n_requests, warmup=50)
+
+
+def time_queries(instrumented: bool, n_queries: int) -> list:
+    engine = create_engine("sqlite://")
+    if instrumented:
+        # A threshold no statement reaches, so logging isn't part of the measurement
+        install_query_hooks(engine, slow_query_ms=60000)
+    with engine.connect() as conn:
+        statement = text("SELECT :a")
+        return time_calls(lambda: conn.execute(statement, {"a": 1}), n_queries, warmup=100)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--queries", type=int, default=20000)
+    args = parser.parse_args()
+
+    results = {}
+    for name, measure in (
+        ("request", lambda on: asyncio.run(time_requests(on, args.requests))),
+        ("query", lambda on: time_queries(on, args.queries)),
+    ):
+        plain = summarize(measure(False))
+        instrumented = summarize(measure(True))
+        results[name] = {
+            "plain": plain,
+            "instrumented": instrumented,
+            "overhead_us": round((instrumented["mean_ms"] - plain["mean_ms"]) * 1000, 1),
+        }
+
+    print(json.dumps({"benchmark": "instrumentation", "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
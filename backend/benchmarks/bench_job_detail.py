@@ -0,0 +1,123 @@
+"""
+GET /api/jobs/{id} latency: view interaction committed in-request vs buffered.
+
+Runs the same job-detail handler two ways under concurrent load: the previous
+version, which inserts the "viewed" interaction and commits before responding,
+and the current route, which queues it on interaction_buffer. Reports p50/p99
+and the buffer's batch stats.
+
+Usage (from backend/, against a migrated database with at least one active job):
+    python -m benchmarks.bench_job_detail [--requests 5000] [--concurrency 100]
+"""
+import argparse
+import asyncio
+import json
+import time
+from uuid import UUID
+
+import httpx
+from fastapi import Depends, FastAPI, HTTPException
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import SessionLocal, get_async_db
+from app.main import app
+from app.models.interaction import UserJobInteraction
+from app.models.job import Job
+from app.services.auth_service import create_access_token, get_current_user
+from app.services.interaction_buffer import interaction_buffer
+from app.services.user_cache import UserPrincipal
+from benchmarks.common import summarize
+
+BENCH_EMAIL = "job-detail@bench.local"
+
+
+def build_legacy_app() -> FastAPI:
+    legacy_app = FastAPI()
+
+    @legacy_app.get("/api/jobs/{job_id}")
+    async def get_job(
+        job_id: UUID,
+        current_user: UserPrincipal = Depends(get_current_user),
+        db: AsyncSession = Depends(get_async_db)
+    ):
+        job = (await db.execute(
+            select(Job).where(Job.id == job_id, Job.is_active == True)
+        )).scalar_one_or_none()
+        if not job:
+            raise HTTPException(status_code=404, detail="Job not found")
+        db.add(UserJobInteraction(user_id=current_user.id, job_id=job_id, interaction_type="viewed"))
+        await db.commit()
+        return {"id": str(job.id), "title": job.title}
+
+    return legacy_app
+
+
+def fixtures() -> tuple:
+    db = SessionLocal()
+    try:
+        user_id = db.execute(text("""
+            INSERT INTO users (id, email, password_hash) VALUES (gen_random_uuid(), :email, 'x')
+            ON CONFLICT (email) DO UPDATE SET email = excluded.email
+            RETURNING id
+        """), {"email": BENCH_EMAIL}).scalar()
+        job_ids = [row[0] for row in db.execute(text("SELECT id FROM jobs WHERE is_active LIMIT 100"))]
+        db.commit()
+        if not job_ids:
+            raise SystemExit("No active jobs to fetch; seed some first (e.g. benchmarks.bench_match_feed)")
+        return user_id, job_ids
+    finally:
+        db.close()
+
+
+async def hammer(target: FastAPI, token: str, job_ids: list, n_requests: int, concurrency: int) -> dict:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+    transport = httpx.ASGITransport(app=target)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def one(i):
+            async with semaphore:
+                started = time.perf_counter()
+                response = await client.get(
+                    f"/api/jobs/{job_ids[i % len(job_ids)]}", headers={"Authorization": f"Bearer {token}"}
+                )
+                response.raise_for_status()
+                latencies.append((time.perf_counter() - started) * 1000)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one(i) for i in range(n_requests)))
+        elapsed = time.perf_counter() - started
+    return {"requests_per_s": round(n_requests / elapsed, 1), **summarize(latencies)}
+
+
+async def run(args) -> dict:
+    user_id, job_ids = fixtures()
+    token = create_access_token({"sub": str(user_id)})
+    legacy_app = build_legacy_app()
+
+    # Warm pools and the user cache
+    await hammer(legacy_app, token, job_ids, 50, 10)
+    await hammer(app, token, job_ids, 50, 10)
+
+    before = await hammer(legacy_app, token, job_ids, args.requests, args.concurrency)
+    after = await hammer(app, token, job_ids, args.requests, args.concurrency)
+    await interaction_buffer.stop()
+    return {
+        "benchmark": "job_detail",
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "commit_per_request": before,
+        "buffered": {**after, "buffer": interaction_buffer.stats()},
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(run(args)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
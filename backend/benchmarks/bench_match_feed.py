@@ -0,0 +1,131 @@
+"""
+Match feed latency by page depth: legacy OFFSET + per-row Job lookup vs joined keyset feed.
+
+Seeds BENCH_USERS x BENCH_JOBS rows into job_matches (1M by default) and reports
+p50/p99 latency for fetching a page at increasing depths.
+
+Usage (from backend/, against a migrated database):
+    python -m benchmarks.bench_match_feed [--users 100] [--jobs 10000] [--limit 20] [--cleanup]
+"""
+import argparse
+import asyncio
+import json
+
+from sqlalchemy import text
+
+from app.database import AsyncSessionLocal, SessionLocal
+from app.models.job import Job, JobMatch
+from app.models.user import User
+from app.services.match_feed import get_match_feed
+from benchmarks.common import summarize, time_async_calls, time_calls
+
+BENCH_SOURCE = "bench"
+BENCH_EMAIL_DOMAIN = "bench.local"
+
+
+def seed(db, n_users: int, n_jobs: int) -> None:
+    """Seed users, jobs and their full cross product of matches in SQL"""
+    existing = db.execute(
+        text("SELECT count(*) FROM users WHERE email LIKE :pattern"),
+        {"pattern": f"%@{BENCH_EMAIL_DOMAIN}"}
+    ).scalar()
+    if existing:
+        return
+
+    db.execute(text("""
+        INSERT INTO users (id, email, password_hash)
+        SELECT gen_random_uuid(), 'bench-user-' || g || '@' || :domain, 'x'
+        FROM generate_series(1, :n) g
+    """), {"n": n_users, "domain": BENCH_EMAIL_DOMAIN})
+    # Every 10th job is inactive and every 20th has expired, so the SQL filter has work to do
+    db.execute(text("""
+        INSERT INTO jobs (id, external_job_id, source, title, company, description, is_active, expires_at)
+        SELECT gen_random_uuid(), 'bench-job-' || g, :source, 'Engineer ' || g, 'Company ' || (g % 500),
+               repeat('lorem ipsum ', 50), g % 10 <> 0,
+               CASE WHEN g % 20 = 0 THEN current_date - 1 ELSE NULL END
+        FROM generate_series(1, :n) g
+    """), {"n": n_jobs, "source": BENCH_SOURCE})
+    db.execute(text("""
+        INSERT INTO job_matches (id, user_id, job_id, match_score)
+        SELECT gen_random_uuid(), u.id, j.id, round(random()::numeric, 4)
+        FROM users u CROSS JOIN jobs j
+        WHERE u.email LIKE :pattern AND j.source = :source
+    """), {"pattern": f"%@{BENCH_EMAIL_DOMAIN}", "source": BENCH_SOURCE})
+    db.commit()
+    db.execute(text("ANALYZE job_matches"))
+    db.execute(text("ANALYZE jobs"))
+    db.commit()
+
+
+def cleanup(db) -> None:
+    """Remove seeded rows (matches cascade from users/jobs)"""
+    db.execute(text("DELETE FROM users WHERE email LIKE :pattern"), {"pattern": f"%@{BENCH_EMAIL_DOMAIN}"})
+    db.execute(text("DELETE FROM jobs WHERE source = :source"), {"source": BENCH_SOURCE})
+    db.commit()
+
+
+def legacy_page(db, user_id, page: int, limit: int) -> list:
+    """The original OFFSET pagination followed by one Job query per match"""
+    matches = db.query(JobMatch).filter(
+        JobMatch.user_id == user_id
+    ).order_by(
+        JobMatch.match_score.desc()
+    ).offset((page - 1) * limit).limit(limit).all()
+    return [db.query(Job).filter(Job.id == m.job_id).first() for m in matches]
+
+
+async def cursor_for_page(db, user_id, page: int, limit: int):
+    """Walk the keyset feed to find the cursor that starts the given page"""
+    cursor = None
+    for _ in range(page - 1):
+        _, cursor = await get_match_feed(db, user_id, limit=limit, cursor=cursor)
+        if cursor is None:
+            break
+    return cursor
+
+
+async def keyset_timings(user_id, pages, limit: int, repeat: int) -> dict:
+    async with AsyncSessionLocal() as db:
+        timings = {}
+        for page in pages:
+            cursor = await cursor_for_page(db, user_id, page, limit)
+            timings[page] = await time_async_calls(
+                lambda: get_match_feed(db, user_id, limit=limit, cursor=cursor), repeat
+            )
+        return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--jobs", type=int, default=10000)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 10, 50, 100, 250, 400])
+    parser.add_argument("--cleanup", action="store_true")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        seed(db, args.users, args.jobs)
+        user = db.query(User).filter(User.email.like(f"%@{BENCH_EMAIL_DOMAIN}")).first()
+
+        keyset = asyncio.run(keyset_timings(user.id, args.pages, args.limit, args.repeat))
+        results = []
+        for page in args.pages:
+            legacy = time_calls(lambda: legacy_page(db, user.id, page, args.limit), args.repeat)
+            results.append({
+                "page": page,
+                "legacy_offset": summarize(legacy),
+                "keyset_join": summarize(keyset[page]),
+            })
+
+        print(json.dumps({"benchmark": "match_feed", "rows": args.users * args.jobs, "results": results}, indent=2))
+    finally:
+        if args.cleanup:
+            cleanup(db)
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
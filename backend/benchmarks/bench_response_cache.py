@@ -0,0 +1,157 @@
+"""
+Job detail and match feed latency and SQL statements per request: uncached, cached, and 304.
+
+Seeds one user with --matches job matches, then fetches job details and the
+first feed pages --requests times in three modes: with the response cache
+disabled (every request reads Postgres), with the cache warm, and with the
+client sending the ETag it was given (If-None-Match -> 304). SQL statements are
+counted on the async engine for each mode.
+
+Usage (from backend/, against a migrated database; Redis is needed for feed caching):
+    python -m benchmarks.bench_response_cache [--matches 200] [--requests 2000] [--concurrency 50] [--cleanup]
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+
+import httpx
+from sqlalchemy import event, text
+
+from app.database import SessionLocal, async_engine
+from app.main import app
+from app.services.auth_service import create_access_token
+from app.services.response_cache import response_cache
+from benchmarks.common import summarize
+
+BENCH_SOURCE = "bench-response-cache"
+BENCH_EMAIL = "response-cache@bench.local"
+
+
+def seed(n_matches: int) -> tuple:
+    db = SessionLocal()
+    try:
+        user_id = db.execute(text("""
+            INSERT INTO users (id, email, password_hash) VALUES (gen_random_uuid(), :email, 'x')
+            ON CONFLICT (email) DO UPDATE SET email = excluded.email
+            RETURNING id
+        """), {"email": BENCH_EMAIL}).scalar()
+        db.execute(text("DELETE FROM jobs WHERE source = :source"), {"source": BENCH_SOURCE})
+        job_ids = [row[0] for row in db.execute(text("""
+            INSERT INTO jobs (id, external_job_id, source, title, company, description, is_active)
+            SELECT gen_random_uuid(), :source || '-' || g, :source, 'Engineer ' || g, 'Company ' || g,
+                   repeat('A long job description paragraph. ', 150), true
+            FROM generate_series(1, :n) g
+            RETURNING id
+        """), {"n": n_matches, "source": BENCH_SOURCE})]
+        db.execute(text("""
+            INSERT INTO job_matches (id, user_id, job_id, match_score, match_reasons)
+            SELECT gen_random_uuid(), :user_id, id, round(random()::numeric, 4), '{"skills": ["Python"]}'
+            FROM jobs WHERE source = :source
+        """), {"user_id": user_id, "source": BENCH_SOURCE})
+        db.commit()
+        return user_id, job_ids
+    finally:
+        db.close()
+
+
+def cleanup() -> None:
+    db = SessionLocal()
+    try:
+        db.execute(text("DELETE FROM jobs WHERE source = :source"), {"source": BENCH_SOURCE})
+        db.execute(text("DELETE FROM users WHERE email = :email"), {"email": BENCH_EMAIL})
+        db.commit()
+    finally:
+        db.close()
+
+
+class QueryCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, *args, **kwargs):
+        self.count += 1
+
+
+async def replay(token: str, paths: list, n_requests: int, concurrency: int, conditional: bool) -> dict:
+    schedule = random.Random(3).choices(paths, k=n_requests)
+    semaphore = asyncio.Semaphore(concurrency)
+    etags = {}
+    latencies = []
+    statuses = {}
+
+    counter = QueryCounter()
+    event.listen(async_engine.sync_engine, "before_cursor_execute", counter)
+    transport = httpx.ASGITransport(app=app)
+    try:
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            # Prime caches and ETags outside the measurement
+            for path in paths:
+                response = await client.get(path, headers={"Authorization": f"Bearer {token}"})
+                etags[path] = response.headers.get("etag")
+            counter.count = 0
+
+            async def one(path):
+                headers = {"Authorization": f"Bearer {token}"}
+                if conditional and etags.get(path):
+                    headers["If-None-Match"] = etags[path]
+                async with semaphore:
+                    started = time.perf_counter()
+                    response = await client.get(path, headers=headers)
+                    latencies.append((time.perf_counter() - started) * 1000)
+                statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+            await asyncio.gather(*(one(path) for path in schedule))
+    finally:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", counter)
+
+    return {
+        **summarize(latencies),
+        "statuses": statuses,
+        "db_queries_per_request": round(counter.count / n_requests, 3),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--matches", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--cleanup", action="store_true")
+    args = parser.parse_args()
+
+    user_id, job_ids = seed(args.matches)
+    token = create_access_token({"sub": str(user_id)})
+    response_cache.bump_match_versions([user_id])
+    endpoints = {
+        "job_detail": [f"/api/jobs/{job_id}" for job_id in job_ids[:100]],
+        "match_feed": ["/api/jobs/?limit=20"],
+    }
+
+    results = {}
+    try:
+        for name, paths in endpoints.items():
+            max_size, redis_url = response_cache.max_size, response_cache.redis_url
+            response_cache.max_size, response_cache.redis_url = 0, None
+            uncached = asyncio.run(replay(token, paths, args.requests, args.concurrency, conditional=False))
+            response_cache.max_size, response_cache.redis_url = max_size, redis_url
+            response_cache.clear()
+            cached = asyncio.run(replay(token, paths, args.requests, args.concurrency, conditional=False))
+            not_modified = asyncio.run(replay(token, paths, args.requests, args.concurrency, conditional=True))
+            results[name] = {"uncached": uncached, "cached": cached, "if_none_match": not_modified}
+    finally:
+        if args.cleanup:
+            cleanup()
+
+    print(json.dumps({
+        "benchmark": "response_cache",
+        "matches": args.matches,
+        "requests": args.requests,
+        "results": results,
+        "cache": response_cache.stats(),
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Hybrid scoring kernel throughput: jobs scored per second per core.
+
+Builds synthetic JobBlocks of 10k, 100k and 1M jobs and times score_block /
+top_matches for one resume. BLAS is pinned to a single thread so the numbers
+are per core.
+
+Usage (from backend/):
+    python -m benchmarks.bench_scoring [--sizes 10000 100000 1000000] [--repeat 5]
+"""
+import os
+
+# Must be set before numpy loads its BLAS
+for var in ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS"):
+    os.environ.setdefault(var, "1")
+
+import argparse
+import json
+import uuid
+
+import numpy as np
+
+from app.ml.job_matcher import JobBlock, MatchPreferences, SkillVocabulary, score_block, top_matches
+from benchmarks.common import summarize, time_calls
+
+DIMENSION = 384
+SKILLS = [f"skill-{i}" for i in range(2000)]
+LOCATIONS = ["cape town", "johannesburg", "durban", "pretoria", "london", "berlin", "new york", None]
+REMOTE_TYPES = ["remote", "hybrid", "onsite", None]
+
+
+def synthetic_block(n: int, rng: np.random.Generator) -> JobBlock:
+    embeddings = rng.normal(size=(n, DIMENSION)).astype(np.float32)
+    embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+    skill_counts = rng.integers(0, 12, size=n)
+    salaries = rng.integers(20000, 200000, size=n)
+    return JobBlock(
+        job_ids=[uuid.UUID(int=i) for i in range(n)],
+        embeddings=embeddings,
+        skills=[[SKILLS[j] for j in rng.integers(0, len(SKILLS), size=c)] for c in skill_counts],
+        locations=[LOCATIONS[i] for i in rng.integers(0, len(LOCATIONS), size=n)],
+        remote_types=[REMOTE_TYPES[i] for i in rng.integers(0, len(REMOTE_TYPES), size=n)],
+        salary_min=[None if s % 3 == 0 else int(s) for s in salaries],
+        salary_max=[None if s % 5 == 0 else int(s * 1.3) for s in salaries],
+        vocabulary=SkillVocabulary(SKILLS),
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 1000000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--k", type=int, default=100)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    resume = rng.normal(size=DIMENSION).astype(np.float32)
+    resume /= np.linalg.norm(resume)
+    resume_skills = [SKILLS[i] for i in rng.integers(0, len(SKILLS), size=15)]
+    preferences = MatchPreferences(["cape town", "remote"], min_salary=60000, remote_preference="any")
+
+    results = []
+    for size in args.sizes:
+        block = synthetic_block(size, rng)
+        score = summarize(time_calls(lambda: score_block(block, resume, resume_skills, preferences), args.repeat))
+        top = summarize(time_calls(
+            lambda: top_matches(block, resume, resume_skills, preferences, k=args.k), args.repeat
+        ))
+        results.append({
+            "jobs": size,
+            "score_block": score,
+            "top_matches": top,
+            "jobs_per_s_per_core": round(size / (score["p50_ms"] / 1000)),
+        })
+        del block
+
+    print(json.dumps({"benchmark": "scoring", "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Scraper throughput in postings/minute against a local stub of the Adzuna API.
+
+Serves --pages pages of --per-page postings from an in-process uvicorn server
+(with optional per-request latency and ETag support), then runs AdzunaScraper
+twice through ScraperRunner: a cold run that fetches and ingests everything,
+and a warm run where every page should come back 304 Not Modified. Postings go
+to a counting sink unless --ingest is given, in which case they are upserted
+into the database through IngestionSink.
+
+Usage (from backend/):
+    python -m benchmarks.bench_scraper [--pages 200] [--per-page 50] [--latency-ms 50] [--concurrency 8] [--ingest]
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import socket
+import threading
+import time
+
+import uvicorn
+from fastapi import FastAPI, Request, Response
+
+from app.config import settings
+from app.scrapers.adzuna import AdzunaScraper
+from app.scrapers.base import IngestionSink, ScraperRunner, ValidatorStore
+
+
+def build_stub(pages: int, per_page: int, latency_ms: float) -> FastAPI:
+    stub = FastAPI()
+
+    @stub.get("/jobs/{country}/search/{page}")
+    async def search(country: str, page: int, request: Request):
+        await asyncio.sleep(latency_ms / 1000)
+        results = []
+        if page <= pages:
+            results = [
+                {
+                    "id": f"{page}-{i}",
+                    "title": f"<strong>Software Engineer</strong> {page}-{i}",
+                    "company": {"display_name": f"Company {(page * per_page + i) % 700}"},
+                    "location": {"display_name": "Cape Town, Western Cape"},
+                    "salary_min": 400000 + i * 1000,
+                    "salary_max": 600000 + i * 1000,
+                    "contract_time": "full_time",
+                    "description": f"Posting {page}-{i}: build services, ship features and own them. " * 5,
+                    "created": "2026-10-01T08:00:00Z",
+                    "redirect_url": f"https://example.com/{page}-{i}",
+                }
+                for i in range(per_page)
+            ]
+        body = json.dumps({"results": results}).encode()
+        etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+        return Response(body, media_type="application/json", headers={"ETag": etag})
+
+    return stub
+
+
+def serve(app: FastAPI) -> tuple:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.01)
+    return server, f"http://127.0.0.1:{port}"
+
+
+class CountingSink:
+    def __init__(self):
+        self.records = 0
+
+    async def __call__(self, records, committed) -> None:
+        self.records += len(records)
+        await committed()
+
+    async def close(self) -> dict:
+        return {"received": self.records}
+
+
+async def run(args, base_url: str) -> dict:
+    validators = ValidatorStore()
+    runs = {}
+    for name in ("cold", "warm"):
+        sink = IngestionSink() if args.ingest else CountingSink()
+        scraper = AdzunaScraper(base_url=base_url, max_pages=args.pages + 1)
+        scraper.rate_per_second = args.rate
+        scraper.burst = args.concurrency
+        scraper.concurrency = args.concurrency
+        async with ScraperRunner(sink, validators=validators) as runner:
+            stats = await runner.run(scraper)
+        runs[name] = {**stats.as_dict(), "sink": await sink.close()}
+    return runs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--per-page", type=int, default=50)
+    parser.add_argument("--latency-ms", type=float, default=50)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--rate", type=float, default=1000.0, help="requests per second allowed by the token bucket")
+    parser.add_argument("--ingest", action="store_true")
+    args = parser.parse_args()
+
+    server, base_url = serve(build_stub(args.pages, args.per_page, args.latency_ms))
+    try:
+        runs = asyncio.run(run(args, base_url))
+    finally:
+        server.should_exit = True
+    print(json.dumps({
+        "benchmark": "scraper",
+        "pages": args.pages,
+        "per_page": args.per_page,
+        "latency_ms": args.latency_ms,
+        "concurrency": args.concurrency,
+        "http2": settings.SCRAPER_HTTP2,
+        "runs": runs,
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+Job search latency (results page + facet counts) on a large seeded jobs table.
+
+Seeds --jobs active postings (1M by default) with skills drawn from the bundled
+taxonomy (skewed so a few skills are common), a spread of locations, work
+arrangements and salaries, and generated descriptions. Then times search_jobs
+for a set of filter combinations, each with --repeat distinct queries, and
+checks p99 against --target-p99-ms.
+
+Usage (from backend/, against a migrated database):
+    python -m benchmarks.bench_search [--jobs 1000000] [--repeat 50] [--target-p99-ms 200] [--cleanup]
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+
+from sqlalchemy import text
+
+from app.database import AsyncSessionLocal, SessionLocal
+from app.ml.skill_extractor import BUNDLED_TAXONOMY, load_taxonomy
+from app.services.job_search import JobSearchFilters, search_jobs
+from benchmarks.common import summarize
+
+BENCH_SOURCE = "bench-search"
+
+LOCATIONS = [
+    "Cape Town, Western Cape", "Johannesburg, Gauteng", "Sandton, Gauteng", "Pretoria, Gauteng",
+    "Durban, KwaZulu-Natal", "Stellenbosch, Western Cape", "Port Elizabeth, Eastern Cape",
+    "Bloemfontein, Free State", "Centurion, Gauteng", "Midrand, Gauteng", "Remote",
+]
+TITLES = ["Software Engineer", "Data Analyst", "Accountant", "Sales Manager", "DevOps Engineer",
+          "Product Manager", "Data Scientist", "Frontend Developer", "Backend Developer", "HR Officer"]
+WORDS = ("build maintain design deliver team clients reporting systems platform customers growth "
+         "experience degree years strong communication stakeholders analysis cloud services quality "
+         "support office hybrid benefits medical senior junior intermediate lead projects").split()
+
+
+def seed(db, n_jobs: int) -> None:
+    existing = db.execute(text("SELECT count(*) FROM jobs WHERE source = :source"), {"source": BENCH_SOURCE}).scalar()
+    if existing >= n_jobs:
+        return
+    db.execute(text("DELETE FROM jobs WHERE source = :source"), {"source": BENCH_SOURCE})
+    skills = [skill.name for skill in load_taxonomy(BUNDLED_TAXONOMY)]
+    # Array elements and random() picks reference g so Postgres evaluates them per row
+    db.execute(text("""
+        INSERT INTO jobs (id, external_job_id, source, title, company, location, remote_type, employment_type,
+                          salary_min, salary_max, description, skills_required, posted_date, is_active)
+        SELECT gen_random_uuid(), :source || '-' || g, :source,
+               (:titles)[1 + g % cardinality(:titles)] || ' ' || g,
+               'Company ' || (g % 5000),
+               (:locations)[1 + floor(power(random(), 1.5) * cardinality(:locations))::int],
+               (ARRAY['remote', 'hybrid', 'onsite'])[1 + g % 3],
+               (ARRAY['full-time', 'full-time', 'full-time', 'contract', 'part-time'])[1 + g % 5],
+               CASE WHEN g % 4 = 0 THEN NULL ELSE 150000 + (g * 7919 % 1500000) END,
+               CASE WHEN g % 4 = 0 THEN NULL ELSE 250000 + (g * 7919 % 1500000) END,
+               array_to_string(ARRAY(
+                   SELECT (:words)[1 + floor(random() * cardinality(:words))::int]
+                   FROM generate_series(1, 60 + g % 40)
+               ), ' '),
+               ARRAY(
+                   SELECT DISTINCT (:skills)[1 + floor(power(random(), 2.5) * cardinality(:skills))::int]
+                   FROM generate_series(1, 3 + g % 6)
+               ),
+               current_date - (g % 60),
+               true
+        FROM generate_series(1, :n) g
+    """), {
+        "n": n_jobs, "source": BENCH_SOURCE, "titles": TITLES, "locations": LOCATIONS,
+        "words": WORDS, "skills": skills,
+    })
+    db.commit()
+    db.execute(text("ANALYZE jobs"))
+    db.commit()
+
+
+def scenarios(rng: random.Random, skills: list) -> dict:
+    common = skills[:30]
+    return {
+        "text": lambda: JobSearchFilters(q=rng.choice(TITLES).lower()),
+        "skills_all": lambda: JobSearchFilters(skills=rng.sample(common, 2)),
+        "skills_any_remote": lambda: JobSearchFilters(
+            skills=rng.sample(skills, 3), match_all_skills=False, remote_types=["remote"]
+        ),
+        "location": lambda: JobSearchFilters(location=rng.choice(LOCATIONS).split(",")[0]),
+        "salary_range": lambda: JobSearchFilters(salary_min=rng.randrange(300000, 900000, 50000),
+                                                 salary_max=rng.randrange(900000, 1500000, 50000)),
+        "combined": lambda: JobSearchFilters(
+            q=rng.choice(TITLES).split()[0].lower(), skills=[rng.choice(common)],
+            location=rng.choice(LOCATIONS).split(",")[0], remote_types=["hybrid", "remote"],
+            employment_types=["full-time"], salary_min=400000,
+        ),
+        "unfiltered": lambda: JobSearchFilters(),
+    }
+
+
+async def run(args) -> dict:
+    rng = random.Random(args.seed)
+    skills = [skill.name for skill in load_taxonomy(BUNDLED_TAXONOMY)]
+    results = {}
+    async with AsyncSessionLocal() as db:
+        for name, make_filters in scenarios(rng, skills).items():
+            samples, totals = [], []
+            for i in range(args.repeat + 2):
+                filters = make_filters()
+                started = time.perf_counter()
+                result = await search_jobs(db, filters, limit=20)
+                elapsed = (time.perf_counter() - started) * 1000
+                await db.rollback()
+                if i >= 2:  # warm-up
+                    samples.append(elapsed)
+                    totals.append(result.total)
+            summary = summarize(samples)
+            results[name] = {
+                **summary,
+                "mean_total": round(sum(totals) / len(totals)) if totals else 0,
+                "meets_target": summary["p99_ms"] <= args.target_p99_ms,
+            }
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--jobs", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--target-p99-ms", type=float, default=200)
+    parser.add_argument("--seed", type=int, default=11)
+    parser.add_argument("--cleanup", action="store_true")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        started = time.perf_counter()
+        seed(db, args.jobs)
+        seed_s = time.perf_counter() - started
+        results = asyncio.run(run(args))
+        print(json.dumps({
+            "benchmark": "search",
+            "jobs": args.jobs,
+            "seed_s": round(seed_s, 1),
+            "target_p99_ms": args.target_p99_ms,
+            "scenarios": results,
+            "all_meet_target": all(r["meets_target"] for r in results.values()),
+        }, indent=2))
+    finally:
+        if args.cleanup:
+            db.execute(text("DELETE FROM jobs WHERE source = :source"), {"source": BENCH_SOURCE})
+            db.commit()
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
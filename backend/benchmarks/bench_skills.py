@@ -0,0 +1,127 @@
+"""
+Skill extraction throughput (MB/s of text) against a large taxonomy.
+
+Builds a taxonomy of --terms skills (the bundled one padded with synthetic
+one- to three-word terms and aliases), compiles it, caches it on disk and
+times a cold mmap load against compiling from scratch. Then scans --mb of
+synthetic job-description text in which roughly --mention-rate of the words
+belong to a skill term, and, for comparison, scans a slice of the same text
+with one compiled regex per term over a --baseline-terms sample.
+
+Usage (from backend/):
+    python -m benchmarks.bench_skills [--terms 30000] [--mb 20] [--mention-rate 0.03] [--baseline-terms 2000]
+"""
+import argparse
+import json
+import random
+import re
+import string
+import tempfile
+import time
+
+from app.ml.skill_extractor import (
+    BUNDLED_TAXONOMY,
+    Skill,
+    SkillAutomaton,
+    compile_automaton,
+    load_taxonomy,
+)
+
+FILLER = (
+    "we are looking for an experienced engineer to join our growing team you will work with "
+    "stakeholders across the business design build and maintain reliable systems strong "
+    "ownership clear written communication and a passion for quality are essential the role "
+    "offers flexible hours competitive salary medical aid and a hybrid working model in cape town"
+).split()
+
+
+def synthetic_taxonomy(terms: int, rng: random.Random) -> list:
+    skills = load_taxonomy(BUNDLED_TAXONOMY)
+    words = ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 9))) for _ in range(terms // 2)]
+    while len(skills) < terms:
+        name = " ".join(rng.sample(words, rng.randint(1, 3)))
+        aliases = [" ".join(rng.sample(words, rng.randint(1, 2)))] if rng.random() < 0.5 else []
+        skills.append(Skill(id=f"syn-{len(skills)}", name=name, aliases=aliases))
+    return skills
+
+
+def synthetic_text(skills: list, megabytes: float, mention_rate: float, rng: random.Random) -> str:
+    terms = [term for skill in skills for term in (skill.name, *skill.aliases)]
+    target = int(megabytes * 1_000_000)
+    parts, size = [], 0
+    while size < target:
+        word = rng.choice(terms) if rng.random() < mention_rate else rng.choice(FILLER)
+        parts.append(word)
+        size += len(word) + 1
+    return " ".join(parts)
+
+
+def throughput(fn, text: str) -> dict:
+    started = time.perf_counter()
+    found = fn(text)
+    elapsed = time.perf_counter() - started
+    megabytes = len(text.encode()) / 1_000_000
+    return {"mb": round(megabytes, 2), "seconds": round(elapsed, 3),
+            "mb_per_s": round(megabytes / elapsed, 2), "matches": found}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--terms", type=int, default=30000)
+    parser.add_argument("--mb", type=float, default=20)
+    parser.add_argument("--mention-rate", type=float, default=0.03)
+    parser.add_argument("--baseline-terms", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    skills = synthetic_taxonomy(args.terms, rng)
+
+    started = time.perf_counter()
+    automaton = compile_automaton(skills)
+    compile_s = time.perf_counter() - started
+
+    cache_dir = tempfile.mkdtemp(prefix="bench-skills-")
+    path = f"{cache_dir}/automaton"
+    automaton.save(path)
+    started = time.perf_counter()
+    SkillAutomaton.load(path)
+    mmap_load_ms = (time.perf_counter() - started) * 1000
+    started = time.perf_counter()
+    SkillAutomaton.load(path, mmap=False)
+    full_load_ms = (time.perf_counter() - started) * 1000
+    automaton = SkillAutomaton.load(path)
+
+    text = synthetic_text(skills, args.mb, args.mention_rate, rng)
+    scan = throughput(lambda t: sum(1 for _ in automaton.matches(t)), text)
+
+    sample = rng.sample(skills, min(args.baseline_terms, len(skills)))
+    patterns = [
+        re.compile(r"(?<![\w.+#])" + re.escape(term.lower()) + r"(?![\w+#])")
+        for skill in sample for term in (skill.name, *skill.aliases)
+    ]
+    baseline_text = text[:50_000]
+
+    def scan_per_term(t: str) -> int:
+        lowered = t.lower()
+        return sum(len(pattern.findall(lowered)) for pattern in patterns)
+
+    baseline = throughput(scan_per_term, baseline_text)
+
+    print(json.dumps({
+        "benchmark": "skills",
+        "skills": len(skills),
+        "terms": sum(1 + len(skill.aliases) for skill in skills),
+        "vocabulary": len(automaton.vocabulary),
+        "states": automaton.states,
+        "compile_s": round(compile_s, 3),
+        "mmap_load_ms": round(mmap_load_ms, 2),
+        "full_load_ms": round(full_load_ms, 2),
+        "automaton": scan,
+        "regex_per_term": {**baseline, "patterns": len(patterns)},
+        "cache_dir": cache_dir,
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""
+API startup cost: `import app.main` time and RSS, model load times, and copy-on-write sharing.
+
+Each measurement runs in a fresh interpreter so nothing is already imported:
+
+- import: wall time of `import app.main`, RSS afterwards, and which heavy ML
+  libraries (torch, sentence-transformers, spaCy, scikit-learn, playwright)
+  the import pulled in. The API should import none of them.
+- models: load time and RSS growth of each registry model on first use.
+- fork: preloads --models, forks --fork-children children that each run a full
+  GC (as a long-lived worker eventually would), and reports each child's
+  private vs shared memory from /proc/<pid>/smaps_rollup, with and without
+  the gc.freeze() done by ModelRegistry.preload.
+
+Usage (from backend/):
+    python -m benchmarks.bench_startup [--repeat 10] [--models skills embedding] [--fork-children 4]
+"""
+import argparse
+import json
+import subprocess
+import sys
+import textwrap
+import time
+
+from benchmarks.common import summarize, write_results
+
+HEAVY_MODULES = ("torch", "sentence_transformers", "transformers", "spacy", "sklearn", "playwright")
+
+IMPORT_CHILD = textwrap.dedent("""
+    import json, sys, time
+    started = time.perf_counter()
+    import app.main
+    elapsed = time.perf_counter() - started
+    from app.ml.model_registry import current_rss_bytes
+    print(json.dumps({
+        "import_ms": elapsed * 1000,
+        "rss_mb": current_rss_bytes() / 2 ** 20,
+        "heavy_modules": [m for m in %r if m in sys.modules],
+        "modules": len(sys.modules),
+    }))
+""" % (HEAVY_MODULES,))
+
+MODEL_CHILD = textwrap.dedent("""
+    import json, sys
+    import app.main
+    from app.ml.model_registry import model_registry
+    name = sys.argv[1]
+    try:
+        model_registry.get(name)
+    except Exception as exc:
+        print(json.dumps({"error": f"{type(exc).__name__}: {exc}"}))
+    else:
+        print(json.dumps(model_registry.stats()[name]))
+""")
+
+FORK_CHILD = textwrap.dedent("""
+    import gc, json, os, sys, time
+    import app.main
+    from app.ml.model_registry import model_registry
+    names, children, freeze = sys.argv[1].split(","), int(sys.argv[2]), sys.argv[3] == "1"
+    if freeze:
+        model_registry.preload(names)
+    else:
+        model_registry.warm(names)
+
+    def rollup(pid):
+        fields = {}
+        with open(f"/proc/{pid}/smaps_rollup") as f:
+            for line in f:
+                key, _, value = line.partition(":")
+                if value.strip().endswith("kB"):
+                    fields[key] = round(int(value.split()[0]) / 1024, 1)
+        return {"rss_mb": fields.get("Rss", 0), "pss_mb": fields.get("Pss", 0),
+                "private_mb": round(fields.get("Private_Clean", 0) + fields.get("Private_Dirty", 0), 1)}
+
+    pids = []
+    for _ in range(children):
+        read, write = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read)
+            gc.collect()
+            os.write(write, b"1")
+            time.sleep(60)
+            os._exit(0)
+        os.close(write)
+        os.read(read, 1)
+        os.close(read)
+        pids.append(pid)
+    try:
+        print(json.dumps({"parent": rollup(os.getpid()), "children": [rollup(pid) for pid in pids]}))
+    finally:
+        for pid in pids:
+            os.kill(pid, 9)
+            os.waitpid(pid, 0)
+""")
+
+
+def run_child(code: str, *args: str) -> dict:
+    completed = subprocess.run([sys.executable, "-c", code, *args], capture_output=True, text=True)
+    if completed.returncode != 0:
+        return {"error": completed.stderr.strip().splitlines()[-1] if completed.stderr.strip() else "failed"}
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def measure_import(repeat: int) -> dict:
+    import_ms, process_ms, rss = [], [], []
+    last = {}
+    for _ in range(repeat):
+        started = time.perf_counter()
+        last = run_child(IMPORT_CHILD)
+        process_ms.append((time.perf_counter() - started) * 1000)
+        if "error" in last:
+            return last
+        import_ms.append(last["import_ms"])
+        rss.append(last["rss_mb"])
+    return {
+        "import_app_main": summarize(import_ms),
+        "process_total": summarize(process_ms),
+        "rss_mb": round(max(rss), 1),
+        "heavy_modules": last["heavy_modules"],
+        "modules": last["modules"],
+    }
+
+
+def measure_fork(models: list, children: int) -> dict:
+    results = {}
+    for label, freeze in (("gc_freeze", "1"), ("no_freeze", "0")):
+        result = run_child(FORK_CHILD, ",".join(models), str(children), freeze)
+        if "children" in result:
+            kids = result["children"]
+            result["mean_child_private_mb"] = round(sum(k["private_mb"] for k in kids) / len(kids), 1)
+            result["mean_child_pss_mb"] = round(sum(k["pss_mb"] for k in kids) / len(kids), 1)
+        results[label] = result
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--models", nargs="+", default=["skills", "embedding"])
+    parser.add_argument("--fork-children", type=int, default=4, help="0 skips the copy-on-write measurement")
+    parser.add_argument("--out", help="results file (default benchmarks/results/startup-<timestamp>.json)")
+    args = parser.parse_args()
+
+    payload = {
+        "import": measure_import(args.repeat),
+        "models": {name: run_child(MODEL_CHILD, name) for name in args.models},
+    }
+    if args.fork_children:
+        payload["fork"] = measure_fork(args.models, args.fork_children)
+
+    path = write_results("startup", payload, args.out)
+    print(json.dumps({**payload, "results_file": path}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
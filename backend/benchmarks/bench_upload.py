@@ -0,0 +1,122 @@
+"""
+Upload load test: N concurrent resume uploads against a running API, sampling server RSS.
+
+Each upload is a distinct file of --size bytes (10MB by default) generated lazily
+on the client so the driver itself stays small. The server's resident set size is
+read from /proc/<pid>/status while the uploads are in flight; with the streaming
+upload path peak RSS should stay roughly flat as concurrency grows.
+
+Usage (from backend/, with the API running):
+    python -m benchmarks.bench_upload --url http://localhost:8000 --server-pid <uvicorn pid> \
+        [--concurrency 200] [--size 10485760]
+"""
+import argparse
+import asyncio
+import json
+import os
+import time
+import uuid
+
+import httpx
+
+from benchmarks.common import summarize
+
+BLOCK = os.urandom(64 * 1024)
+
+
+class GeneratedFile:
+    """File-like object yielding `size` bytes that are unique per instance"""
+
+    def __init__(self, size: int):
+        self.remaining = size
+        self.prefix = uuid.uuid4().bytes
+
+    def read(self, n: int = -1) -> bytes:
+        if self.remaining <= 0:
+            return b""
+        n = self.remaining if n < 0 else min(n, self.remaining)
+        self.remaining -= n
+        return (self.prefix + BLOCK * (n // len(BLOCK) + 1))[:n]
+
+
+def rss_kb(pid: int) -> int:
+    with open(f"/proc/{pid}/status") as status:
+        for line in status:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    return 0
+
+
+async def sample_rss(pid: int, samples: list, stop: asyncio.Event, interval: float = 0.05) -> None:
+    while not stop.is_set():
+        samples.append(rss_kb(pid))
+        await asyncio.sleep(interval)
+
+
+async def get_token(client: httpx.AsyncClient) -> str:
+    email = f"upload-bench-{uuid.uuid4().hex[:8]}@bench.local"
+    password = "bench-password"
+    await client.post("/api/auth/register", json={"email": email, "password": password})
+    response = await client.post("/api/auth/login", json={"email": email, "password": password})
+    response.raise_for_status()
+    return response.json()["access_token"]
+
+
+async def upload(client: httpx.AsyncClient, token: str, size: int, latencies: list, statuses: list) -> None:
+    started = time.perf_counter()
+    response = await client.post(
+        "/api/resumes/upload",
+        headers={"Authorization": f"Bearer {token}"},
+        files={"file": ("resume.pdf", GeneratedFile(size), "application/pdf")},
+    )
+    latencies.append((time.perf_counter() - started) * 1000)
+    statuses.append(response.status_code)
+
+
+async def run(args) -> dict:
+    limits = httpx.Limits(max_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.url, timeout=300, limits=limits) as client:
+        token = await get_token(client)
+        baseline = rss_kb(args.server_pid)
+
+        samples: list = []
+        stop = asyncio.Event()
+        sampler = asyncio.create_task(sample_rss(args.server_pid, samples, stop))
+        latencies: list = []
+        statuses: list = []
+        started = time.perf_counter()
+        await asyncio.gather(*(
+            upload(client, token, args.size, latencies, statuses) for _ in range(args.concurrency)
+        ))
+        elapsed = time.perf_counter() - started
+        stop.set()
+        await sampler
+
+    peak = max(samples) if samples else baseline
+    return {
+        "benchmark": "upload",
+        "concurrency": args.concurrency,
+        "file_bytes": args.size,
+        "elapsed_s": round(elapsed, 2),
+        "status_codes": {str(code): statuses.count(code) for code in sorted(set(statuses))},
+        "latency": summarize(latencies),
+        "server_rss_mb": {
+            "baseline": round(baseline / 1024, 1),
+            "peak": round(peak / 1024, 1),
+            "per_upload_kb": round((peak - baseline) / args.concurrency, 1),
+        },
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--server-pid", type=int, required=True)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--size", type=int, default=10 * 1024 * 1024)
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(run(args)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Users-table query rate under dashboard traffic, with and without the principal cache.
+
+Seeds --users accounts, then replays --requests authenticated requests to
+/api/users/profile (a route whose only DB work is authentication) with a skewed
+(Zipf-like) user distribution, like a dashboard polled by active users. SQL
+statements are counted on the async engine for each run.
+
+Usage (from backend/, against a migrated database):
+    python -m benchmarks.bench_user_cache [--users 1000] [--requests 20000] [--concurrency 100]
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+import uuid
+
+import httpx
+from sqlalchemy import event, text
+
+from app.database import SessionLocal, async_engine
+from app.main import app
+from app.services.auth_service import create_access_token
+from app.services.user_cache import user_cache
+
+BENCH_EMAIL_DOMAIN = "bench-auth.local"
+
+
+def seed_users(n: int) -> list:
+    db = SessionLocal()
+    try:
+        ids = [row[0] for row in db.execute(
+            text("SELECT id FROM users WHERE email LIKE :p"), {"p": f"%@{BENCH_EMAIL_DOMAIN}"}
+        )]
+        if len(ids) < n:
+            db.execute(text("""
+                INSERT INTO users (id, email, password_hash)
+                SELECT gen_random_uuid(), 'user-' || g || '-' || :tag || '@' || :domain, 'x'
+                FROM generate_series(1, :n) g
+            """), {"n": n - len(ids), "tag": uuid.uuid4().hex[:6], "domain": BENCH_EMAIL_DOMAIN})
+            db.commit()
+            ids = [row[0] for row in db.execute(
+                text("SELECT id FROM users WHERE email LIKE :p"), {"p": f"%@{BENCH_EMAIL_DOMAIN}"}
+            )]
+        return ids[:n]
+    finally:
+        db.close()
+
+
+class QueryCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, *args, **kwargs):
+        self.count += 1
+
+
+async def replay(tokens: list, n_requests: int, concurrency: int) -> dict:
+    # Zipf-ish: a small set of active users generates most of the traffic
+    weights = [1 / (rank + 1) for rank in range(len(tokens))]
+    schedule = random.Random(42).choices(tokens, weights=weights, k=n_requests)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    counter = QueryCounter()
+    event.listen(async_engine.sync_engine, "before_cursor_execute", counter)
+    transport = httpx.ASGITransport(app=app)
+    try:
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            async def one(token):
+                async with semaphore:
+                    response = await client.get("/api/users/profile", headers={"Authorization": f"Bearer {token}"})
+                    response.raise_for_status()
+
+            started = time.perf_counter()
+            await asyncio.gather(*(one(token) for token in schedule))
+            elapsed = time.perf_counter() - started
+    finally:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", counter)
+
+    return {
+        "requests": n_requests,
+        "elapsed_s": round(elapsed, 3),
+        "requests_per_s": round(n_requests / elapsed, 1),
+        "db_queries": counter.count,
+        "db_queries_per_s": round(counter.count / elapsed, 1),
+        "db_queries_per_request": round(counter.count / n_requests, 3),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    args = parser.parse_args()
+
+    tokens = [create_access_token({"sub": str(user_id)}) for user_id in seed_users(args.users)]
+
+    max_size, redis_url = user_cache.max_size, user_cache.redis_url
+    user_cache.max_size, user_cache.redis_url = 0, None
+    uncached = asyncio.run(replay(tokens, args.requests, args.concurrency))
+
+    user_cache.max_size, user_cache.redis_url = max_size, redis_url
+    user_cache.clear()
+    cached = asyncio.run(replay(tokens, args.requests, args.concurrency))
+
+    print(json.dumps({
+        "benchmark": "user_cache",
+        "users": args.users,
+        "without_cache": uncached,
+        "with_cache": {**cached, "cache": user_cache.stats()},
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Vector search recall@k vs latency: HNSW at several ef_search values vs exact brute force.
+
+Seeds a synthetic corpus of active jobs (500k by default) whose embeddings are
+drawn from a Gaussian mixture, so neighbourhoods look like topic clusters in real
+postings rather than uniform noise. Ground truth comes from
+search_similar_jobs(exact=True).
+
+Usage (from backend/, against a migrated database):
+    python -m benchmarks.bench_vector_search [--jobs 500000] [--queries 200] [--k 10] [--cleanup]
+"""
+import argparse
+import io
+import json
+import uuid
+
+import numpy as np
+from sqlalchemy import text
+
+from app.config import settings
+from app.database import SessionLocal
+from app.services.vector_search import search_similar_jobs
+from benchmarks.common import summarize, time_calls
+
+BENCH_SOURCE = "bench-ann"
+
+
+def clustered_vectors(rng: np.random.Generator, n: int, centers: np.ndarray, spread: float = 0.35) -> np.ndarray:
+    """Sample unit vectors around random cluster centers"""
+    labels = rng.integers(0, len(centers), size=n)
+    vectors = centers[labels] + rng.normal(scale=spread, size=(n, centers.shape[1])).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def seed(db, n_jobs: int, centers: np.ndarray, rng: np.random.Generator, chunk: int = 10000) -> None:
+    """COPY synthetic jobs with embeddings into the jobs table"""
+    existing = db.execute(text("SELECT count(*) FROM jobs WHERE source = :s"), {"s": BENCH_SOURCE}).scalar()
+    if existing >= n_jobs:
+        return
+
+    raw = db.connection().connection
+    with raw.cursor() as cur:
+        for start in range(existing, n_jobs, chunk):
+            size = min(chunk, n_jobs - start)
+            vectors = clustered_vectors(rng, size, centers)
+            buf = io.StringIO()
+            for offset, vector in enumerate(vectors):
+                i = start + offset
+                literal = "[" + ",".join(f"{x:.6f}" for x in vector) + "]"
+                buf.write(f"{uuid.uuid4()}\t{BENCH_SOURCE}-{i}\t{BENCH_SOURCE}\tEngineer {i}\tCompany\tdescription\t{literal}\n")
+            buf.seek(0)
+            cur.copy_expert(
+                "COPY jobs (id, external_job_id, source, title, company, description, embedding) FROM STDIN",
+                buf,
+            )
+    raw.commit()
+    db.execute(text("ANALYZE jobs"))
+    db.commit()
+
+
+def cleanup(db) -> None:
+    db.execute(text("DELETE FROM jobs WHERE source = :s"), {"s": BENCH_SOURCE})
+    db.commit()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--jobs", type=int, default=500000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--clusters", type=int, default=256)
+    parser.add_argument("--ef", type=int, nargs="+", default=[10, 20, 40, 80, 160, 320])
+    parser.add_argument("--cleanup", action="store_true")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    centers = rng.normal(size=(args.clusters, settings.EMBEDDING_DIMENSION)).astype(np.float32)
+    queries = clustered_vectors(rng, args.queries, centers)
+
+    db = SessionLocal()
+    try:
+        seed(db, args.jobs, centers, rng)
+
+        truth = []
+        exact_samples = []
+        for q in queries:
+            exact_samples += time_calls(lambda: search_similar_jobs(db, q, k=args.k, exact=True), 1, warmup=0)
+            truth.append({job_id for job_id, _ in search_similar_jobs(db, q, k=args.k, exact=True)})
+            db.rollback()
+
+        results = [{"mode": "exact", "recall": 1.0, **summarize(exact_samples)}]
+        for ef in args.ef:
+            samples = []
+            hits = 0
+            for q, expected in zip(queries, truth):
+                samples += time_calls(lambda: search_similar_jobs(db, q, k=args.k, ef_search=ef), 1, warmup=1)
+                found = {job_id for job_id, _ in search_similar_jobs(db, q, k=args.k, ef_search=ef)}
+                hits += len(found & expected)
+                db.rollback()
+            results.append({
+                "mode": "hnsw",
+                "ef_search": max(ef, args.k),
+                "recall": round(hits / (args.k * len(queries)), 4),
+                **summarize(samples),
+            })
+
+        print(json.dumps({"benchmark": "vector_search", "jobs": args.jobs, "k": args.k, "results": results}, indent=2))
+    finally:
+        if args.cleanup:
+            cleanup(db)
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
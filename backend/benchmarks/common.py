@@ -0,0 +1,85 @@
+"""Shared helpers for the benchmark scripts"""
+import datetime
+import json
+import os
+import platform
+import statistics
+import subprocess
+import time
+from typing import Awaitable, Callable, Dict, List, Optional
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a list of samples"""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def summarize(samples_ms: List[float]) -> Dict[str, float]:
+    """Summarize latency samples (milliseconds)"""
+    return {
+        "n": len(samples_ms),
+        "mean_ms": round(statistics.fmean(samples_ms), 3) if samples_ms else 0.0,
+        "p50_ms": round(percentile(samples_ms, 50), 3),
+        "p99_ms": round(percentile(samples_ms, 99), 3),
+    }
+
+
+async def time_async_calls(fn: Callable[[], Awaitable[object]], repeat: int, warmup: int = 2) -> List[float]:
+    """Await fn() repeatedly and return per-call wall time in milliseconds"""
+    for _ in range(warmup):
+        await fn()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def time_calls(fn: Callable[[], object], repeat: int, warmup: int = 2) -> List[float]:
+    """Call fn repeatedly and return per-call wall time in milliseconds"""
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def environment() -> Dict[str, object]:
+    """Where and on what a result was measured, so runs are only compared like for like"""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+            cwd=os.path.dirname(__file__), timeout=5,
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+    return {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "commit": commit,
+        "host": platform.node(),
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def write_results(name: str, payload: Dict[str, object], path: Optional[str] = None) -> str:
+    """Write a run's results with its environment as JSON; returns the file written"""
+    if path is None:
+        stamp = datetime.datetime.now(datetime.timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        path = os.path.join(RESULTS_DIR, f"{name}-{stamp}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump({"benchmark": name, "environment": environment(), **payload}, f, indent=2)
+        f.write("\n")
+    return path
@@ -0,0 +1,93 @@
+"""
+Compare two benchmark result files and flag regressions.
+
+Walks both JSON documents and compares every latency figure (keys ending in
+_ms) and throughput figure (ops_per_s, rps, *_per_s) present in both. A metric
+regresses when it is worse than the baseline by more than --threshold percent;
+the exit status is 1 if anything regressed, so this can gate a change.
+
+Usage (from backend/):
+    python -m benchmarks.compare baseline.json candidate.json [--threshold 10] [--metrics p50_ms p99_ms]
+"""
+import argparse
+import json
+import sys
+from typing import Dict, Iterator, Tuple
+
+# Fields describing how a run was made, not how fast it was
+SKIPPED_KEYS = {"environment", "results_file", "min_round_ms", "duration_s"}
+
+
+def lower_is_better(key: str) -> bool:
+    return key.endswith("_ms") or key.endswith("_s") and not key.endswith("_per_s")
+
+
+def higher_is_better(key: str) -> bool:
+    return key in ("ops_per_s", "rps", "total_rps") or key.endswith("_per_s") or key.endswith("_per_s_per_core")
+
+
+def metrics(document, prefix: str = "") -> Iterator[Tuple[str, str, float]]:
+    """(path, key, value) for every comparable number in a result document"""
+    if isinstance(document, dict):
+        for key, value in document.items():
+            if key in SKIPPED_KEYS:
+                continue
+            path = f"{prefix}.{key}" if prefix else key
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                if lower_is_better(key) or higher_is_better(key):
+                    yield path, key, float(value)
+            else:
+                yield from metrics(value, path)
+    elif isinstance(document, list):
+        for index, value in enumerate(document):
+            yield from metrics(value, f"{prefix}[{index}]")
+
+
+def compare(baseline: dict, candidate: dict, threshold: float, only=None) -> list:
+    base = {path: (key, value) for path, key, value in metrics(baseline)}
+    rows = []
+    for path, key, value in metrics(candidate):
+        if path not in base or (only and key not in only):
+            continue
+        before = base[path][1]
+        if before == 0:
+            continue
+        change = (value - before) / before * 100
+        worse = change if lower_is_better(key) else -change
+        rows.append({"metric": path, "baseline": before, "candidate": value, "change_pct": round(change, 1),
+                     "regressed": worse > threshold})
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument("--threshold", type=float, default=10, help="percent worse than baseline that fails")
+    parser.add_argument("--metrics", nargs="+", help="only compare these keys, e.g. p50_ms p99_ms rps")
+    args = parser.parse_args()
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.candidate) as f:
+        candidate = json.load(f)
+
+    environments: Dict[str, dict] = {"baseline": baseline.get("environment", {}),
+                                     "candidate": candidate.get("environment", {})}
+    if environments["baseline"].get("host") != environments["candidate"].get("host"):
+        print("warning: results come from different hosts; differences may not be meaningful", file=sys.stderr)
+
+    rows = compare(baseline, candidate, args.threshold, set(args.metrics or ()))
+    regressions = [row for row in rows if row["regressed"]]
+    print(json.dumps({
+        "environments": environments,
+        "threshold_pct": args.threshold,
+        "compared": len(rows),
+        "regressions": regressions,
+        "changes": rows,
+    }, indent=2))
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+"""
+Async load driver for the main API routes, against the dataset from benchmarks.seed.
+
+Runs --concurrency closed-loop clients for --duration seconds (after --warmup
+seconds that are not recorded). Each request picks a seeded user and one
+scenario by weight from --mix:
+
+    feed        GET  /api/jobs/?limit=20, following X-Next-Cursor for a third of requests
+    job_detail  GET  /api/jobs/{id} for one of the user's matched jobs
+    user_stats  GET  /api/users/stats
+    upload      POST /api/resumes/upload with a generated .docx resume
+
+Requests go to --url when given, otherwise to the app in-process (no network,
+no server processes; useful for profiling, not for capacity numbers). Latency
+percentiles, status counts and throughput per scenario are written as JSON.
+
+Usage (from backend/, after `python -m benchmarks.seed`):
+    python -m benchmarks.load [--url http://localhost:8000] [--duration 30] [--concurrency 50] \
+        [--mix feed=50,job_detail=30,user_stats=15,upload=5] [--out results.json]
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+from collections import Counter, defaultdict
+
+import httpx
+import numpy as np
+from sqlalchemy import text
+
+from app.database import SessionLocal
+from app.ml.skill_extractor import BUNDLED_TAXONOMY, load_taxonomy
+from app.services.auth_service import create_access_token
+from benchmarks.common import summarize, write_results
+from benchmarks.seed import BENCH_EMAIL_DOMAIN, TITLES, pick_skills, resume_docx, resume_text
+
+SCENARIOS = ("feed", "job_detail", "user_stats", "upload")
+
+
+def parse_mix(mix: str) -> dict:
+    weights = {}
+    for part in mix.split(","):
+        name, _, weight = part.partition("=")
+        if name not in SCENARIOS:
+            raise SystemExit(f"Unknown scenario {name!r}; expected one of {', '.join(SCENARIOS)}")
+        weights[name] = float(weight or 1)
+    return weights
+
+
+def load_users(n_users: int, matches_per_user: int = 100) -> list:
+    """(token, matched job ids) for the first n seeded users"""
+    db = SessionLocal()
+    try:
+        rows = db.execute(text("""
+            SELECT u.id, array_remove(array_agg(m.job_id), NULL)
+            FROM (SELECT id, email FROM users WHERE email LIKE :pattern ORDER BY email LIMIT :n) u
+            LEFT JOIN LATERAL (
+                SELECT job_id FROM job_matches WHERE user_id = u.id ORDER BY match_score DESC LIMIT :k
+            ) m ON true
+            GROUP BY u.id, u.email
+            ORDER BY u.email
+        """), {"pattern": f"%@{BENCH_EMAIL_DOMAIN}", "n": n_users, "k": matches_per_user}).all()
+    finally:
+        db.close()
+    if not rows:
+        raise SystemExit("No seeded users found; run `python -m benchmarks.seed` first")
+    return [(create_access_token({"sub": str(user_id)}), job_ids) for user_id, job_ids in rows]
+
+
+def upload_files(n: int, seed: int) -> list:
+    """Distinct resume documents, so uploads aren't answered by the duplicate-content shortcut"""
+    rng = np.random.default_rng([seed, 100])
+    skills = [skill.name for skill in load_taxonomy(BUNDLED_TAXONOMY)]
+    return [
+        resume_docx(resume_text(rng, f"Load Tester {i}", f"load{i}@{BENCH_EMAIL_DOMAIN}",
+                                TITLES[i % len(TITLES)], pick_skills(rng, skills, int(rng.integers(5, 20)))))
+        for i in range(n)
+    ]
+
+
+class LoadRun:
+    def __init__(self, client: httpx.AsyncClient, users: list, weights: dict, files: list, seed: int):
+        self.client = client
+        self.users = users
+        self.names = list(weights)
+        self.weights = list(weights.values())
+        self.files = files
+        self.seed = seed
+        self.recording = False
+        self.latencies = defaultdict(list)
+        self.statuses = defaultdict(Counter)
+        self.uploads = 0
+
+    async def request(self, rng: random.Random, cursors: dict) -> None:
+        name = rng.choices(self.names, self.weights)[0]
+        user_index = rng.randrange(len(self.users))
+        token, job_ids = self.users[user_index]
+        headers = {"Authorization": f"Bearer {token}"}
+
+        started = time.perf_counter()
+        try:
+            if name == "feed":
+                params = {"limit": 20}
+                if user_index in cursors and rng.random() < 1 / 3:
+                    params["cursor"] = cursors.pop(user_index)
+                response = await self.client.get("/api/jobs/", params=params, headers=headers)
+                if response.headers.get("x-next-cursor"):
+                    cursors[user_index] = response.headers["x-next-cursor"]
+            elif name == "job_detail" and job_ids:
+                response = await self.client.get(f"/api/jobs/{rng.choice(job_ids)}", headers=headers)
+            elif name == "upload":
+                content = self.files[self.uploads % len(self.files)]
+                self.uploads += 1
+                response = await self.client.post(
+                    "/api/resumes/upload", headers=headers,
+                    files={"file": ("resume.docx", content,
+                                    "application/vnd.openxmlformats-officedocument.wordprocessingml.document")},
+                )
+            else:
+                response = await self.client.get("/api/users/stats", headers=headers)
+                name = "user_stats"
+            status = response.status_code
+        except httpx.HTTPError as exc:
+            status = type(exc).__name__
+        elapsed = (time.perf_counter() - started) * 1000
+
+        if self.recording:
+            self.latencies[name].append(elapsed)
+            self.statuses[name][str(status)] += 1
+
+    async def worker(self, index: int, deadline: float) -> None:
+        rng = random.Random(self.seed * 1000 + index)
+        cursors = {}
+        while time.monotonic() < deadline:
+            await self.request(rng, cursors)
+
+
+async def run(args) -> dict:
+    weights = parse_mix(args.mix)
+    users = load_users(args.users)
+    files = upload_files(args.upload_files, args.seed) if weights.get("upload") else []
+
+    if args.url:
+        limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+        client = httpx.AsyncClient(base_url=args.url, limits=limits, timeout=args.timeout)
+    else:
+        from app.main import app
+
+        client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench",
+                                   timeout=args.timeout)
+
+    async with client:
+        load = LoadRun(client, users, weights, files, args.seed)
+        started = time.monotonic()
+        deadline = started + args.warmup + args.duration
+        workers = [asyncio.create_task(load.worker(i, deadline)) for i in range(args.concurrency)]
+        await asyncio.sleep(args.warmup)
+        load.recording = True
+        measured_from = time.monotonic()
+        await asyncio.gather(*workers)
+        measured_s = time.monotonic() - measured_from
+
+    scenarios = {}
+    for name in weights:
+        samples = load.latencies.get(name, [])
+        statuses = dict(load.statuses.get(name, {}))
+        ok = sum(count for status, count in statuses.items() if status.startswith("2") or status == "304")
+        scenarios[name] = {
+            **summarize(samples),
+            "rps": round(len(samples) / measured_s, 1),
+            "error_rate": round(1 - ok / len(samples), 4) if samples else 0.0,
+            "statuses": statuses,
+        }
+    total = sum(len(samples) for samples in load.latencies.values())
+    return {
+        "target": args.url or "in-process",
+        "duration_s": round(measured_s, 1),
+        "concurrency": args.concurrency,
+        "users": len(users),
+        "mix": weights,
+        "total_rps": round(total / measured_s, 1),
+        "scenarios": scenarios,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url", help="base URL of a running API; omit to drive the app in-process")
+    parser.add_argument("--duration", type=float, default=30, help="measured seconds")
+    parser.add_argument("--warmup", type=float, default=5, help="unrecorded seconds before measuring")
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--users", type=int, default=200, help="seeded users to spread requests over")
+    parser.add_argument("--mix", default="feed=50,job_detail=30,user_stats=15,upload=5")
+    parser.add_argument("--upload-files", type=int, default=200, help="distinct resumes generated for uploads")
+    parser.add_argument("--timeout", type=float, default=30)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--out", help="results file (default benchmarks/results/load-<timestamp>.json)")
+    args = parser.parse_args()
+
+    payload = asyncio.run(run(args))
+    path = write_results("load", payload, args.out)
+    print(json.dumps({**payload, "results_file": path}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""
+Micro-benchmarks for the CPU hot paths: scoring, skill extraction, resume parsing, dedup and embedding.
+
+Each benchmark builds its inputs once, then is timed like pytest-benchmark:
+calls are grouped into rounds of enough iterations to last --min-round-ms,
+and per-call statistics are reported over --rounds rounds. BLAS is pinned to
+a single thread so the numbers are per core. Benchmarks whose dependencies
+are missing (e.g. the embedding model) are reported as skipped, not dropped.
+
+Usage (from backend/):
+    python -m benchmarks.micro [-k scoring] [--rounds 20] [--min-round-ms 50] [--out results.json]
+"""
+import os
+
+# Must be set before numpy loads its BLAS
+for var in ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS"):
+    os.environ.setdefault(var, "1")
+
+import argparse
+import atexit
+import json
+import tempfile
+import time
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+
+from app.ml.skill_extractor import BUNDLED_TAXONOMY, compile_automaton, load_taxonomy
+from benchmarks.common import summarize, write_results
+from benchmarks.seed import job_description, pick_skills, resume_docx, resume_text
+
+Setup = Callable[[np.random.Generator], Callable[[], object]]
+BENCHMARKS: List[Tuple[str, Setup]] = []
+
+
+def benchmark(name: str):
+    """Register a setup function returning the callable to time"""
+    def register(setup: Setup) -> Setup:
+        BENCHMARKS.append((name, setup))
+        return setup
+    return register
+
+
+def _skills() -> list:
+    return [skill.name for skill in load_taxonomy(BUNDLED_TAXONOMY)]
+
+
+def _scoring_inputs(rng: np.random.Generator, n: int):
+    from app.ml.job_matcher import MatchPreferences
+    from benchmarks.bench_scoring import DIMENSION, SKILLS, synthetic_block
+
+    block = synthetic_block(n, rng)
+    resume = rng.normal(size=DIMENSION).astype(np.float32)
+    resume /= np.linalg.norm(resume)
+    resume_skills = [SKILLS[i] for i in rng.integers(0, len(SKILLS), size=15)]
+    preferences = MatchPreferences(["cape town", "remote"], min_salary=60000, remote_preference="any")
+    return block, resume, resume_skills, preferences
+
+
+@benchmark("scoring.score_block_10k")
+def bench_score_block(rng):
+    from app.ml.job_matcher import score_block
+
+    block, resume, resume_skills, preferences = _scoring_inputs(rng, 10000)
+    return lambda: score_block(block, resume, resume_skills, preferences)
+
+
+@benchmark("scoring.top_matches_10k")
+def bench_top_matches(rng):
+    from app.ml.job_matcher import top_matches
+
+    block, resume, resume_skills, preferences = _scoring_inputs(rng, 10000)
+    return lambda: top_matches(block, resume, resume_skills, preferences, k=100)
+
+
+@benchmark("skills.compile_taxonomy")
+def bench_compile_taxonomy(rng):
+    skills = load_taxonomy(BUNDLED_TAXONOMY)
+    return lambda: compile_automaton(skills)
+
+
+@benchmark("skills.extract_job_description")
+def bench_extract_skills(rng):
+    automaton = compile_automaton(load_taxonomy(BUNDLED_TAXONOMY))
+    description = job_description(rng, "Senior Software Engineer", pick_skills(rng, _skills(), 10))
+    return lambda: automaton.extract(description)
+
+
+@benchmark("parsing.parse_resume_text")
+def bench_parse_resume_text(rng):
+    from app.services.resume_parser import extract_skills, parse_resume_text
+
+    text = resume_text(rng, "Thando Nkosi", "thando@example.co.za", "Data Analyst", pick_skills(rng, _skills(), 15))
+    return lambda: extract_skills(parse_resume_text(text)["sections"])
+
+
+@benchmark("parsing.parse_resume_docx")
+def bench_parse_resume_docx(rng):
+    from app.services.resume_parser import parse_resume_file
+
+    text = resume_text(rng, "Thando Nkosi", "thando@example.co.za", "Data Analyst", pick_skills(rng, _skills(), 15))
+    f = tempfile.NamedTemporaryFile(suffix=".docx", delete=False)
+    with f:
+        f.write(resume_docx(text))
+    atexit.register(os.unlink, f.name)
+    return lambda: parse_resume_file(f.name)
+
+
+@benchmark("dedup.minhash_signature")
+def bench_minhash_signature(rng):
+    from app.ml.minhash import MinHasher, posting_text
+
+    hasher = MinHasher()
+    text = posting_text("Senior Data Analyst", "Company 12",
+                        job_description(rng, "Senior Data Analyst", pick_skills(rng, _skills(), 8)))
+    return lambda: hasher.signature(text)
+
+
+@benchmark("embedding.encode_32_descriptions")
+def bench_encode(rng):
+    from app.ml.embeddings import encode_texts, get_model
+
+    get_model()
+    skills = _skills()
+    texts = [job_description(rng, "Software Engineer", pick_skills(rng, skills, 8)) for _ in range(32)]
+    return lambda: encode_texts(texts, use_cache=False)
+
+
+def run(fn: Callable[[], object], rounds: int, min_round_ms: float) -> Dict[str, object]:
+    """Per-call timings over `rounds` calibrated rounds"""
+    fn()  # warm-up
+    started = time.perf_counter()
+    fn()
+    single_ms = max((time.perf_counter() - started) * 1000, 1e-6)
+    iterations = max(1, int(min_round_ms / single_ms))
+
+    per_call = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for _ in range(iterations):
+            fn()
+        per_call.append((time.perf_counter() - started) * 1000 / iterations)
+    summary = summarize(per_call)
+    return {
+        **summary,
+        "min_ms": round(min(per_call), 4),
+        "iterations": iterations,
+        "ops_per_s": round(1000 / summary["mean_ms"], 1) if summary["mean_ms"] else None,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-k", dest="keyword", default="", help="only run benchmarks whose name contains this")
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--min-round-ms", type=float, default=50)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--out", help="results file (default benchmarks/results/micro-<timestamp>.json)")
+    args = parser.parse_args()
+
+    results = {}
+    for name, setup in BENCHMARKS:
+        if args.keyword not in name:
+            continue
+        try:
+            fn = setup(np.random.default_rng(args.seed))
+        except (ImportError, OSError) as exc:
+            results[name] = {"skipped": f"{type(exc).__name__}: {exc}"}
+            continue
+        results[name] = run(fn, args.rounds, args.min_round_ms)
+
+    payload = {"rounds": args.rounds, "min_round_ms": args.min_round_ms, "results": results}
+    path = write_results("micro", payload, args.out)
+    print(json.dumps({**payload, "results_file": path}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
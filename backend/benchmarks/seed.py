@@ -0,0 +1,376 @@
+"""
+Seed a reproducible, realistic dataset for the load driver and the DB-backed benchmarks.
+
+Generates --users users with a parsed resume and (for half of them) match
+preferences, --jobs active postings (1M by default) with skills from the
+bundled taxonomy, long-tailed descriptions and 384-d embeddings drawn from
+topic clusters, --matches job matches per user taken from the user's own
+cluster, and --interactions interactions per user with their running counts.
+
+Every stage draws from its own generator seeded from --seed, so the same
+arguments always produce the same rows (ids included) and a run can be
+compared with an earlier one. Stages already seeded at the requested size
+are skipped; --reset deletes the dataset first.
+
+Usage (from backend/, against a migrated database):
+    python -m benchmarks.seed [--users 1000] [--jobs 1000000] [--matches 100] [--interactions 50] [--reset]
+"""
+import argparse
+import io
+import json
+import time
+import uuid
+
+import numpy as np
+from sqlalchemy import text
+
+from app.config import settings
+from app.database import SessionLocal
+from app.ml.skill_extractor import BUNDLED_TAXONOMY, load_taxonomy
+from app.services.password_hasher import pwd_context
+from app.services.resume_parser import extract_skills, parse_resume_text
+from benchmarks.common import write_results
+
+BENCH_SOURCE = "bench-dataset"
+BENCH_EMAIL_DOMAIN = "dataset.bench.local"
+BENCH_PASSWORD = "bench-password"
+
+TITLES = ["Software Engineer", "Data Analyst", "Accountant", "Sales Manager", "DevOps Engineer",
+          "Product Manager", "Data Scientist", "Frontend Developer", "Backend Developer", "HR Officer",
+          "Financial Analyst", "Marketing Coordinator", "Business Analyst", "QA Engineer", "Project Manager"]
+SENIORITY = ["Junior", "Intermediate", "Senior", "Lead", ""]
+LOCATIONS = ["Cape Town, Western Cape", "Johannesburg, Gauteng", "Sandton, Gauteng", "Pretoria, Gauteng",
+             "Durban, KwaZulu-Natal", "Stellenbosch, Western Cape", "Port Elizabeth, Eastern Cape",
+             "Centurion, Gauteng", "Midrand, Gauteng", "Remote"]
+REMOTE_TYPES = ["remote", "hybrid", "onsite"]
+EMPLOYMENT_TYPES = ["full-time", "full-time", "full-time", "contract", "part-time"]
+INTERACTION_TYPES = ["viewed", "saved", "liked", "applied", "dismissed", "disliked"]
+INTERACTION_WEIGHTS = [0.6, 0.12, 0.1, 0.08, 0.06, 0.04]
+WORDS = ("build maintain design deliver team clients reporting systems platform customers growth "
+         "experience degree years strong communication stakeholders analysis cloud services quality "
+         "support office hybrid benefits medical senior junior intermediate lead projects ownership "
+         "collaborate improve processes tools data insights performance mentor roadmap").split()
+FIRST_NAMES = ["Thando", "Lerato", "Sipho", "Ayesha", "Pieter", "Naledi", "Johan", "Zanele", "Kagiso", "Fatima"]
+LAST_NAMES = ["Nkosi", "Mokoena", "van der Merwe", "Naidoo", "Dlamini", "Botha", "Khumalo", "Pillay"]
+
+
+def stage_rng(seed: int, stage: int) -> np.random.Generator:
+    return np.random.default_rng([seed, stage])
+
+
+def stage_uuids(rng: np.random.Generator, n: int) -> list:
+    return [uuid.UUID(bytes=bytes(row), version=4) for row in rng.integers(0, 256, size=(n, 16), dtype=np.uint8)]
+
+
+def clustered_vectors(rng: np.random.Generator, labels: np.ndarray, centers: np.ndarray,
+                      spread: float = 0.35) -> np.ndarray:
+    """Unit vectors scattered around the given cluster centers"""
+    vectors = centers[labels] + rng.normal(scale=spread, size=(len(labels), centers.shape[1])).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def pick_skills(rng: np.random.Generator, skills: list, n: int) -> list:
+    """n distinct skills, skewed so a few are common and most are rare"""
+    indices = np.floor(rng.random(n) ** 2.5 * len(skills)).astype(int)
+    return list(dict.fromkeys(skills[i] for i in indices))
+
+
+def words(rng: np.random.Generator, n: int) -> str:
+    return " ".join(WORDS[i] for i in rng.integers(0, len(WORDS), size=n))
+
+
+def job_description(rng: np.random.Generator, title: str, skills: list) -> str:
+    """Posting text with long-tailed length that mentions the required skills"""
+    paragraphs = [f"We are hiring a {title} to join our team."]
+    for _ in range(int(min(rng.lognormal(1.3, 0.6), 12)) + 1):
+        paragraphs.append(words(rng, int(rng.integers(20, 60))).capitalize() + ".")
+    paragraphs.append("Requirements: " + ", ".join(skills) + ".")
+    return "\n\n".join(paragraphs)
+
+
+def resume_text(rng: np.random.Generator, name: str, email: str, title: str, skills: list) -> str:
+    """Resume text with the section headings the parser recognises"""
+    experience = "\n".join(
+        f"{title} at Company {int(rng.integers(1, 5000))} ({2024 - 2 * i - 2}-{2024 - 2 * i})\n"
+        + words(rng, int(rng.integers(25, 60)))
+        for i in range(int(rng.integers(1, 5)))
+    )
+    return "\n".join([
+        name,
+        f"{email} | +27 82 {int(rng.integers(100, 999))} {int(rng.integers(1000, 9999))}",
+        f"linkedin.com/in/{name.lower().replace(' ', '-')}",
+        "Summary",
+        words(rng, 40),
+        "Experience",
+        experience,
+        "Education",
+        f"BSc {rng.choice(['Computer Science', 'Accounting', 'Information Systems', 'Statistics'])}",
+        "Skills",
+        ", ".join(skills),
+    ])
+
+
+def resume_docx(text: str) -> bytes:
+    """A .docx file with one paragraph per line of text"""
+    import docx
+
+    document = docx.Document()
+    for line in text.splitlines():
+        document.add_paragraph(line)
+    buf = io.BytesIO()
+    document.save(buf)
+    return buf.getvalue()
+
+
+def _copy_value(value) -> str:
+    """A value in COPY text format"""
+    if value is None:
+        return "\\N"
+    return str(value).replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+
+
+def _pg_array(values: list) -> str:
+    return "{" + ",".join('"' + v.replace("\\", "\\\\").replace('"', '\\"') + '"' for v in values) + "}"
+
+
+def _vector(values: np.ndarray) -> str:
+    return "[" + ",".join(f"{x:.6f}" for x in values) + "]"
+
+
+def copy_rows(db, table: str, columns: tuple, rows) -> None:
+    buf = io.StringIO()
+    for row in rows:
+        buf.write("\t".join(_copy_value(value) for value in row) + "\n")
+    buf.seek(0)
+    with db.connection().connection.cursor() as cur:
+        cur.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN", buf)
+
+
+def reset(db) -> None:
+    """Delete the dataset; matches, resumes, interactions and counts go with their users and jobs"""
+    db.execute(text("DELETE FROM users WHERE email LIKE :pattern"), {"pattern": f"%@{BENCH_EMAIL_DOMAIN}"})
+    db.execute(text("DELETE FROM jobs WHERE source = :source"), {"source": BENCH_SOURCE})
+    db.commit()
+
+
+def seed_jobs(db, args, skills: list, centers: np.ndarray, chunk: int = 10000) -> tuple:
+    """Jobs in COPY chunks; returns their ids and topic cluster labels"""
+    rng = stage_rng(args.seed, 1)
+    job_ids = stage_uuids(rng, args.jobs)
+    labels = rng.integers(0, len(centers), size=args.jobs)
+    existing = db.execute(text("SELECT count(*) FROM jobs WHERE source = :source"), {"source": BENCH_SOURCE}).scalar()
+    if existing == args.jobs:
+        return job_ids, labels
+    db.execute(text("DELETE FROM jobs WHERE source = :source"), {"source": BENCH_SOURCE})
+
+    today = np.datetime64("today")
+    columns = ("id", "external_job_id", "source", "title", "company", "location", "remote_type", "employment_type",
+               "salary_min", "salary_max", "description", "embedding", "skills_required", "posted_date",
+               "is_active")
+    for start in range(0, args.jobs, chunk):
+        end = min(start + chunk, args.jobs)
+        vectors = clustered_vectors(rng, labels[start:end], centers)
+        rows = []
+        for offset, i in enumerate(range(start, end)):
+            # Jobs in a cluster share a title, so clusters read like job families
+            title = f"{SENIORITY[i % len(SENIORITY)]} {TITLES[labels[i] % len(TITLES)]}".strip()
+            required = pick_skills(rng, skills, int(rng.integers(3, 12)))
+            salary = None if i % 4 == 0 else int(rng.integers(15, 150)) * 10000
+            rows.append((
+                job_ids[i], f"{BENCH_SOURCE}-{i}", BENCH_SOURCE, title, f"Company {int(rng.integers(1, 5000))}",
+                LOCATIONS[int(rng.random() ** 1.5 * len(LOCATIONS))], REMOTE_TYPES[i % 3],
+                EMPLOYMENT_TYPES[i % len(EMPLOYMENT_TYPES)],
+                salary, None if salary is None else salary + int(rng.integers(5, 50)) * 10000,
+                job_description(rng, title, required), _vector(vectors[offset]), _pg_array(required),
+                today - np.timedelta64(int(rng.integers(0, 60)), "D"), "t",
+            ))
+        copy_rows(db, "jobs", columns, rows)
+        db.commit()
+    db.execute(text("ANALYZE jobs"))
+    db.commit()
+    return job_ids, labels
+
+
+def seed_users(db, args, skills: list, centers: np.ndarray) -> tuple:
+    """Users with one parsed, embedded resume each; returns their ids and cluster labels"""
+    rng = stage_rng(args.seed, 2)
+    user_ids = stage_uuids(rng, args.users)
+    resume_ids = stage_uuids(rng, args.users)
+    labels = rng.integers(0, len(centers), size=args.users)
+    existing = db.execute(
+        text("SELECT count(*) FROM users WHERE email LIKE :pattern"), {"pattern": f"%@{BENCH_EMAIL_DOMAIN}"}
+    ).scalar()
+    if existing == args.users:
+        return user_ids, labels
+    db.execute(text("DELETE FROM users WHERE email LIKE :pattern"), {"pattern": f"%@{BENCH_EMAIL_DOMAIN}"})
+
+    password_hash = pwd_context.hash(BENCH_PASSWORD)
+    vectors = clustered_vectors(rng, labels, centers)
+    users, resumes, preferences = [], [], []
+    for i, user_id in enumerate(user_ids):
+        name = f"{FIRST_NAMES[i % len(FIRST_NAMES)]} {LAST_NAMES[(i // len(FIRST_NAMES)) % len(LAST_NAMES)]}"
+        email = f"user{i}@{BENCH_EMAIL_DOMAIN}"
+        users.append((user_id, email, password_hash, name, "t"))
+        raw_text = resume_text(rng, name, email, TITLES[labels[i] % len(TITLES)],
+                               pick_skills(rng, skills, int(rng.integers(5, 20))))
+        parsed = parse_resume_text(raw_text)
+        resumes.append((
+            resume_ids[i], user_id, f"{settings.UPLOAD_DIR}/{user_id}_bench.docx", uuid.UUID(int=i).hex * 2,
+            raw_text, json.dumps(parsed), _vector(vectors[i]), _pg_array(extract_skills(parsed["sections"])),
+        ))
+        if i % 2 == 0:
+            preferences.append((
+                uuid.uuid5(user_id, "preferences"), user_id,
+                _pg_array([LOCATIONS[int(rng.integers(0, len(LOCATIONS)))].split(",")[0]]),
+                int(rng.integers(20, 80)) * 10000, REMOTE_TYPES[i % 3],
+            ))
+
+    copy_rows(db, "users", ("id", "email", "password_hash", "full_name", "email_verified"), users)
+    copy_rows(db, "resumes", ("id", "user_id", "file_path", "content_hash", "raw_text", "parsed_data", "embedding",
+                              "skills"), resumes)
+    copy_rows(db, "user_preferences", ("id", "user_id", "preferred_locations", "min_salary", "remote_preference"),
+              preferences)
+    db.commit()
+    return user_ids, labels
+
+
+def seed_matches(db, args, user_ids: list, user_labels: np.ndarray, job_ids: list, job_labels: np.ndarray) -> None:
+    """Top matches per user from jobs in the user's own cluster, with descending scores"""
+    if db.execute(text("""
+        SELECT count(*) FROM job_matches m JOIN users u ON u.id = m.user_id WHERE u.email LIKE :pattern
+    """), {"pattern": f"%@{BENCH_EMAIL_DOMAIN}"}).scalar() == args.users * args.matches:
+        return
+    rng = stage_rng(args.seed, 3)
+    order = np.argsort(job_labels, kind="stable")
+    bounds = np.searchsorted(job_labels[order], np.arange(job_labels.max() + 2))
+    rows, states = [], []
+    for user_id, label in zip(user_ids, user_labels):
+        members = order[bounds[label]:bounds[label + 1]]
+        if len(members) == 0:
+            members = order
+        picked = rng.choice(members, size=min(args.matches, len(members)), replace=False)
+        scores = np.sort(rng.uniform(0.45, 0.97, size=len(picked)))[::-1]
+        for job_index, score in zip(picked, scores):
+            reasons = {"semantic": round(float(score) + 0.02, 4), "skills": [], "skill_coverage": 0.0,
+                       "location": True, "salary": True}
+            rows.append((uuid.UUID(bytes=rng.bytes(16), version=4), user_id, job_ids[job_index],
+                         f"{score:.4f}", json.dumps(reasons)))
+        states.append((user_id,))
+
+    db.execute(text("""
+        DELETE FROM job_matches WHERE user_id IN (SELECT id FROM users WHERE email LIKE :pattern)
+    """), {"pattern": f"%@{BENCH_EMAIL_DOMAIN}"})
+    copy_rows(db, "job_matches", ("id", "user_id", "job_id", "match_score", "match_reasons"), rows)
+    db.execute(text("""
+        INSERT INTO user_match_state (user_id, resume_id, resume_version)
+        SELECT u.id, r.id, r.created_at FROM users u JOIN resumes r ON r.user_id = u.id
+        WHERE u.email LIKE :pattern
+        ON CONFLICT (user_id) DO UPDATE SET resume_id = excluded.resume_id,
+            resume_version = excluded.resume_version, matched_at = now()
+    """), {"pattern": f"%@{BENCH_EMAIL_DOMAIN}"})
+    db.commit()
+    db.execute(text("ANALYZE job_matches"))
+    db.commit()
+
+
+def seed_interactions(db, args, user_ids: list, job_ids: list) -> None:
+    """Interactions spread over the last 30 days, plus the running counts and list states derived from them"""
+    pattern = {"pattern": f"%@{BENCH_EMAIL_DOMAIN}"}
+    if db.execute(text("""
+        SELECT count(*) FROM user_job_interactions i JOIN users u ON u.id = i.user_id WHERE u.email LIKE :pattern
+    """), pattern).scalar() == args.users * args.interactions:
+        return
+    rng = stage_rng(args.seed, 4)
+    now = np.datetime64("now", "s")
+    rows = []
+    for user_id in user_ids:
+        types = rng.choice(INTERACTION_TYPES, size=args.interactions, p=INTERACTION_WEIGHTS)
+        jobs = rng.integers(0, len(job_ids), size=args.interactions)
+        ages = rng.integers(0, 30 * 86400, size=args.interactions)
+        for interaction_type, job_index, age in zip(types, jobs, ages):
+            rows.append((uuid.UUID(bytes=rng.bytes(16), version=4), user_id, job_ids[job_index], interaction_type,
+                         f"{now - np.timedelta64(int(age), 's')}+00"))
+
+    db.execute(text("""
+        DELETE FROM user_job_interactions WHERE user_id IN (SELECT id FROM users WHERE email LIKE :pattern)
+    """), pattern)
+    db.execute(text("""
+        DELETE FROM user_interaction_counts WHERE user_id IN (SELECT id FROM users WHERE email LIKE :pattern)
+    """), pattern)
+    db.execute(text("""
+        DELETE FROM user_job_lists WHERE user_id IN (SELECT id FROM users WHERE email LIKE :pattern)
+    """), pattern)
+    copy_rows(db, "user_job_interactions", ("id", "user_id", "job_id", "interaction_type", "created_at"), rows)
+    db.execute(text("""
+        INSERT INTO user_interaction_counts (user_id, interaction_type, count)
+        SELECT i.user_id, i.interaction_type, count(*)
+        FROM user_job_interactions i JOIN users u ON u.id = i.user_id
+        WHERE u.email LIKE :pattern
+        GROUP BY i.user_id, i.interaction_type
+    """), pattern)
+    db.execute(text("""
+        INSERT INTO user_job_lists (user_id, list_name, job_id, state, changed_at)
+        SELECT DISTINCT ON (i.user_id, list_name, i.job_id) i.user_id,
+               CASE WHEN i.interaction_type = 'applied' THEN 'applied' ELSE 'saved' END AS list_name,
+               i.job_id, i.interaction_type, i.created_at
+        FROM user_job_interactions i JOIN users u ON u.id = i.user_id
+        WHERE u.email LIKE :pattern AND i.interaction_type IN ('saved', 'unsaved', 'applied')
+        ORDER BY i.user_id, list_name, i.job_id, i.created_at DESC, i.id DESC
+    """), pattern)
+    db.commit()
+    db.execute(text("ANALYZE user_job_interactions"))
+    db.execute(text("ANALYZE user_job_lists"))
+    db.commit()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--jobs", type=int, default=1_000_000)
+    parser.add_argument("--matches", type=int, default=100, help="job matches per user")
+    parser.add_argument("--interactions", type=int, default=50, help="interactions per user")
+    parser.add_argument("--clusters", type=int, default=256, help="embedding topic clusters")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--reset", action="store_true")
+    parser.add_argument("--out", help="results file (default benchmarks/results/seed-<timestamp>.json)")
+    args = parser.parse_args()
+
+    skills = [skill.name for skill in load_taxonomy(BUNDLED_TAXONOMY)]
+    centers = stage_rng(args.seed, 0).normal(size=(args.clusters, settings.EMBEDDING_DIMENSION)).astype(np.float32)
+
+    timings = {}
+    db = SessionLocal()
+    try:
+        if args.reset:
+            reset(db)
+        started = time.perf_counter()
+        job_ids, job_labels = seed_jobs(db, args, skills, centers)
+        timings["jobs_s"] = round(time.perf_counter() - started, 1)
+
+        started = time.perf_counter()
+        user_ids, user_labels = seed_users(db, args, skills, centers)
+        timings["users_s"] = round(time.perf_counter() - started, 1)
+
+        started = time.perf_counter()
+        seed_matches(db, args, user_ids, user_labels, job_ids, job_labels)
+        timings["matches_s"] = round(time.perf_counter() - started, 1)
+
+        started = time.perf_counter()
+        seed_interactions(db, args, user_ids, job_ids)
+        timings["interactions_s"] = round(time.perf_counter() - started, 1)
+    finally:
+        db.close()
+
+    payload = {
+        "dataset": {
+            "users": args.users, "jobs": args.jobs, "matches_per_user": args.matches,
+            "interactions_per_user": args.interactions, "clusters": args.clusters, "seed": args.seed,
+        },
+        "timings": timings,
+    }
+    path = write_results("seed", payload, args.out)
+    print(json.dumps({**payload, "results_file": path}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Keyset cursors of the match feed and the saved/applied lists: round trip and rejection of tampered values."""
+import base64
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+from app.services import job_lists, match_feed
+from app.services.match_feed import InvalidCursorError
+
+
+def b64(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def test_match_feed_cursor_round_trip():
+    match_id = uuid.uuid4()
+    cursor = match_feed.encode_cursor(Decimal("0.8125"), match_id)
+
+    assert "=" not in cursor
+    assert match_feed.decode_cursor(cursor) == (Decimal("0.8125"), match_id)
+
+
+def test_job_list_cursor_round_trip():
+    job_id = uuid.uuid4()
+    changed_at = datetime(2026, 10, 18, 9, 30, 15, 123456, tzinfo=timezone.utc)
+    cursor = job_lists.encode_cursor(changed_at, job_id)
+
+    assert job_lists.decode_cursor(cursor) == (changed_at, job_id)
+
+
+@pytest.mark.parametrize("cursor", [
+    "not a cursor!",
+    match_feed.encode_cursor(Decimal("0.5"), uuid.UUID(int=1))[:-6],
+    b64(b"0.5"),
+    b64(b"0.5|not-a-uuid"),
+    b64(b"high|" + str(uuid.UUID(int=1)).encode()),
+    b64(b"NaN|" + str(uuid.UUID(int=1)).encode()),
+    b64(b"1e999999|" + str(uuid.UUID(int=1)).encode()),
+    b64(b"\xff\xfe|" + str(uuid.UUID(int=1)).encode()),
+])
+def test_match_feed_rejects_tampered_cursors(cursor):
+    with pytest.raises(InvalidCursorError):
+        match_feed.decode_cursor(cursor)
+
+
+@pytest.mark.parametrize("cursor", [
+    "not a cursor!",
+    b64(b"2026-10-18T09:30:15+00:00"),
+    b64(b"yesterday|" + str(uuid.UUID(int=1)).encode()),
+    b64(b"2026-10-18T09:30:15+00:00|" + str(uuid.UUID(int=1)).encode()[:-2]),
+])
+def test_job_list_rejects_tampered_cursors(cursor):
+    with pytest.raises(InvalidCursorError):
+        job_lists.decode_cursor(cursor)
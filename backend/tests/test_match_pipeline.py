@@ -0,0 +1,101 @@
+"""Incremental match refresh against PostgreSQL: merged top-k lists stay full and equal a full recompute."""
+import math
+import uuid
+
+import numpy as np
+import pytest
+
+from app.config import settings
+from app.ml.job_matcher import MatchPreferences
+from app.models.job import Job, JobMatch
+from app.models.resume import Resume
+from app.models.user import User
+from app.services.match_pipeline import _latest_resumes, compute_user_matches, refresh_matches
+
+K = 3
+
+
+def embedding(similarity: float) -> np.ndarray:
+    """A unit vector whose cosine similarity to the resume's is `similarity`"""
+    vector = np.zeros(settings.EMBEDDING_DIMENSION, dtype=np.float32)
+    vector[0] = similarity
+    vector[1] = math.sqrt(1 - similarity ** 2)
+    return vector
+
+
+@pytest.fixture
+def corpus(db):
+    """One user whose resume points along the first axis, and jobs A-E in falling order of similarity"""
+    user = User(email="user@example.com", password_hash="x")
+    db.add(user)
+    db.flush()
+    db.add(Resume(user_id=user.id, file_path="resume.pdf", embedding=embedding(1.0), skills=[]))
+    jobs = {}
+    for name, similarity in zip("ABCDE", (0.9, 0.8, 0.7, 0.6, 0.5)):
+        jobs[name] = Job(
+            external_job_id=f"job-{name}", source="test", title=f"Job {name}", company="Company",
+            description="Description", embedding=embedding(similarity), is_active=True,
+        )
+        db.add(jobs[name])
+    db.commit()
+    return user, jobs
+
+
+def stored_list(db, user):
+    return [
+        job_id for (job_id,) in db.query(JobMatch.job_id).filter(JobMatch.user_id == user.id)
+        .order_by(JobMatch.match_score.desc(), JobMatch.id.desc())
+    ]
+
+
+def recomputed_list(db, user):
+    resume = _latest_resumes(db, None, 1, user_ids=[user.id])[0]
+    return [job_id for job_id, _, _ in compute_user_matches(db, resume, MatchPreferences(), K)]
+
+
+def test_first_refresh_is_full(db, corpus):
+    user, jobs = corpus
+    stats = refresh_matches(db, k=K)
+
+    assert stats["users_full"] == 1
+    assert stored_list(db, user) == [jobs[name].id for name in "ABC"]
+
+
+def test_job_dropping_out_of_a_full_list_is_replaced(db, corpus):
+    user, jobs = corpus
+    refresh_matches(db, k=K)
+
+    # A falls to the bottom; D, which never changed, has to take its place
+    jobs["A"].embedding = embedding(0.1)
+    db.commit()
+    stats = refresh_matches(db, k=K)
+
+    assert stats["users_incremental"] == 1
+    assert stats["jobs_changed"] == 1
+    assert stored_list(db, user) == [jobs[name].id for name in "BCD"]
+    assert stored_list(db, user) == recomputed_list(db, user)
+
+
+def test_changed_jobs_merge_into_a_full_list(db, corpus):
+    user, jobs = corpus
+    refresh_matches(db, k=K)
+
+    # E overtakes everything; B slips but stays within the top k
+    jobs["E"].embedding = embedding(0.95)
+    jobs["B"].embedding = embedding(0.75)
+    db.commit()
+    stats = refresh_matches(db, k=K)
+
+    assert stats["users_incremental"] == 1
+    assert stats["jobs_changed"] == 2
+    assert stored_list(db, user) == [jobs[name].id for name in "EAB"]
+    assert stored_list(db, user) == recomputed_list(db, user)
+
+
+def test_unchanged_jobs_are_not_rescored(db, corpus):
+    user, jobs = corpus
+    refresh_matches(db, k=K)
+    stats = refresh_matches(db, k=K)
+
+    assert stats["jobs_changed"] == 0
+    assert len(stored_list(db, user)) == K
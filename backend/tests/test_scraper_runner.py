@@ -0,0 +1,209 @@
+"""ScraperRunner against a local stub of the Adzuna API: 304 revalidation, 429 retry, empty-page stop and deferred validators."""
+import asyncio
+import contextlib
+import hashlib
+import json
+import socket
+import threading
+import time
+import types
+from collections import Counter
+
+import httpx
+import pytest
+import uvicorn
+from fastapi import FastAPI, Request, Response
+
+from app.config import settings
+from app.scrapers import base
+from app.scrapers.adzuna import AdzunaScraper
+from app.scrapers.base import IngestionSink, ScraperRunner, ValidatorStore
+from app.services import job_ingestion
+
+PAGES = 3
+PER_PAGE = 5
+
+
+class Stub:
+    """Serves PAGES pages of PER_PAGE postings with ETags, then empty pages"""
+
+    def __init__(self):
+        self.requests = Counter()
+        # page -> number of 429s still to send before answering
+        self.throttle = {}
+        self.app = FastAPI()
+        self.app.get("/jobs/{country}/search/{page}")(self.search)
+
+    async def search(self, country: str, page: int, request: Request):
+        self.requests[page] += 1
+        if self.throttle.get(page):
+            self.throttle[page] -= 1
+            return Response(status_code=429, headers={"Retry-After": "0"})
+        results = [
+            {
+                "id": f"{page}-{i}",
+                "title": f"Engineer {page}-{i}",
+                "company": {"display_name": "Company"},
+                "description": f"Posting {page}-{i}",
+                "created": "2026-10-01T08:00:00Z",
+            }
+            for i in range(PER_PAGE)
+        ] if page <= PAGES else []
+        body = json.dumps({"results": results}).encode()
+        etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+        return Response(body, media_type="application/json", headers={"ETag": etag})
+
+
+class CollectingSink:
+    def __init__(self):
+        self.records = []
+
+    async def __call__(self, records, committed) -> None:
+        self.records.extend(records)
+        await committed()
+
+
+class FakeSession:
+    """Just enough of a Session for JobIngester.flush; the upsert itself is patched out"""
+
+    def __init__(self):
+        self.commits = 0
+        self.rollbacks = 0
+
+    def connection(self):
+        # Stands in for both the SQLAlchemy Connection and its DBAPI connection
+        return types.SimpleNamespace(connection=self)
+
+    def cursor(self):
+        return contextlib.nullcontext()
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def close(self):
+        pass
+
+
+@pytest.fixture(scope="module")
+def stub_server():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    stub = Stub()
+    server = uvicorn.Server(uvicorn.Config(stub.app, host="127.0.0.1", port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.01)
+    yield stub, f"http://127.0.0.1:{port}"
+    server.should_exit = True
+    thread.join(timeout=5)
+
+
+@pytest.fixture
+def stub(stub_server):
+    stub, base_url = stub_server
+    stub.requests.clear()
+    stub.throttle.clear()
+    return stub, base_url
+
+
+def make_scraper(base_url: str) -> AdzunaScraper:
+    scraper = AdzunaScraper(base_url=base_url, max_pages=PAGES + 5)
+    scraper.rate_per_second = 1000
+    scraper.burst = 10
+    # One page at a time, so the run stops right at the first empty page
+    scraper.concurrency = 1
+    return scraper
+
+
+async def scrape(base_url: str, validators: ValidatorStore):
+    sink = CollectingSink()
+    async with httpx.AsyncClient() as client:
+        runner = ScraperRunner(sink, client=client, validators=validators)
+        stats = await runner.run(make_scraper(base_url))
+    return stats, sink
+
+
+def test_stops_at_first_empty_page(stub):
+    stub, base_url = stub
+    stats, sink = asyncio.run(scrape(base_url, ValidatorStore()))
+
+    assert stats.postings == len(sink.records) == PAGES * PER_PAGE
+    assert stats.empty == 1
+    assert stats.errors == 0
+    assert sorted(stub.requests) == list(range(1, PAGES + 2))
+
+
+def test_unchanged_pages_are_not_modified(stub):
+    stub, base_url = stub
+    validators = ValidatorStore()
+    asyncio.run(scrape(base_url, validators))
+    stats, sink = asyncio.run(scrape(base_url, validators))
+
+    assert stats.not_modified == PAGES
+    assert stats.postings == 0
+    assert sink.records == []
+
+
+def test_retries_after_429(stub):
+    stub, base_url = stub
+    stub.throttle[2] = 1
+    stats, sink = asyncio.run(scrape(base_url, ValidatorStore()))
+
+    assert stub.requests[2] == 2
+    assert stats.errors == 0
+    assert stats.postings == PAGES * PER_PAGE
+
+
+def test_page_key_covers_content_params_but_not_credentials(monkeypatch):
+    monkeypatch.setattr(settings, "ADZUNA_APP_ID", "app-id")
+    monkeypatch.setattr(settings, "ADZUNA_APP_KEY", "app-key")
+    scraper = AdzunaScraper(base_url="http://stub", query="python")
+    key = scraper.page(1).key
+
+    monkeypatch.setattr(settings, "ADZUNA_RESULTS_PER_PAGE", settings.ADZUNA_RESULTS_PER_PAGE + 10)
+    assert scraper.page(1).key != key
+    assert scraper.page(2).key != scraper.page(1).key
+    assert "app-id" not in key and "app-key" not in key
+
+
+def test_validators_wait_for_their_batch_to_commit(stub, monkeypatch):
+    stub, base_url = stub
+    session = FakeSession()
+    monkeypatch.setattr(base, "SessionLocal", lambda: session)
+    monkeypatch.setattr(settings, "JOB_DEDUP_ENABLED", False)
+    upserts = []
+
+    def execute_values(cursor, sql, rows, **kwargs):
+        upserts.append(len(rows))
+        if len(upserts) == 1:
+            raise RuntimeError("connection lost")
+        return []
+
+    monkeypatch.setattr(job_ingestion, "execute_values", execute_values)
+
+    async def run(validators):
+        # The first batch holds all of page 1 and part of page 2 and fails; the rest commits on close
+        sink = IngestionSink(batch_size=PER_PAGE + 3)
+        async with httpx.AsyncClient() as client:
+            runner = ScraperRunner(sink, client=client, validators=validators)
+            await runner.run(make_scraper(base_url))
+        return await sink.close()
+
+    validators = ValidatorStore()
+    ingest_stats = asyncio.run(run(validators))
+
+    assert upserts == [PER_PAGE + 3, PAGES * PER_PAGE - PER_PAGE - 3]
+    assert ingest_stats["failed"] == PER_PAGE + 3
+    assert ingest_stats["pages_failed"] == 2
+    # Pages 1 and 2 lost rows and must be fetched in full next run; page 3 committed on close
+    scraper = make_scraper(base_url)
+    stored = {page for page in range(1, PAGES + 2)
+              if asyncio.run(validators.get(f"{scraper.source}:{scraper.page(page).key or scraper.page(page).url}"))}
+    assert stored == {PAGES}
@@ -0,0 +1,41 @@
+"""A saved and memory-mapped skill automaton behaves exactly like a freshly compiled one."""
+import numpy as np
+import pytest
+
+from app.ml.skill_extractor import BUNDLED_TAXONOMY, SkillAutomaton, compile_automaton, load_or_compile, load_taxonomy
+
+SAMPLE = """
+Senior backend engineer. We run Python and Go services on Kubernetes with PostgreSQL
+and Redis; experience with scikit learn, machine-learning pipelines, React or
+TypeScript front ends and CI/CD on AWS is a plus.
+"""
+
+
+@pytest.fixture(scope="module")
+def compiled():
+    return compile_automaton(load_taxonomy(BUNDLED_TAXONOMY))
+
+
+def test_mmap_load_matches_compiled(compiled, tmp_path):
+    compiled.save(str(tmp_path / "skills"))
+    loaded = SkillAutomaton.load(str(tmp_path / "skills"), mmap=True)
+
+    assert isinstance(loaded._arrays["fail"], np.memmap)
+    assert loaded.skill_ids == compiled.skill_ids
+    assert loaded.names == compiled.names
+    assert loaded.vocabulary == compiled.vocabulary
+    for name, array in compiled._arrays.items():
+        assert np.array_equal(loaded._arrays[name], array), name
+
+    assert compiled.extract(SAMPLE)
+    assert loaded.extract(SAMPLE) == compiled.extract(SAMPLE)
+    assert loaded.extract_names(SAMPLE) == compiled.extract_names(SAMPLE)
+    assert list(loaded.matches(SAMPLE)) == list(compiled.matches(SAMPLE))
+
+
+def test_load_or_compile_reuses_cache(compiled, tmp_path):
+    first = load_or_compile(BUNDLED_TAXONOMY, str(tmp_path))
+    cached = load_or_compile(BUNDLED_TAXONOMY, str(tmp_path))
+
+    assert isinstance(cached._arrays["fail"], np.memmap)
+    assert first.extract(SAMPLE) == cached.extract(SAMPLE) == compiled.extract(SAMPLE)
@@ -96,6 +96,12 @@ export interface JobMatch {
 	match_reasons: string[];
 }
 
+export interface CursorPage<T> {
+	items: T[];
+	// Pass back as `cursor` for the next page; null on the last page
+	next_cursor: string | null;
+}
+
 export interface UserStats {
 	total_resumes: number;
 	total_matches: number;
@@ -6,6 +6,7 @@ import type {
 	Resume,
 	Job,
 	JobMatch,
+	CursorPage,
 	UserStats,
 	UserInteraction,
 	ApiError
@@ -44,6 +45,23 @@ class ApiClient {
 		endpoint: string,
 		options: RequestInit = {}
 	): Promise<T> {
+		const response = await this.send(endpoint, options);
+		return response.json();
+	}
+
+	// Keyset-paginated endpoints return the next page's cursor in X-Next-Cursor
+	private async requestPage<T>(endpoint: string): Promise<CursorPage<T>> {
+		const response = await this.send(endpoint);
+		return {
+			items: await response.json(),
+			next_cursor: response.headers.get('X-Next-Cursor'),
+		};
+	}
+
+	private async send(
+		endpoint: string,
+		options: RequestInit = {}
+	): Promise<Response> {
 		const headers: HeadersInit = {
 			'Content-Type': 'application/json',
 			...options.headers,
@@ -66,7 +84,7 @@ class ApiClient {
 			throw error;
 		}
 
-		return response.json();
+		return response;
 	}
 
 	// Auth endpoints
@@ -127,7 +145,7 @@ class ApiClient {
 			throw error;
 		}
 
-		return response.json();
+		return response;
 	}
 
 	async getResumes(): Promise<Resume[]> {
@@ -153,25 +171,19 @@ class ApiClient {
 
 	// Job endpoints
 	async getJobs(params?: {
-		skip?: number;
+		cursor?: string;
 		limit?: number;
-		location?: string;
-		remote_type?: string;
-		employment_type?: string;
-		min_salary?: number;
-		sort_by?: string;
-	}): Promise<JobMatch[]> {
+	}): Promise<CursorPage<JobMatch>> {
 		const queryParams = new URLSearchParams();
-		if (params) {
-			Object.entries(params).forEach(([key, value]) => {
-				if (value !== undefined) {
-					queryParams.append(key, value.toString());
-				}
-			});
+		if (params?.cursor) {
+			queryParams.append('cursor', params.cursor);
+		}
+		if (params?.limit !== undefined) {
+			queryParams.append('limit', params.limit.toString());
 		}
 		const queryString = queryParams.toString();
 		const endpoint = queryString ? `/api/jobs/?${queryString}` : '/api/jobs/';
-		return this.request<JobMatch[]>(endpoint);
+		return this.requestPage<JobMatch>(endpoint);
 	}
 
 	async getJob(id: string): Promise<Job> {